@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the upload pipeline.
+
+    python benchmark.py fixtures              generate the synthetic media (needs ffmpeg)
+    python benchmark.py record                run every fixture live once, recording all HTTP traffic
+    python benchmark.py run [--runs 3]        replay the recordings and time each stage
+    python benchmark.py compare               compare the latest results against an earlier version
+
+Every run is done with --debug, so nothing is ever uploaded to a tracker or added to a client.
+Recordings (data/benchmarks/cassettes) hold real API responses, keep them to yourself.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+base_dir = os.path.abspath(os.path.dirname(__file__))
+bench_dir = os.path.join(base_dir, "data", "benchmarks")
+fixtures_dir = os.path.join(bench_dir, "fixtures")
+cassettes_dir = os.path.join(bench_dir, "cassettes")
+results_file = os.path.join(bench_dir, "results.jsonl")
+
+stages = ['gather_prep', 'process_all_trackers', 'screenshots', 'upload_screens', 'create_torrent', 'gen_desc', 'process_trackers']
+
+# name: (kind, seconds per file, episodes)
+fixtures = {
+    'movie': ('Big.Buck.Bunny.2008.1080p.BluRay.x264-BENCH.mkv', 60, 0),
+    'pack': ('Pioneer.One.S01.720p.WEB-DL.AAC2.0.H.264-BENCH', 20, 3),
+}
+
+
+def ffmpeg_clip(output, seconds, size):
+    subprocess.run([
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', f"testsrc2=size={size}:rate=24000/1001",
+        '-f', 'lavfi', '-i', "sine=frequency=440:sample_rate=48000",
+        '-t', str(seconds),
+        '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '30', '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac', '-b:a', '128k', '-ac', '2',
+        '-metadata:s:a:0', 'language=eng',
+        output
+    ], check=True)
+
+
+def make_fixtures(regenerate=False):
+    """Synthetic test pattern releases, a single movie file and a small season pack."""
+    os.makedirs(fixtures_dir, exist_ok=True)
+    paths = {}
+    for name, (release, seconds, episodes) in fixtures.items():
+        path = os.path.join(fixtures_dir, release)
+        paths[name] = path
+        if os.path.exists(path) and not regenerate:
+            continue
+        print(f"Generating {release}")
+        if episodes:
+            os.makedirs(path, exist_ok=True)
+            for episode in range(1, episodes + 1):
+                episode_name = release.replace('.S01.', f".S01E{episode:02d}.") + '.mkv'
+                ffmpeg_clip(os.path.join(path, episode_name), seconds, '1280x720')
+        else:
+            ffmpeg_clip(path, seconds, '1920x1080')
+    return paths
+
+
+def get_version():
+    with open(os.path.join(base_dir, 'data', 'version.py'), 'r', encoding='utf-8') as f:
+        match = re.search(r'__version__\s*=\s*"([^"]+)"', f.read())
+    return match.group(1) if match else "unknown"
+
+
+def get_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=base_dir, capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def use_cache_dir(cache_dir):
+    """Point every persistent cache at cache_dir, so cold runs start empty."""
+    from src import imagecache, mediainfocache, metacache, piececache
+    for module in (imagecache, mediainfocache, metacache, piececache):
+        module.cache_dir = cache_dir
+        module._cache = None
+
+
+async def run_pipeline(path, mode, cassette_path, cache_dir):
+    """One pass over a release, the same stages upload.py runs, returns {stage: seconds}."""
+    from src.httpreplay import use_cassette
+    cassette = use_cassette(cassette_path, mode)
+    use_cache_dir(cache_dir)
+
+    from data.config import config
+    from src.args import Args
+    from src.clients import Clients
+    from src.get_desc import gen_desc
+    from src.get_name import get_name
+    from src.httpsessions import close_sessions
+    from src.prep import Prep
+    from src.takescreens import screenshots
+    from src.torrentcreate import create_torrent
+    from src.trackerhandle import process_trackers
+    from src.trackersetup import tracker_class_map, api_trackers, other_api_trackers, http_trackers
+    from src.trackerstatus import process_all_trackers
+    from src.console import console
+    from src.uploadscreens import upload_screens
+
+    timings = {}
+
+    async def timed(stage, coro):
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[stage] = time.perf_counter() - start
+
+    meta = {'base_dir': base_dir}
+    meta, _, _ = Args(config).parse((path, '--unattended', '--debug', '--no-seed'), meta)
+    meta['path'] = path
+    meta['uuid'] = None
+    meta['base_dir'] = base_dir
+    meta['mkbrr'] = False
+    meta['imghost'] = meta.get('imghost') or config['DEFAULT']['img_host_1']
+
+    try:
+        prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
+        meta = await timed('gather_prep', prep.gather_prep(meta=meta, mode='cli'))
+        meta['name_notag'], meta['name'], meta['clean_name'], meta['potential_missing'] = await get_name(meta)
+        trackers = meta.get('trackers') or config['TRACKERS'].get('default_trackers', '').split(',')
+        if isinstance(trackers, str):
+            trackers = trackers.split(',')
+        meta['trackers'] = [tracker.strip().upper() for tracker in trackers if tracker.strip()]
+
+        await timed('process_all_trackers', process_all_trackers(meta))
+        meta['we_are_uploading'] = True
+
+        if not meta.get('is_disc'):
+            videopath = meta['filelist'][0] if meta.get('filelist') else None
+            await timed('screenshots', screenshots(videopath, meta.get('title'), meta['uuid'], base_dir, meta, manual_frames={}))
+            meta.setdefault('image_list', [])
+            if len(meta['image_list']) < meta.get('cutoff', 0) and not meta.get('skip_imghost_upload'):
+                await timed('upload_screens', upload_screens(meta, meta['screens'], 1, 0, meta['screens'], [], return_dict={}))
+
+        await timed('create_torrent', asyncio.to_thread(create_torrent, meta, Path(meta['path']), "BASE"))
+        meta = await timed('gen_desc', gen_desc(meta))
+        await timed('process_trackers', process_trackers(
+            meta, config, Clients(config=config), console, api_trackers, tracker_class_map, http_trackers, other_api_trackers
+        ))
+    finally:
+        await close_sessions()
+        cassette.save()
+
+    return timings, cassette.misses
+
+
+def run_once(args):
+    """Child process entry, so every run starts without in-memory state."""
+    if args.cold:
+        shutil.rmtree(os.path.join(base_dir, "tmp", os.path.basename(args.path)), ignore_errors=True)
+    start = time.perf_counter()
+    timings, misses = asyncio.run(run_pipeline(args.path, args.mode, args.cassette, args.cache_dir))
+    timings['total'] = time.perf_counter() - start
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump({'timings': timings, 'misses': misses}, f)
+
+
+def spawn_run(path, mode, cassette, cache_dir, cold):
+    with tempfile.TemporaryDirectory() as scratch:
+        out = os.path.join(scratch, "result.json")
+        command = [sys.executable, __file__, '_once', path, '--mode', mode, '--cassette', cassette, '--cache-dir', cache_dir, '--out', out]
+        if cold:
+            command.append('--cold')
+        subprocess.run(command, cwd=base_dir, check=True)
+        with open(out, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+def selected_fixtures(args):
+    paths = make_fixtures()
+    if args.path:
+        return {os.path.basename(os.path.normpath(args.path)): os.path.abspath(args.path)}
+    if args.fixture:
+        return {args.fixture: paths[args.fixture]}
+    return paths
+
+
+def record(args):
+    for name, path in selected_fixtures(args).items():
+        cassette = os.path.join(cassettes_dir, f"{name}.json")
+        with tempfile.TemporaryDirectory() as cache_dir:
+            result = spawn_run(path, 'record', cassette, cache_dir, cold=True)
+        print(f"Recorded {name} to {cassette} ({result['timings']['total']:.1f}s live)")
+
+
+def run(args):
+    from rich.table import Table
+    from src.console import console
+
+    version, commit = get_version(), get_commit()
+    for name, path in selected_fixtures(args).items():
+        cassette = os.path.join(cassettes_dir, f"{name}.json")
+        if not os.path.exists(cassette):
+            console.print(f"[red]No recording for {name}, run `python benchmark.py record` first")
+            continue
+
+        runs = []
+        misses = set()
+        with tempfile.TemporaryDirectory() as warm_cache:
+            for i in range(args.runs):
+                if args.warm:
+                    # First pass fills the caches and tmp folder, only later passes are measured
+                    if i == 0:
+                        spawn_run(path, 'replay', cassette, warm_cache, cold=True)
+                    result = spawn_run(path, 'replay', cassette, warm_cache, cold=False)
+                else:
+                    with tempfile.TemporaryDirectory() as cold_cache:
+                        result = spawn_run(path, 'replay', cassette, cold_cache, cold=True)
+                runs.append(result['timings'])
+                misses.update(result['misses'])
+
+        summary = {stage: statistics.median(r[stage] for r in runs if stage in r) for stage in stages + ['total'] if any(stage in r for r in runs)}
+        entry = {
+            'fixture': name,
+            'version': version,
+            'commit': commit,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'warm': args.warm,
+            'runs': args.runs,
+            'stages': summary,
+            'misses': sorted(misses),
+        }
+        os.makedirs(bench_dir, exist_ok=True)
+        with open(results_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+
+        table = Table(title=f"{name} ({'warm' if args.warm else 'cold'}, median of {args.runs}, {version} {commit or ''})")
+        table.add_column("Stage")
+        table.add_column("Seconds", justify="right")
+        for stage, seconds in summary.items():
+            table.add_row(stage, f"{seconds:.2f}")
+        console.print(table)
+        if misses:
+            console.print(f"[yellow]{len(misses)} requests had no recording, record again if the code now calls new endpoints")
+
+
+def load_results():
+    if not os.path.exists(results_file):
+        return []
+    with open(results_file, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(args):
+    """Latest result per fixture against the latest result of the baseline version (default: the previous one)."""
+    from rich.table import Table
+    from src.console import console
+
+    results = load_results()
+    regressions = 0
+    for fixture in sorted({r['fixture'] for r in results}):
+        history = [r for r in results if r['fixture'] == fixture and r['warm'] == args.warm]
+        if not history:
+            continue
+        latest = history[-1]
+        if args.baseline:
+            older = [r for r in history[:-1] if args.baseline in (r['version'], r['commit'])]
+        else:
+            older = [r for r in history[:-1] if (r['version'], r['commit']) != (latest['version'], latest['commit'])]
+        if not older:
+            console.print(f"[yellow]{fixture}: nothing to compare against yet")
+            continue
+        baseline = older[-1]
+
+        table = Table(title=f"{fixture}: {baseline['version']} {baseline['commit'] or ''} -> {latest['version']} {latest['commit'] or ''}")
+        for column in ("Stage", "Before", "After", "Change"):
+            table.add_column(column, justify="left" if column == "Stage" else "right")
+        for stage, after in latest['stages'].items():
+            before = baseline['stages'].get(stage)
+            if before is None:
+                table.add_row(stage, "-", f"{after:.2f}s", "new")
+                continue
+            change = (after - before) / before * 100 if before else 0
+            regressed = change > args.threshold and after - before > args.min_seconds
+            regressions += regressed
+            style = "red" if regressed else "green" if change < -args.threshold else ""
+            table.add_row(stage, f"{before:.2f}s", f"{after:.2f}s", f"[{style}]{change:+.1f}%[/{style}]" if style else f"{change:+.1f}%")
+        console.print(table)
+
+    if regressions:
+        console.print(f"[red]{regressions} stage(s) slower than {args.threshold}% and {args.min_seconds}s")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark of the upload pipeline")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    fixture_args = argparse.ArgumentParser(add_help=False)
+    fixture_args.add_argument('--fixture', choices=sorted(fixtures), help="Only this synthetic fixture")
+    fixture_args.add_argument('--path', help="Benchmark this file or folder instead of the synthetic fixtures")
+
+    generate = commands.add_parser('fixtures', help="Generate the synthetic media")
+    generate.add_argument('--regenerate', action='store_true')
+    commands.add_parser('record', parents=[fixture_args], help="Run live once and record all HTTP traffic")
+    replay = commands.add_parser('run', parents=[fixture_args], help="Replay recordings and time every stage")
+    replay.add_argument('--runs', type=int, default=3)
+    replay.add_argument('--warm', action='store_true', help="Keep caches and tmp files between runs")
+    check = commands.add_parser('compare', help="Compare the latest results with an earlier version")
+    check.add_argument('--baseline', help="Version or commit to compare against (default: the previous one)")
+    check.add_argument('--threshold', type=float, default=20, help="Percent slower that counts as a regression")
+    check.add_argument('--min-seconds', type=float, default=0.5, help="Ignore changes smaller than this")
+    check.add_argument('--warm', action='store_true')
+
+    once = commands.add_parser('_once')
+    once.add_argument('path')
+    once.add_argument('--mode', choices=['record', 'replay'])
+    once.add_argument('--cassette')
+    once.add_argument('--cache-dir')
+    once.add_argument('--out')
+    once.add_argument('--cold', action='store_true')
+
+    args = parser.parse_args()
+    if args.command == 'fixtures':
+        make_fixtures(args.regenerate)
+    elif args.command == 'record':
+        record(args)
+    elif args.command == 'run':
+        run(args)
+    elif args.command == 'compare':
+        compare(args)
+    else:
+        run_once(args)
+
+
+if __name__ == "__main__":
+    main()
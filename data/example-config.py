@@ -56,6 +56,13 @@ config = {
         # Number of screenshots to capture
         "screens": "4",
 
+        # Pick screenshot frames from one keyframe scan of the video, skipping black, blank and low detail frames
+        # before anything is rendered. Set False to use evenly spaced frames instead.
+        "frame_analysis": True,
+
+        # Give up on the keyframe scan after this many seconds and use evenly spaced frames
+        "frame_analysis_timeout": "120",
+
         # Number of cutoff screenshots
         # If there are at least this many screenshots already, perhaps pulled from existing
         # description, skip creating and uploading any further screenshots.
@@ -102,6 +109,24 @@ config = {
         # Set true to limit the amount of CPU when running ffmpeg.
         "ffmpeg_limit": False,
 
+        # Number of screenshots uploaded at the same time to each image host
+        # (ptscreens and lensdump always use 1, onlyimage and passtheimage 6)
+        "image_upload_limit": "6",
+
+        # Remember which image host URLs belong to which screenshot (by file hash) in data/cache,
+        # so identical images are never uploaded to the same host twice, eg when uploading to more trackers later.
+        "image_url_cache": True,
+
+        # Check that cached image URLs still exist before reusing them once they are older than this many days
+        "image_url_verify_days": "7",
+
+        # Keep MediaInfo reports in data/cache, keyed by file path, size and modification time,
+        # so preparing an unchanged file again doesn't run MediaInfo
+        "mediainfo_cache": True,
+
+        # Maximum size of the MediaInfo cache in MiB, least recently used reports are dropped first
+        "mediainfo_cache_size": "50",
+
         # Number of screenshots to use for each (ALL) disc/episode when uploading packs to supported sites.
         # 0 equals old behavior where only the original description and images are added.
         # This setting also affects PTP, however PTP requries at least 2 images for each.
@@ -129,6 +154,10 @@ config = {
         # You might not want to process screens/mediainfo for 40 episodes in a season pack.
         "processLimit": "10",
 
+        # Pack screenshots are taken once per release and shared by every tracker.
+        # How many of those image uploads (and MediaInfo reads) run at the same time.
+        "pack_asset_workers": "2",
+
         # Providing the option to add a description header, in bbcode, at the top of the description section
         # where supported
         "custom_description_header": "",
@@ -139,6 +168,40 @@ config = {
         # Enable lossless PNG Compression (True/False)
         "optimize_images": True,
 
+        # How many trackers to upload to at the same time.
+        # Trackers that may ask questions during upload are still prompted one at a time.
+        # Add "upload_delay" (seconds) to a tracker's config to space out uploads to that tracker.
+        "tracker_upload_limit": "4",
+
+        # Process queues in overlapping stages (unattended only), same as passing --pipeline.
+        # While one item is uploading to trackers, the next items are already prepped and hashed.
+        "pipeline_queue": False,
+        # Number of items prepped (mediainfo, metadata, screenshots) at the same time when pipelining
+        "pipeline_prep_workers": "1",
+        # Number of items hashed at the same time when pipelining (CPU/disk bound)
+        "pipeline_hash_workers": "1",
+        # Number of items uploaded to trackers at the same time when pipelining (network bound)
+        "pipeline_upload_workers": "1",
+
+        # Address of the local job API started with --daemon, used by --submit.
+        # Keep the host on 127.0.0.1 unless you set a token, anyone who can reach it can upload as you.
+        "daemon_host": "127.0.0.1",
+        "daemon_port": "8765",
+        # Optional shared secret, sent by --submit as "Authorization: Bearer <token>"
+        "daemon_token": "",
+        # Minutes a successful tracker login/cookie check is trusted by the following daemon or watch jobs.
+        # A failed check forgets it right away, 0 checks the credentials for every job.
+        "daemon_credential_minutes": "10",
+
+        # Folders watched by --watch. Every new file or folder in them is uploaded once it stops changing.
+        "watch_folders": [],
+        # Seconds a release must keep the same size and modification time before it is uploaded
+        "watch_stable_seconds": "60",
+        # Seconds between scans of the watch folders (new entries are picked up at once when inotify_simple is installed)
+        "watch_poll_interval": "30",
+        # Most releases waiting to be uploaded at once, the rest wait in the watch folders
+        "watch_backlog": "50",
+
         # Which client are you using.
         "default_torrent_client": "qbittorrent",
 
@@ -153,6 +216,11 @@ config = {
         # Set to true to always just use the largest playlist on a blu-ray, without selection prompt.
         "use_largest_playlist": False,
 
+        # Number of BDInfo playlist scans to run at the same time, and how many of them may read from the same drive.
+        # Raise bdinfo_workers_per_device for SSDs/NVMe, keep it at 1 for spinning disks.
+        "bdinfo_workers": "2",
+        "bdinfo_workers_per_device": "1",
+
         # Set False to skip getting images from tracker descriptions
         "keep_images": True,
 
@@ -226,6 +294,20 @@ config = {
         # If there is only a single release on bluray.com, you may wish to relax the score a little
         "bluray_single_score": 89.5,
 
+        # Cache TMDb/IMDb/TVDb/TVmaze lookups in data/cache so every episode of a show
+        # doesn't repeat the same requests. Set False to always query the APIs.
+        "metadata_cache": True,
+
+        # Maximum size of the metadata cache in MB, least recently used entries are removed first
+        "metadata_cache_size": "200",
+
+        # Remember piece hashes of hashed files in data/cache, so re-creating a torrent for unchanged
+        # files (re-runs, --keep-folder, a changed file in a season pack) only hashes new data.
+        "piece_hash_cache": True,
+
+        # Maximum size of the piece hash cache in MB (about 20 bytes per piece)
+        "piece_hash_cache_size": "100",
+
         # NOT RECOMMENDED UNLESS YOU KNOW WHAT YOU ARE DOING
         # set true to not delete existing meta.json file before running
         "keep_meta": False,
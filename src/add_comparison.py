@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import json
@@ -8,34 +9,45 @@ from data.config import config
 from src.console import console
 
 
+def add_group_images(meta, comparison_groups, comparison_index):
+    if comparison_index and comparison_index in comparison_groups:
+        if 'image_list' not in meta:
+            meta['image_list'] = []
+
+        urls_to_add = comparison_groups[comparison_index].get('urls', [])
+        if meta.get('debug'):
+            console.print(f"[cyan]Adding {len(urls_to_add)} images from comparison group {comparison_index} to image_list")
+
+        for url_info in urls_to_add:
+            if url_info not in meta['image_list']:
+                meta['image_list'].append(url_info)
+
+
+def save_comparison_data(meta, comparison_data_file, comparisons):
+    """Write the groups in comparison order, called after every group so an interrupted run resumes where it stopped."""
+    ordered = {second: comparisons[second] for second in sorted(comparisons, key=lambda x: int(x))}
+    try:
+        with open(comparison_data_file, 'w') as f:
+            json.dump(ordered, f, indent=4)
+        if meta.get('debug'):
+            console.print(f"[cyan]Saved comparison data to {comparison_data_file}")
+    except Exception as e:
+        console.print(f"[yellow]Failed to save comparison data: {e}")
+
+
 async def add_comparison(meta):
     comparison_path = meta.get('comparison')
     if not comparison_path or not os.path.isdir(comparison_path):
         return []
 
     comparison_data_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/comparison_data.json"
+    saved_comparison_data = {}
     if os.path.exists(comparison_data_file):
         try:
             with open(comparison_data_file, 'r') as f:
                 saved_comparison_data = json.load(f)
-                if meta.get('debug'):
-                    console.print(f"[cyan]Loading previously saved comparison data from {comparison_data_file}")
-                meta["comparison_groups"] = saved_comparison_data
-
-                comparison_index = meta.get('comparison_index')
-                if comparison_index and comparison_index in saved_comparison_data:
-                    if 'image_list' not in meta:
-                        meta['image_list'] = []
-
-                    urls_to_add = saved_comparison_data[comparison_index].get('urls', [])
-                    if meta.get('debug'):
-                        console.print(f"[cyan]Adding {len(urls_to_add)} images from comparison group {comparison_index} to image_list")
-
-                    for url_info in urls_to_add:
-                        if url_info not in meta['image_list']:
-                            meta['image_list'].append(url_info)
-
-                return saved_comparison_data
+            if meta.get('debug'):
+                console.print(f"[cyan]Loading previously saved comparison data from {comparison_data_file}")
         except Exception as e:
             console.print(f"[yellow]Error loading saved comparison data: {e}")
 
@@ -54,41 +66,59 @@ async def add_comparison(meta):
                 suffixes[second] = suffix
 
     meta_comparisons = {}
-    img_host_keys = [k for k in config.get('DEFAULT', {}) if k.startswith('img_host_')]
-    img_host_indices = [int(k.split('_')[-1]) for k in img_host_keys]
-    img_host_indices.sort()
-
-    if not img_host_indices:
-        raise ValueError("No image hosts found in config. Please ensure at least one 'img_host_X' key is present in config.")
+    pending = []
+    for second in sorted(groups, key=lambda x: int(x)):
+        group_files = [f for _, f in sorted(groups[second], key=lambda x: x[0])]
+        saved = saved_comparison_data.get(second)
+        # Groups uploaded completely by an earlier run are kept, partial ones are uploaded again
+        if saved and saved.get('files') == group_files and len(saved.get('urls', [])) == len(group_files):
+            meta_comparisons[second] = saved
+        else:
+            pending.append((second, group_files))
+
+    if pending:
+        img_host_keys = [k for k in config.get('DEFAULT', {}) if k.startswith('img_host_')]
+        img_host_indices = [int(k.split('_')[-1]) for k in img_host_keys]
+        img_host_indices.sort()
+
+        if not img_host_indices:
+            raise ValueError("No image hosts found in config. Please ensure at least one 'img_host_X' key is present in config.")
 
-    for idx, second in enumerate(sorted(groups, key=lambda x: int(x)), 1):
         img_host_num = img_host_indices[0]
-        current_img_host_key = f'img_host_{img_host_num}'
-        current_img_host = config.get('DEFAULT', {}).get(current_img_host_key)
-
-        group = sorted(groups[second], key=lambda x: x[0])
-        group_files = [f for _, f in group]
-        custom_img_list = [os.path.join(comparison_path, filename) for filename in group_files]
+        current_img_host = config.get('DEFAULT', {}).get(f'img_host_{img_host_num}')
         upload_meta = meta.copy()
-        console.print(f"[cyan]Uploading comparison group {second} with files: {group_files}")
-
-        upload_result, _ = await upload_screens(
-            upload_meta, custom_img_list, img_host_num, 0, len(custom_img_list), custom_img_list, {}
-        )
-
-        uploaded_infos = [
-            {k: item.get(k) for k in ("img_url", "raw_url", "web_url")}
-            for item in upload_result
-        ]
-
-        group_name = suffixes.get(second, "")
 
-        meta_comparisons[second] = {
-            "files": group_files,
-            "urls": uploaded_infos,
-            "img_host": current_img_host,
-            "name": group_name
-        }
+        async def upload_group(second, group_files):
+            custom_img_list = [os.path.join(comparison_path, filename) for filename in group_files]
+            console.print(f"[cyan]Uploading comparison group {second} with files: {group_files}")
+
+            # Every group uploads at once, the image host's upload limit bounds the requests across all of them
+            upload_result, _ = await upload_screens(
+                upload_meta, custom_img_list, img_host_num, 0, len(custom_img_list), custom_img_list, {}
+            )
+
+            uploaded_infos = [
+                {k: item.get(k) for k in ("img_url", "raw_url", "web_url")}
+                for item in upload_result
+            ]
+            if len(uploaded_infos) < len(group_files):
+                console.print(f"[yellow]Comparison group {second}: {len(uploaded_infos)} of {len(group_files)} images uploaded")
+
+            meta_comparisons[second] = {
+                "files": group_files,
+                "urls": uploaded_infos,
+                "img_host": current_img_host,
+                "name": suffixes.get(second, "")
+            }
+            save_comparison_data(meta, comparison_data_file, meta_comparisons)
+
+        await asyncio.gather(*[upload_group(second, group_files) for second, group_files in pending])
+        meta_comparisons = {second: meta_comparisons[second] for second in sorted(meta_comparisons, key=lambda x: int(x))}
+    elif saved_comparison_data:
+        # Everything was uploaded by an earlier run
+        meta["comparison_groups"] = saved_comparison_data
+        add_group_images(meta, saved_comparison_data, meta.get('comparison_index'))
+        return saved_comparison_data
 
     comparison_index = meta.get('comparison_index')
     if not comparison_index:
@@ -100,26 +130,8 @@ async def add_comparison(meta):
                 break
             except Exception:
                 console.print(f"[red]Invalid comparison index: {cli_input.strip()}")
-    if comparison_index and comparison_index in meta_comparisons:
-        if 'image_list' not in meta:
-            meta['image_list'] = []
-
-        urls_to_add = meta_comparisons[comparison_index].get('urls', [])
-        if meta.get('debug'):
-            console.print(f"[cyan]Adding {len(urls_to_add)} images from comparison group {comparison_index} to image_list")
-
-        for url_info in urls_to_add:
-            if url_info not in meta['image_list']:
-                meta['image_list'].append(url_info)
+    add_group_images(meta, meta_comparisons, comparison_index)
 
     meta["comparison_groups"] = meta_comparisons
 
-    try:
-        with open(comparison_data_file, 'w') as f:
-            json.dump(meta_comparisons, f, indent=4)
-        if meta.get('debug'):
-            console.print(f"[cyan]Saved comparison data to {comparison_data_file}")
-    except Exception as e:
-        console.print(f"[yellow]Failed to save comparison data: {e}")
-
     return meta_comparisons
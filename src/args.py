@@ -148,6 +148,7 @@ class Args():
         parser.add_argument('-sdc', '--skip-dupe-check', action='store_true', required=False, help="Pass if you know this is a dupe (Skips dupe check)", dest="dupe")
         parser.add_argument('-debug', '--debug', action='store_true', required=False, help="Debug Mode, will run through all the motions providing extra info, but will not upload to trackers.")
         parser.add_argument('-ffdebug', '--ffdebug', action='store_true', required=False, help="Will show info from ffmpeg while taking screenshots.")
+        parser.add_argument('-profile', '--profile', action='store_true', required=False, help="Time every stage and outbound request, prints a summary and writes tmp/{uuid}/trace.json (Chrome trace format)")
         parser.add_argument('-mps', '--max-piece-size', nargs=1, required=False, help="Set max piece size allowed in MiB for default torrent creation (default 128 MiB)", choices=['2', '4', '8', '16', '32', '64', '128'])
         parser.add_argument('-nh', '--nohash', action='store_true', required=False, help="Don't hash .torrent")
         parser.add_argument('-rh', '--rehash', action='store_true', required=False, help="DO hash .torrent")
@@ -167,6 +168,11 @@ class Args():
         parser.add_argument('-vs', '--vapoursynth', action='store_true', required=False, help="Use vapoursynth for screens (requires vs install)")
         parser.add_argument('-dm', '--delete-meta', action='store_true', required=False, dest='delete_meta', help="Delete only meta.json from tmp directory")
         parser.add_argument('-dtmp', '--delete-tmp', action='store_true', required=False, dest='delete_tmp', help="Delete tmp directory for the working file/folder")
+        parser.add_argument('-daemon', '--daemon', action='store_true', required=False, help="Stay running and process jobs submitted with --submit (or POSTed to the daemon's /jobs endpoint), keeping sessions and caches warm between jobs")
+        parser.add_argument('-watch', '--watch', action='store_true', required=False, help="Stay running and upload every new release that appears in the watch_folders from your config, with the other options given")
+        parser.add_argument('-submit', '--submit', action='store_true', required=False, help="Hand this command line to the running daemon instead of processing it here")
+        parser.add_argument('-wait', '--wait', action='store_true', required=False, help="With --submit, wait until the daemon has finished the job")
+        parser.add_argument('-pipe', '--pipeline', action='store_true', required=False, help="Pipeline queue processing, prep and hash the next items while uploading the current one (unattended only)")
         parser.add_argument('-cleanup', '--cleanup', action='store_true', required=False, help="Clean up tmp directory")
         parser.add_argument('-fl', '--freeleech', nargs=1, required=False, help="Freeleech Percentage. Any value 1-100 works, but site search is limited to certain values", default=0, dest="freeleech")
         parser.add_argument('--infohash', nargs=1, required=False, help="V1 Info Hash")
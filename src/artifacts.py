@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class ArtifactStore:
+    """
+    In-memory view of one release's tmp/{uuid} folder.
+
+    Files are still written to disk so everything that opens them directly keeps working, but reads
+    go through memory: the text and any structure parsed from it (json, parsed mediainfo...) are
+    kept until the file changes on disk (size or mtime), so repeated reads don't re-open and re-parse.
+    Parsed structures are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.lock = threading.Lock()
+        self.entries = {}  # name -> {'stamp': (mtime_ns, size), 'text': str, 'parsed': {parser: value}}
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    def stamp(self, name):
+        st = os.stat(self.path(name))
+        return st.st_mtime_ns, st.st_size
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def entry(self, name):
+        stamp = self.stamp(name)
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is not None and entry['stamp'] == stamp:
+                return entry
+        with open(self.path(name), 'r', encoding='utf-8') as f:
+            text = f.read()
+        entry = {'stamp': stamp, 'text': text, 'parsed': {}}
+        with self.lock:
+            self.entries[name] = entry
+        return entry
+
+    def read_text(self, name):
+        return self.entry(name)['text']
+
+    def load(self, name, parser):
+        """Return parser(text) for an artifact, parsed once per version of the file."""
+        entry = self.entry(name)
+        parsed = entry['parsed']
+        if parser not in parsed:
+            parsed[parser] = parser(entry['text'])
+        return parsed[parser]
+
+    def read_json(self, name):
+        return self.load(name, json.loads)
+
+    def write_text(self, name, text, newline=None):
+        with open(self.path(name), 'w', newline=newline, encoding='utf-8') as f:
+            f.write(text)
+        if '\r' in text:
+            # Reading back translates line endings, let the next read pick up the file
+            self.invalidate(name)
+            return
+        entry = {'stamp': self.stamp(name), 'text': text, 'parsed': {}}
+        with self.lock:
+            self.entries[name] = entry
+
+    def write_json(self, name, data, indent=4):
+        self.write_text(name, json.dumps(data, indent=indent))
+
+    def invalidate(self, name=None):
+        with self.lock:
+            if name is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(name, None)
+
+
+# Stores of the most recently used releases, enough for every release in flight in the queue pipeline
+max_stores = 16
+_stores = OrderedDict()
+_stores_lock = threading.Lock()
+
+
+def get_store(base_dir, folder_id):
+    folder = os.path.join(base_dir, "tmp", folder_id)
+    with _stores_lock:
+        store = _stores.get(folder)
+        if store is None:
+            store = _stores[folder] = ArtifactStore(folder)
+            while len(_stores) > max_stores:
+                _stores.popitem(last=False)
+        else:
+            _stores.move_to_end(folder)
+    return store
+
+
+def artifacts(meta):
+    """The artifact store of the release described by meta."""
+    return get_store(meta['base_dir'], meta['uuid'])
+
+
+def read_artifact(meta, name):
+    return artifacts(meta).read_text(name)
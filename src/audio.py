@@ -1,8 +1,10 @@
 import time
 import traceback
 from src.console import console
+from src.profiling import traced
 
 
+@traced()
 async def get_audio_v2(mi, meta, bdinfo):
     extra = dual = ""
     has_commentary = False
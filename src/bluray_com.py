@@ -7,6 +7,8 @@ import cli_ui
 import os
 from bs4 import BeautifulSoup
 from rich.console import Console
+from src.artifacts import read_artifact
+from src.profiling import traced
 
 console = Console()
 
@@ -292,6 +294,7 @@ async def extract_product_id(url, meta):
     return None
 
 
+@traced()
 async def get_bluray_releases(meta):
     console.print("[blue]===== Starting blu-ray.com release search =====[/blue]")
     console.print(f"[blue]Movie: {meta.get('filename', 'Unknown')}, IMDB ID: tt{meta.get('imdb_id', '0000000'):07d}[/blue]")
@@ -993,8 +996,7 @@ async def process_all_releases(releases, meta):
                 console.print(f"[blue]Opening BD_SUMMARY file: {bd_summary_path}[/blue]")
                 console.print("[dim]Stripping extremely small subtitle tracks from bdinfo[/dim]")
             try:
-                with open(bd_summary_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
+                lines = read_artifact(meta, "BD_SUMMARY_00.txt").splitlines(keepends=True)
 
                 # Parse the subtitles section
                 for line in lines:
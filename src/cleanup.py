@@ -14,10 +14,27 @@ if os.name == "posix":
 running_subprocesses = set()
 thread_executor: ThreadPoolExecutor = None
 IS_MACOS = sys.platform == 'darwin'
+# While a pipelined queue is running other queue items still own tasks and subprocesses
+pipeline_active = False
+# The daemon and watch mode run every job in one process, so a finished job must not tear down the next ones
+daemon_active = False
+
+
+def set_pipeline_active(active):
+    global pipeline_active
+    pipeline_active = active
+
+
+def set_daemon_active(active):
+    global daemon_active
+    daemon_active = active
 
 
 async def cleanup():
     """Ensure all running tasks, threads, and subprocesses are properly cleaned up before exiting."""
+    if pipeline_active or daemon_active:
+        return
+
     # console.print("[yellow]Cleaning up tasks before exiting...[/yellow]")
 
     # Step 1: Shutdown ThreadPoolExecutor **before checking for threads**
@@ -13,6 +13,7 @@ import ssl
 import shutil
 import time
 from src.console import console
+from src.qbitindex import get_qbit_client, get_qbit_index
 import re
 import platform
 
@@ -96,14 +97,7 @@ class Clients():
                     console.print(f"[yellow]Fetching .torrent file from qBittorrent for hash: {hash_value}")
 
                     try:
-                        qbt_client = qbittorrentapi.Client(
-                            host=client['qbit_url'],
-                            port=client['qbit_port'],
-                            username=client['qbit_user'],
-                            password=client['qbit_pass'],
-                            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-                        )
-                        qbt_client.auth_log_in()
+                        qbt_client = await get_qbit_client(client)
 
                         # Retrieve the .torrent file
                         torrent_file_content = qbt_client.torrents_export(torrent_hash=hash_value)
@@ -309,14 +303,7 @@ class Clients():
             return None
 
         try:
-            qbt_client = qbittorrentapi.Client(
-                host=client['qbit_url'],
-                port=client['qbit_port'],
-                username=client['qbit_user'],
-                password=client['qbit_pass'],
-                VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-            )
-            qbt_client.auth_log_in()
+            qbt_client = await get_qbit_client(client)
 
         except qbittorrentapi.LoginFailed:
             console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
@@ -332,19 +319,14 @@ class Clients():
         best_match = None
         matching_torrents = []
 
-        for torrent in qbt_client.torrents.info():
-            try:
-                torrent_path = torrent.name
-            except AttributeError:
-                continue  # Ignore torrents with missing attributes
+        qbit_index = await get_qbit_index(client, qbt_client, meta['debug'])
+        for torrent in qbit_index.find_by_name(meta['uuid'], qbt_client):
+            torrent_path = torrent.name
 
             if meta['is_disc'] in ("", None) and len(meta['filelist']) == 1:
-                if torrent_path != meta['uuid'] or len(torrent.files) != len(meta['filelist']):
+                if await qbit_index.file_count(torrent.hash, qbt_client) != len(meta['filelist']):
                     continue
 
-            elif meta['uuid'] != torrent_path:
-                continue
-
             if meta['debug']:
                 console.print(f"[cyan]Matched Torrent: {torrent.hash}")
                 console.print(f"Name: {torrent.name}")
@@ -932,20 +914,11 @@ class Clients():
                             console.print(f"[yellow]Using original path without linking: {src}")
                             use_symlink = False
 
-        # Initialize qBittorrent client
-        qbt_client = qbittorrentapi.Client(
-            host=client['qbit_url'],
-            port=client['qbit_port'],
-            username=client['qbit_user'],
-            password=client['qbit_pass'],
-            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-        )
-
         if meta['debug']:
             console.print("[bold yellow]Adding and rechecking torrent")
 
         try:
-            qbt_client.auth_log_in()
+            qbt_client = await get_qbit_client(client)
         except qbittorrentapi.LoginFailed:
             console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
             return
@@ -1185,20 +1158,8 @@ class Clients():
             await self.get_ptp_from_hash_rtorrent(meta, pathed)
             return meta
         elif torrent_client == 'qbit':
-            qbt_client = qbittorrentapi.Client(
-                host=client['qbit_url'],
-                port=client['qbit_port'],
-                username=client['qbit_user'],
-                password=client['qbit_pass'],
-                VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True),
-                REQUESTS_ARGS={'timeout': 10}
-            )
-
             try:
-                await asyncio.wait_for(
-                    asyncio.to_thread(qbt_client.auth_log_in),
-                    timeout=10.0
-                )
+                qbt_client = await get_qbit_client(client, timeout=10)
             except asyncio.TimeoutError:
                 console.print("[bold red]Login attempt to qBittorrent timed out after 10 seconds")
                 return None
@@ -1209,7 +1170,9 @@ class Clients():
             info_hash_v1 = meta.get('infohash')
             if meta['debug']:
                 console.print(f"[cyan]Searching for infohash: {info_hash_v1}")
-            torrents = qbt_client.torrents_info()
+            qbit_index = await get_qbit_index(client, qbt_client, meta['debug'])
+            torrent = qbit_index.get(info_hash_v1, qbt_client) if info_hash_v1 else None
+            torrents = [torrent] if torrent else []
             found = False
 
             folder_id = os.path.basename(meta['path'])
@@ -1515,20 +1478,8 @@ class Clients():
             tracker_priority = ['aither', 'ulcx', 'lst', 'blu', 'oe', 'btn', 'bhd', 'huno', 'hdb', 'ptp']
 
             try:
-                qbt_client = qbittorrentapi.Client(
-                    host=client_config['qbit_url'],
-                    port=int(client_config['qbit_port']),
-                    username=client_config['qbit_user'],
-                    password=client_config['qbit_pass'],
-                    VERIFY_WEBUI_CERTIFICATE=client_config.get('VERIFY_WEBUI_CERTIFICATE', True),
-                    REQUESTS_ARGS={'timeout': 10}
-                )
-
                 try:
-                    await asyncio.wait_for(
-                        asyncio.to_thread(qbt_client.auth_log_in),
-                        timeout=10.0
-                    )
+                    qbt_client = await get_qbit_client(client_config, timeout=10)
                 except asyncio.TimeoutError:
                     console.print("[bold red]Connection to qBittorrent timed out after 10 seconds")
                     return []
@@ -1541,9 +1492,14 @@ class Clients():
                 console.print("[bold red]Failed to connect to qBittorrent - check host/port")
                 return []
 
-            torrents = await asyncio.to_thread(qbt_client.torrents_info)
+            qbit_index = await get_qbit_index(client_config, qbt_client, meta['debug'])
+            torrents = qbit_index.find_by_name(meta['uuid'], qbt_client)
+            if meta.get('is_disc', "") in ("", None) and len(meta.get('filelist', [])) == 1:
+                file_name = os.path.basename(meta['filelist'][0])
+                if file_name != meta['uuid']:
+                    torrents += qbit_index.find_by_name(file_name, qbt_client)
             if meta['debug']:
-                console.print(f"[cyan]Found {len(torrents)} torrents in qBittorrent")
+                console.print(f"[cyan]Found {len(torrents)} candidate torrents in qBittorrent")
 
             matching_torrents = []
 
@@ -1564,7 +1520,7 @@ class Clients():
 
                     if is_disc in ("", None) and len(meta.get('filelist', [])) == 1:
                         file_name = os.path.basename(meta['filelist'][0])
-                        if (torrent_name == file_name) and len(torrent.files) == 1:
+                        if (torrent_name == file_name) and await qbit_index.file_count(torrent.hash, qbt_client) == 1:
                             is_match = True
                         elif torrent_name == meta['uuid']:
                             is_match = True
@@ -0,0 +1,190 @@
+import asyncio
+import os
+import time
+import traceback
+from collections import OrderedDict
+
+from src.cleanup import set_daemon_active
+from src.console import console
+
+default_host = "127.0.0.1"
+default_port = 8765
+# Finished jobs kept for the status endpoints
+max_finished_jobs = 500
+
+
+def daemon_address(config):
+    host = config['DEFAULT'].get('daemon_host', default_host) or default_host
+    port = int(config['DEFAULT'].get('daemon_port', default_port) or default_port)
+    return host, port
+
+
+def auth_headers(config):
+    token = config['DEFAULT'].get('daemon_token', '')
+    return {'Authorization': f"Bearer {token}"} if token else {}
+
+
+class Job:
+    def __init__(self, job_id, args):
+        self.id = job_id
+        self.args = args
+        self.state = 'queued'
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.error = None
+        self.done = asyncio.Event()
+
+    def as_dict(self):
+        return {
+            'id': self.id,
+            'args': self.args,
+            'state': self.state,
+            'submitted': self.submitted,
+            'started': self.started,
+            'finished': self.finished,
+            'seconds': round(self.finished - self.started, 2) if self.finished and self.started else None,
+            'error': self.error,
+        }
+
+
+class Daemon:
+    """
+    Keeps one process (imports, pooled sessions, caches, qBittorrent logins and index) alive
+    and runs the jobs posted to its local HTTP API one after another, exactly as upload.py would run them.
+    """
+
+    def __init__(self, config, run_job):
+        self.config = config
+        self.run_job = run_job
+        self.queue = asyncio.Queue()
+        self.jobs = OrderedDict()
+        self.next_id = 1
+        self.token = config['DEFAULT'].get('daemon_token', '')
+
+    def authorized(self, request):
+        return not self.token or request.headers.get('Authorization') == f"Bearer {self.token}"
+
+    async def submit(self, request):
+        from aiohttp import web
+        if not self.authorized(request):
+            return web.json_response({'error': 'unauthorized'}, status=401)
+        try:
+            data = await request.json()
+        except ValueError:
+            return web.json_response({'error': 'body must be json'}, status=400)
+        args = data.get('args') if isinstance(data, dict) else None
+        if not args or not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            return web.json_response({'error': "'args' must be a list of upload.py arguments"}, status=400)
+        # Nobody is watching the daemon's terminal, so jobs never prompt
+        if not {'-ua', '--unattended'} & set(args):
+            args = args + ['--unattended']
+
+        job = Job(self.next_id, args)
+        self.next_id += 1
+        self.jobs[job.id] = job
+        self.forget_old_jobs()
+        await self.queue.put(job)
+        return web.json_response(job.as_dict(), status=202)
+
+    async def list_jobs(self, request):
+        from aiohttp import web
+        if not self.authorized(request):
+            return web.json_response({'error': 'unauthorized'}, status=401)
+        return web.json_response([job.as_dict() for job in self.jobs.values()])
+
+    async def get_job(self, request):
+        """GET /jobs/{id}, add ?wait=1 to hold the request until the job has finished."""
+        from aiohttp import web
+        if not self.authorized(request):
+            return web.json_response({'error': 'unauthorized'}, status=401)
+        try:
+            job = self.jobs[int(request.match_info['job_id'])]
+        except (KeyError, ValueError):
+            return web.json_response({'error': 'unknown job'}, status=404)
+        if request.query.get('wait'):
+            await job.done.wait()
+        return web.json_response(job.as_dict())
+
+    def forget_old_jobs(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.done.is_set()]
+        for job_id in finished[:max(0, len(finished) - max_finished_jobs)]:
+            del self.jobs[job_id]
+
+    async def worker(self):
+        while True:
+            job = await self.queue.get()
+            job.state = 'running'
+            job.started = time.time()
+            console.print(f"[cyan]Daemon: starting job {job.id}: {' '.join(job.args)}")
+            try:
+                await self.run_job(job.args)
+                job.state = 'done'
+            except SystemExit as e:
+                # argparse errors and early exits inside the job
+                job.state = 'done' if not e.code else 'failed'
+                job.error = None if not e.code else f"exited with {e.code}"
+            except Exception as e:
+                job.state = 'failed'
+                job.error = str(e)
+                console.print(traceback.format_exc())
+            finally:
+                job.finished = time.time()
+                job.done.set()
+            console.print(f"[cyan]Daemon: job {job.id} {job.state} in {job.finished - job.started:.1f}s, {self.queue.qsize()} queued")
+
+    async def serve(self):
+        from aiohttp import web
+        app = web.Application()
+        app.add_routes([
+            web.post('/jobs', self.submit),
+            web.get('/jobs', self.list_jobs),
+            web.get('/jobs/{job_id}', self.get_job),
+        ])
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        host, port = daemon_address(self.config)
+        try:
+            await web.TCPSite(runner, host, port).start()
+        except OSError as e:
+            console.print(f"[red]Could not listen on {host}:{port}: {e}")
+            await runner.cleanup()
+            return
+        console.print(f"[green]Daemon listening on http://{host}:{port}, submit jobs with upload.py [path] [options] --submit")
+        set_daemon_active(True)
+        try:
+            await self.worker()
+        finally:
+            set_daemon_active(False)
+            await runner.cleanup()
+
+
+async def run_daemon(config, run_job):
+    await Daemon(config, run_job).serve()
+
+
+def submit_job(config, args, wait=False):
+    """Thin client: hand the arguments to the running daemon. Returns the job, or None when it couldn't be queued."""
+    import httpx
+
+    # The daemon may run from another directory
+    args = [os.path.abspath(arg) if os.path.exists(arg) else arg for arg in args]
+    host, port = daemon_address(config)
+    url = f"http://{host}:{port}/jobs"
+    headers = auth_headers(config)
+    try:
+        response = httpx.post(url, json={'args': args}, headers=headers, timeout=10)
+    except httpx.HTTPError as e:
+        console.print(f"[red]No daemon reachable at {url} ({e}), start one with: upload.py --daemon")
+        return None
+    if response.status_code != 202:
+        console.print(f"[red]Daemon refused the job ({response.status_code}): {response.text}")
+        return None
+    job = response.json()
+    console.print(f"[green]Queued job {job['id']} on the daemon")
+    if wait:
+        response = httpx.get(f"{url}/{job['id']}", params={'wait': 1}, headers=headers, timeout=None)
+        job = response.json()
+        colour = "green" if job['state'] == 'done' else "red"
+        console.print(f"[{colour}]Job {job['id']} {job['state']} in {job['seconds']}s" + (f": {job['error']}" if job['error'] else ""))
+    return job
@@ -31,6 +31,8 @@ class DiscParse():
         if not os.path.exists(save_dir):
             os.mkdir(save_dir)
 
+        # Playlist selection can prompt, so pick the playlists of every disc before scanning any of them
+        scan_plan = []
         for i in range(len(discs)):
             bdinfo_text = None
             path = os.path.abspath(discs[i]['path'])
@@ -38,273 +40,329 @@ class DiscParse():
                 if file == f"BD_SUMMARY_{str(i).zfill(2)}.txt":
                     bdinfo_text = save_dir + "/" + file
             if bdinfo_text is None or meta_discs == []:
-                bdinfo_text = ""
-                playlists_path = os.path.join(path, "PLAYLIST")
+                valid_playlists, selected_playlists = await self.get_playlists(meta, path, use_largest)
+                if not selected_playlists:
+                    continue
+                scan_plan.append((i, path, valid_playlists, selected_playlists))
+            else:
+                discs = meta_discs
+
+        reports = await self.scan_playlists(scan_plan, save_dir, base_dir)
 
-                if not os.path.exists(playlists_path):
-                    console.print(f"[bold red]PLAYLIST directory not found for disc {path}")
+        for i, path, valid_playlists, selected_playlists in scan_plan:
+            for idx, playlist in enumerate(selected_playlists):
+                playlist_number = playlist['file'].replace(".mpls", "")
+                if (i, playlist['file']) not in reports:
                     continue
+                bdinfo_text = reports[(i, playlist['file'])]
 
-                # Parse playlists
-                valid_playlists = []
-                for file_name in os.listdir(playlists_path):
-                    if file_name.endswith(".mpls"):
-                        mpls_path = os.path.join(playlists_path, file_name)
-                        try:
-                            with open(mpls_path, "rb") as mpls_file:
-                                header = mpls.load_movie_playlist(mpls_file)
-                                mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
-                                playlist_data = mpls.load_playlist(mpls_file)
-
-                                duration = 0
-                                items = []  # Collect .m2ts file paths and sizes
-                                stream_directory = os.path.join(path, "STREAM")
-                                file_counts = defaultdict(int)  # Tracks the count of each .m2ts file
-                                file_sizes = {}  # Stores the size of each unique .m2ts file
-
-                                for item in playlist_data.play_items:
-                                    duration += (item.outtime - item.intime) / 45000
-                                    try:
-                                        m2ts_file = os.path.join(stream_directory, item.clip_information_filename.strip() + ".m2ts")
-                                        if os.path.exists(m2ts_file):
-                                            size = os.path.getsize(m2ts_file)
-                                            file_counts[m2ts_file] += 1  # Increment the count
-                                            file_sizes[m2ts_file] = size  # Store individual file size
-                                    except AttributeError as e:
-                                        console.print(f"[bold red]Error accessing clip information for item in {file_name}: {e}")
-
-                                # Process unique playlists with only one instance of each file
-                                if all(count == 1 for count in file_counts.values()):
-                                    items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
-
-                                    # Save playlists with duration >= 10 minutes
-                                    if duration >= 600:
-                                        valid_playlists.append({
-                                            "file": file_name,
-                                            "duration": duration,
-                                            "path": mpls_path,
-                                            "items": items
-                                        })
-                        except Exception as e:
-                            console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+                # Process the BDInfo report in the while True loop
+                while True:
+                    try:
+                        if not os.path.exists(bdinfo_text):
+                            console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
+                            break
+
+                        with open(bdinfo_text, 'r', encoding="utf-8", errors="replace") as f:
+                            text = f.read()
+                            result = text.split("QUICK SUMMARY:", 2)
+                            files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
+                            result2 = result[1].rstrip(" \n")
+                            result = result2.split("********************", 1)
+                            bd_summary = result[0].rstrip(" \n")
+
+                        with open(bdinfo_text, 'r', encoding="utf-8", errors="replace") as f:
+                            text = f.read()
+                            result = text.split("[code]", 3)
+                            result2 = result[2].rstrip(" \n")
+                            result = result2.split("FILES:", 1)
+                            ext_bd_summary = result[0].rstrip(" \n")
+
+                        # Save summaries and bdinfo for each playlist
+                        if idx == 0:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
+                        else:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
+
+                        with open(summary_file, 'w', encoding="utf-8", errors="replace") as f:
+                            f.write(bd_summary.strip())
+                        with open(extended_summary_file, 'w', encoding="utf-8", errors="replace") as f:
+                            f.write(ext_bd_summary.strip())
+
+                        bdinfo = self.parse_bdinfo(bd_summary, files[1], path)
+
+                        # Prompt user for custom edition if conditions are met
+                        if len(selected_playlists) > 1:
+                            current_label = bdinfo.get('label', f"Playlist {idx}")
+                            console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
+
+                            if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
+                                console.print("[bold green]You can create a custom Edition for this playlist.")
+                                user_input = input(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ").strip()
+                                if user_input:
+                                    bdinfo['edition'] = user_input
+                                    selected_playlists[idx]['edition'] = user_input
+                                    console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
+                            else:
+                                console.print("[bold yellow]Unattended mode: Custom edition not added.")
+
+                        # Save to discs array
+                        if idx == 0:
+                            discs[i]['summary'] = bd_summary.strip()
+                            discs[i]['bdinfo'] = bdinfo
+                            discs[i]['playlists'] = selected_playlists
+                            if valid_playlists and meta['unattended'] and not meta.get('unattended-confirm', False):
+                                simplified_playlists = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
+                                duration_map = {}
+
+                                # Store simplified version with only file and duration, keeping only one per unique duration
+                                for playlist in valid_playlists:
+                                    rounded_duration = round(playlist["duration"])
+                                    if rounded_duration in duration_map:
+                                        continue
+
+                                    duration_map[rounded_duration] = {
+                                        "file": playlist["file"],
+                                        "duration": playlist["duration"]
+                                    }
+
+                                simplified_playlists = list(duration_map.values())
+                                simplified_playlists.sort(key=lambda x: x["duration"], reverse=True)
+                                discs[i]['all_valid_playlists'] = simplified_playlists
+
+                                if meta['debug']:
+                                    console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
+                        else:
+                            discs[i][f'summary_{idx}'] = bd_summary.strip()
+                            discs[i][f'bdinfo_{idx}'] = bdinfo
 
-                if not valid_playlists:
-                    # Find all playlists regardless of duration
-                    all_playlists = []
-                    for file_name in os.listdir(playlists_path):
-                        if file_name.endswith(".mpls"):
-                            mpls_path = os.path.join(playlists_path, file_name)
-                            try:
-                                with open(mpls_path, "rb") as mpls_file:
-                                    header = mpls.load_movie_playlist(mpls_file)
-                                    mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
-                                    playlist_data = mpls.load_playlist(mpls_file)
-
-                                    duration = 0
-                                    items = []
-                                    stream_directory = os.path.join(path, "STREAM")
-                                    file_counts = defaultdict(int)
-                                    file_sizes = {}
-
-                                    for item in playlist_data.play_items:
-                                        duration += (item.outtime - item.intime) / 45000
-                                        try:
-                                            m2ts_file = os.path.join(stream_directory, item.clip_information_filename.strip() + ".m2ts")
-                                            if os.path.exists(m2ts_file):
-                                                size = os.path.getsize(m2ts_file)
-                                                file_counts[m2ts_file] += 1
-                                                file_sizes[m2ts_file] = size
-                                        except AttributeError as e:
-                                            console.print(f"[bold red]Error accessing clip info for item in {file_name}: {e}")
-
-                                    if all(count == 1 for count in file_counts.values()):
-                                        items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
-                                        all_playlists.append({
-                                            "file": file_name,
-                                            "duration": duration,
-                                            "path": mpls_path,
-                                            "items": items
-                                        })
-                            except Exception as e:
-                                console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
-
-                    if all_playlists:
-                        console.print("[yellow]Using available playlists with any duration")
-                        # Select the largest playlist by total size
-                        largest_playlist = max(all_playlists, key=lambda p: sum(item['size'] for item in p['items']))
-                        console.print(f"[green]Selected largest playlist {largest_playlist['file']} with duration {largest_playlist['duration']:.2f} seconds")
-                        valid_playlists = [largest_playlist]
-                    else:
-                        console.print(f"[bold red]No playlists found for disc {path}")
+                    except Exception:
+                        console.print(traceback.format_exc())
+                        await asyncio.sleep(5)
                         continue
+                    break
 
-                if use_largest:
-                    console.print("[yellow]Auto-selecting the largest playlist based on configuration.")
-                    selected_playlists = [max(valid_playlists, key=lambda p: sum(item['size'] for item in p['items']))]
+        return discs, discs[0]['bdinfo']
+
+    async def get_playlists(self, meta, path, use_largest):
+        """
+        Find the valid playlists of a disc and select which of them to scan.
+        Returns (valid_playlists, selected_playlists), or (None, None) when the disc has no usable playlist.
+        """
+        playlists_path = os.path.join(path, "PLAYLIST")
+
+        if not os.path.exists(playlists_path):
+            console.print(f"[bold red]PLAYLIST directory not found for disc {path}")
+            return None, None
+
+        # Parse playlists
+        valid_playlists = []
+        for file_name in os.listdir(playlists_path):
+            if file_name.endswith(".mpls"):
+                mpls_path = os.path.join(playlists_path, file_name)
+                try:
+                    with open(mpls_path, "rb") as mpls_file:
+                        header = mpls.load_movie_playlist(mpls_file)
+                        mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
+                        playlist_data = mpls.load_playlist(mpls_file)
+
+                        duration = 0
+                        items = []  # Collect .m2ts file paths and sizes
+                        stream_directory = os.path.join(path, "STREAM")
+                        file_counts = defaultdict(int)  # Tracks the count of each .m2ts file
+                        file_sizes = {}  # Stores the size of each unique .m2ts file
+
+                        for item in playlist_data.play_items:
+                            duration += (item.outtime - item.intime) / 45000
+                            try:
+                                m2ts_file = os.path.join(stream_directory, item.clip_information_filename.strip() + ".m2ts")
+                                if os.path.exists(m2ts_file):
+                                    size = os.path.getsize(m2ts_file)
+                                    file_counts[m2ts_file] += 1  # Increment the count
+                                    file_sizes[m2ts_file] = size  # Store individual file size
+                            except AttributeError as e:
+                                console.print(f"[bold red]Error accessing clip information for item in {file_name}: {e}")
+
+                        # Process unique playlists with only one instance of each file
+                        if all(count == 1 for count in file_counts.values()):
+                            items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
+
+                            # Save playlists with duration >= 10 minutes
+                            if duration >= 600:
+                                valid_playlists.append({
+                                    "file": file_name,
+                                    "duration": duration,
+                                    "path": mpls_path,
+                                    "items": items
+                                })
+                except Exception as e:
+                    console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+
+        if not valid_playlists:
+            # Find all playlists regardless of duration
+            all_playlists = []
+            for file_name in os.listdir(playlists_path):
+                if file_name.endswith(".mpls"):
+                    mpls_path = os.path.join(playlists_path, file_name)
+                    try:
+                        with open(mpls_path, "rb") as mpls_file:
+                            header = mpls.load_movie_playlist(mpls_file)
+                            mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
+                            playlist_data = mpls.load_playlist(mpls_file)
+
+                            duration = 0
+                            items = []
+                            stream_directory = os.path.join(path, "STREAM")
+                            file_counts = defaultdict(int)
+                            file_sizes = {}
+
+                            for item in playlist_data.play_items:
+                                duration += (item.outtime - item.intime) / 45000
+                                try:
+                                    m2ts_file = os.path.join(stream_directory, item.clip_information_filename.strip() + ".m2ts")
+                                    if os.path.exists(m2ts_file):
+                                        size = os.path.getsize(m2ts_file)
+                                        file_counts[m2ts_file] += 1
+                                        file_sizes[m2ts_file] = size
+                                except AttributeError as e:
+                                    console.print(f"[bold red]Error accessing clip info for item in {file_name}: {e}")
+
+                            if all(count == 1 for count in file_counts.values()):
+                                items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
+                                all_playlists.append({
+                                    "file": file_name,
+                                    "duration": duration,
+                                    "path": mpls_path,
+                                    "items": items
+                                })
+                    except Exception as e:
+                        console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+
+            if all_playlists:
+                console.print("[yellow]Using available playlists with any duration")
+                # Select the largest playlist by total size
+                largest_playlist = max(all_playlists, key=lambda p: sum(item['size'] for item in p['items']))
+                console.print(f"[green]Selected largest playlist {largest_playlist['file']} with duration {largest_playlist['duration']:.2f} seconds")
+                valid_playlists = [largest_playlist]
+            else:
+                console.print(f"[bold red]No playlists found for disc {path}")
+                return None, None
+
+        if use_largest:
+            console.print("[yellow]Auto-selecting the largest playlist based on configuration.")
+            selected_playlists = [max(valid_playlists, key=lambda p: sum(item['size'] for item in p['items']))]
+        else:
+            # Allow user to select playlists
+            if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
+                if len(valid_playlists) == 1:
+                    console.print("[yellow]Only one valid playlist found. Automatically selecting.")
+                    selected_playlists = valid_playlists
                 else:
-                    # Allow user to select playlists
-                    if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
-                        if len(valid_playlists) == 1:
-                            console.print("[yellow]Only one valid playlist found. Automatically selecting.")
-                            selected_playlists = valid_playlists
-                        else:
-                            while True:  # Loop until valid input is provided
-                                console.print("[bold green]Available playlists:")
-                                for idx, playlist in enumerate(valid_playlists):
-                                    duration_str = f"{int(playlist['duration'] // 3600)}h {int((playlist['duration'] % 3600) // 60)}m {int(playlist['duration'] % 60)}s"
-                                    items_str = ', '.join(f"{os.path.basename(item['file'])} ({item['size'] // (1024 * 1024)} MB)" for item in playlist['items'])
-                                    console.print(f"[{idx}] {playlist['file']} - {duration_str} - {items_str}")
-
-                                console.print("[bold yellow]Enter playlist numbers separated by commas, 'ALL' to select all, or press Enter to select the biggest playlist:")
-                                user_input = input("Select playlists: ").strip()
-
-                                if user_input.lower() == "all":
-                                    selected_playlists = valid_playlists
-                                    break
-                                elif user_input == "":
-                                    # Select the playlist with the largest total size
-                                    console.print("[yellow]Selecting the playlist with the largest size:")
-                                    selected_playlists = [max(valid_playlists, key=lambda p: sum(item['size'] for item in p['items']))]
-                                    break
-                                else:
-                                    try:
-                                        selected_indices = [int(x) for x in user_input.split(',')]
-                                        selected_playlists = [valid_playlists[idx] for idx in selected_indices if 0 <= idx < len(valid_playlists)]
-                                        break
-                                    except ValueError:
-                                        console.print("[bold red]Invalid input. Please try again.")
-                    else:
-                        # Automatically select the largest playlist if unattended without confirmation
-                        console.print("[yellow]Auto-selecting the largest playlist based on unattended configuration.")
-                        selected_playlists = [max(valid_playlists, key=lambda p: sum(item['size'] for item in p['items']))]
+                    while True:  # Loop until valid input is provided
+                        console.print("[bold green]Available playlists:")
+                        for idx, playlist in enumerate(valid_playlists):
+                            duration_str = f"{int(playlist['duration'] // 3600)}h {int((playlist['duration'] % 3600) // 60)}m {int(playlist['duration'] % 60)}s"
+                            items_str = ', '.join(f"{os.path.basename(item['file'])} ({item['size'] // (1024 * 1024)} MB)" for item in playlist['items'])
+                            console.print(f"[{idx}] {playlist['file']} - {duration_str} - {items_str}")
 
-                for idx, playlist in enumerate(selected_playlists):
-                    console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
-                    playlist_number = playlist['file'].replace(".mpls", "")
-                    playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+                        console.print("[bold yellow]Enter playlist numbers separated by commas, 'ALL' to select all, or press Enter to select the biggest playlist:")
+                        user_input = input("Select playlists: ").strip()
 
-                    if os.path.exists(playlist_report_path):
-                        bdinfo_text = playlist_report_path
-                    else:
-                        try:
-                            # Scanning playlist block (as before)
-                            if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-                                proc = await asyncio.create_subprocess_exec(
-                                    'mono', f"{base_dir}/bin/BDInfo/BDInfo.exe", path, '-m', playlist['file'], save_dir
-                                )
-                            elif sys.platform.startswith('win32'):
-                                proc = await asyncio.create_subprocess_exec(
-                                    f"{base_dir}/bin/BDInfo/BDInfo.exe", '-m', playlist['file'], path, save_dir
-                                )
-                            else:
-                                console.print("[red]Unsupported platform for BDInfo.")
-                                continue
-
-                            await proc.wait()
-
-                            # Rename the output to playlist_report_path
-                            for file in os.listdir(save_dir):
-                                if file.startswith("BDINFO") and file.endswith(".txt"):
-                                    bdinfo_text = os.path.join(save_dir, file)
-                                    shutil.move(bdinfo_text, playlist_report_path)
-                                    bdinfo_text = playlist_report_path  # Update bdinfo_text to the renamed file
-                                    break
-                        except Exception as e:
-                            console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
-                            continue
-
-                    # Process the BDInfo report in the while True loop
-                    while True:
-                        try:
-                            if not os.path.exists(bdinfo_text):
-                                console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
+                        if user_input.lower() == "all":
+                            selected_playlists = valid_playlists
+                            break
+                        elif user_input == "":
+                            # Select the playlist with the largest total size
+                            console.print("[yellow]Selecting the playlist with the largest size:")
+                            selected_playlists = [max(valid_playlists, key=lambda p: sum(item['size'] for item in p['items']))]
+                            break
+                        else:
+                            try:
+                                selected_indices = [int(x) for x in user_input.split(',')]
+                                selected_playlists = [valid_playlists[idx] for idx in selected_indices if 0 <= idx < len(valid_playlists)]
                                 break
+                            except ValueError:
+                                console.print("[bold red]Invalid input. Please try again.")
+            else:
+                # Automatically select the largest playlist if unattended without confirmation
+                console.print("[yellow]Auto-selecting the largest playlist based on unattended configuration.")
+                selected_playlists = [max(valid_playlists, key=lambda p: sum(item['size'] for item in p['items']))]
 
-                            with open(bdinfo_text, 'r', encoding="utf-8", errors="replace") as f:
-                                text = f.read()
-                                result = text.split("QUICK SUMMARY:", 2)
-                                files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
-                                result2 = result[1].rstrip(" \n")
-                                result = result2.split("********************", 1)
-                                bd_summary = result[0].rstrip(" \n")
-
-                            with open(bdinfo_text, 'r', encoding="utf-8", errors="replace") as f:
-                                text = f.read()
-                                result = text.split("[code]", 3)
-                                result2 = result[2].rstrip(" \n")
-                                result = result2.split("FILES:", 1)
-                                ext_bd_summary = result[0].rstrip(" \n")
-
-                            # Save summaries and bdinfo for each playlist
-                            if idx == 0:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
-                            else:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
-
-                            with open(summary_file, 'w', encoding="utf-8", errors="replace") as f:
-                                f.write(bd_summary.strip())
-                            with open(extended_summary_file, 'w', encoding="utf-8", errors="replace") as f:
-                                f.write(ext_bd_summary.strip())
-
-                            bdinfo = self.parse_bdinfo(bd_summary, files[1], path)
-
-                            # Prompt user for custom edition if conditions are met
-                            if len(selected_playlists) > 1:
-                                current_label = bdinfo.get('label', f"Playlist {idx}")
-                                console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
-
-                                if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
-                                    console.print("[bold green]You can create a custom Edition for this playlist.")
-                                    user_input = input(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ").strip()
-                                    if user_input:
-                                        bdinfo['edition'] = user_input
-                                        selected_playlists[idx]['edition'] = user_input
-                                        console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
-                                else:
-                                    console.print("[bold yellow]Unattended mode: Custom edition not added.")
-
-                            # Save to discs array
-                            if idx == 0:
-                                discs[i]['summary'] = bd_summary.strip()
-                                discs[i]['bdinfo'] = bdinfo
-                                discs[i]['playlists'] = selected_playlists
-                                if valid_playlists and meta['unattended'] and not meta.get('unattended-confirm', False):
-                                    simplified_playlists = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
-                                    duration_map = {}
-
-                                    # Store simplified version with only file and duration, keeping only one per unique duration
-                                    for playlist in valid_playlists:
-                                        rounded_duration = round(playlist["duration"])
-                                        if rounded_duration in duration_map:
-                                            continue
-
-                                        duration_map[rounded_duration] = {
-                                            "file": playlist["file"],
-                                            "duration": playlist["duration"]
-                                        }
-
-                                    simplified_playlists = list(duration_map.values())
-                                    simplified_playlists.sort(key=lambda x: x["duration"], reverse=True)
-                                    discs[i]['all_valid_playlists'] = simplified_playlists
-
-                                    if meta['debug']:
-                                        console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
-                            else:
-                                discs[i][f'summary_{idx}'] = bd_summary.strip()
-                                discs[i][f'bdinfo_{idx}'] = bdinfo
+        return valid_playlists, selected_playlists
 
-                        except Exception:
-                            console.print(traceback.format_exc())
-                            await asyncio.sleep(5)
-                            continue
-                        break
+    async def scan_playlists(self, scan_plan, save_dir, base_dir):
+        """
+        Run BDInfo for every selected playlist that doesn't have a report yet.
+        Scans run concurrently up to 'bdinfo_workers', and at most 'bdinfo_workers_per_device'
+        at a time read from the same physical device.
+        Returns {(disc_index, playlist_file): report_path}, the path is "" when BDInfo wrote no report.
+        """
+        workers = max(1, int(self.config['DEFAULT'].get('bdinfo_workers', 2)))
+        per_device = max(1, int(self.config['DEFAULT'].get('bdinfo_workers_per_device', 1)))
+        semaphore = asyncio.Semaphore(workers)
+        device_semaphores = {}
+        reports = {}
+
+        async def scan(i, path, playlist):
+            playlist_number = playlist['file'].replace(".mpls", "")
+            playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+            if os.path.exists(playlist_report_path):
+                reports[(i, playlist['file'])] = playlist_report_path
+                return
 
+            try:
+                device = os.stat(path).st_dev
+            except OSError:
+                device = path
+            device_semaphore = device_semaphores.setdefault(device, asyncio.Semaphore(per_device))
+            async with device_semaphore, semaphore:
+                console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
+                try:
+                    report = await self.run_bdinfo(base_dir, path, playlist['file'], save_dir, playlist_report_path, f"{i}_{playlist_number}")
+                except Exception as e:
+                    console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
+                    return
+            if report is not None:
+                reports[(i, playlist['file'])] = report
+
+        await asyncio.gather(*[
+            scan(i, path, playlist)
+            for i, path, valid_playlists, selected_playlists in scan_plan
+            for playlist in selected_playlists
+        ])
+        return reports
+
+    async def run_bdinfo(self, base_dir, path, playlist_file, save_dir, playlist_report_path, scan_id):
+        """
+        Scan a single playlist. BDInfo writes into its own scratch folder so concurrent scans
+        can't pick up each other's report, which is then moved to playlist_report_path.
+        """
+        scan_dir = os.path.join(save_dir, f"bdinfo_scan_{scan_id}")
+        os.makedirs(scan_dir, exist_ok=True)
+        try:
+            if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
+                proc = await asyncio.create_subprocess_exec(
+                    'mono', f"{base_dir}/bin/BDInfo/BDInfo.exe", path, '-m', playlist_file, scan_dir
+                )
+            elif sys.platform.startswith('win32'):
+                proc = await asyncio.create_subprocess_exec(
+                    f"{base_dir}/bin/BDInfo/BDInfo.exe", '-m', playlist_file, path, scan_dir
+                )
             else:
-                discs = meta_discs
+                console.print("[red]Unsupported platform for BDInfo.")
+                return None
 
-        return discs, discs[0]['bdinfo']
+            await proc.wait()
+
+            for file in os.listdir(scan_dir):
+                if file.startswith("BDINFO") and file.endswith(".txt"):
+                    shutil.move(os.path.join(scan_dir, file), playlist_report_path)
+                    return playlist_report_path
+            return ""
+        finally:
+            shutil.rmtree(scan_dir, ignore_errors=True)
 
     def parse_bdinfo_files(self, files):
         """
@@ -453,8 +511,7 @@ class DiscParse():
     async def get_dvdinfo(self, discs, base_dir=None):
         for each in discs:
             path = each.get('path')
-            os.chdir(path)
-            files = glob("VTS_*.VOB")
+            files = [os.path.basename(file) for file in glob(os.path.join(path, "VTS_*.VOB"))]
             files.sort()
             filesdict = OrderedDict()
             main_set = []
@@ -468,7 +525,7 @@ class DiscParse():
 
             for vob_set in filesdict.values():
                 try:
-                    ifo_file = f"VTS_{vob_set[0][:2]}_0.IFO"
+                    ifo_file = os.path.join(path, f"VTS_{vob_set[0][:2]}_0.IFO")
 
                     try:
                         if platform.system() == "Windows":
@@ -528,38 +585,40 @@ class DiscParse():
                         process = await asyncio.create_subprocess_exec(
                             mediainfo_binary, os.path.basename(vob),
                             stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE
+                            stderr=asyncio.subprocess.PIPE,
+                            cwd=path
                         )
                         stdout, stderr = await process.communicate()
 
                         if process and process.returncode == 0:
                             each['vob_mi'] = stdout.decode().replace('\r\n', '\n')
                         else:
-                            each['vob_mi'] = MediaInfo.parse(os.path.basename(vob), output='STRING', full=False).replace('\r\n', '\n')
+                            each['vob_mi'] = MediaInfo.parse(vob, output='STRING', full=False).replace(vob, os.path.basename(vob)).replace('\r\n', '\n')
                     else:
-                        each['vob_mi'] = MediaInfo.parse(os.path.basename(vob), output='STRING', full=False).replace('\r\n', '\n')
+                        each['vob_mi'] = MediaInfo.parse(vob, output='STRING', full=False).replace(vob, os.path.basename(vob)).replace('\r\n', '\n')
                 except Exception as e:
                     console.print(f"[yellow]Error with DVD MediaInfo binary for VOB: {str(e)}")
-                    each['vob_mi'] = MediaInfo.parse(os.path.basename(vob), output='STRING', full=False).replace('\r\n', '\n')
+                    each['vob_mi'] = MediaInfo.parse(vob, output='STRING', full=False).replace(vob, os.path.basename(vob)).replace('\r\n', '\n')
 
                 try:
                     if platform.system() == "Windows":
                         process = await asyncio.create_subprocess_exec(
                             mediainfo_binary, os.path.basename(ifo),
                             stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE
+                            stderr=asyncio.subprocess.PIPE,
+                            cwd=path
                         )
                         stdout, stderr = await process.communicate()
 
                         if process and process.returncode == 0:
                             each['ifo_mi'] = stdout.decode().replace('\r\n', '\n')
                         else:
-                            each['ifo_mi'] = MediaInfo.parse(os.path.basename(ifo), output='STRING', full=False).replace('\r\n', '\n')
+                            each['ifo_mi'] = MediaInfo.parse(ifo, output='STRING', full=False).replace(ifo, os.path.basename(ifo)).replace('\r\n', '\n')
                     else:
-                        each['ifo_mi'] = MediaInfo.parse(os.path.basename(ifo), output='STRING', full=False).replace('\r\n', '\n')
+                        each['ifo_mi'] = MediaInfo.parse(ifo, output='STRING', full=False).replace(ifo, os.path.basename(ifo)).replace('\r\n', '\n')
                 except Exception as e:
                     console.print(f"[yellow]Error with DVD MediaInfo binary for IFO: {str(e)}")
-                    each['ifo_mi'] = MediaInfo.parse(os.path.basename(ifo), output='STRING', full=False).replace('\r\n', '\n')
+                    each['ifo_mi'] = MediaInfo.parse(ifo, output='STRING', full=False).replace(ifo, os.path.basename(ifo)).replace('\r\n', '\n')
 
                 try:
                     if platform.system() == "Windows":
@@ -602,8 +661,8 @@ class DiscParse():
             except Exception as e:
                 console.print(f"[yellow]Error using DVD MediaInfo binary, falling back to standard: {e}")
                 # Fallback to standard MediaInfo
-                each['vob_mi'] = MediaInfo.parse(os.path.basename(vob), output='STRING', full=False).replace('\r\n', '\n')
-                each['ifo_mi'] = MediaInfo.parse(os.path.basename(ifo), output='STRING', full=False).replace('\r\n', '\n')
+                each['vob_mi'] = MediaInfo.parse(vob, output='STRING', full=False).replace(vob, os.path.basename(vob)).replace('\r\n', '\n')
+                each['ifo_mi'] = MediaInfo.parse(ifo, output='STRING', full=False).replace(ifo, os.path.basename(ifo)).replace('\r\n', '\n')
                 each['vob_mi_full'] = MediaInfo.parse(vob, output='STRING', full=False).replace('\r\n', '\n')
                 each['ifo_mi_full'] = MediaInfo.parse(ifo, output='STRING', full=False).replace('\r\n', '\n')
 
@@ -620,7 +679,6 @@ class DiscParse():
         use_largest = int(self.config['DEFAULT'].get('use_largest_playlist', False))
         for each in discs:
             path = each.get('path')
-            os.chdir(path)
 
             try:
                 # Define the playlist path
@@ -1,4 +1,4 @@
-from guessit import guessit
+from src.nameparse import parse_name
 import os
 import re
 from src.console import console
@@ -253,7 +253,7 @@ async def get_edition(video, bdinfo, filelist, manual_edition, meta):
         if video.lower().startswith('dc'):
             video = video.lower().replace('dc', '', 1)
 
-        guess = guessit(video)
+        guess = parse_name(video)
         tag = guess.get('release_group', 'NOGROUP')
         if isinstance(tag, list):
             tag = " ".join(str(t) for t in tag)
@@ -261,7 +261,7 @@ async def get_edition(video, bdinfo, filelist, manual_edition, meta):
 
         if bdinfo is not None:
             try:
-                edition = guessit(bdinfo['label'])['edition']
+                edition = parse_name(bdinfo['label'])['edition']
             except Exception as e:
                 if meta['debug']:
                     print(f"BDInfo Edition Guess Error: {e}")
@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+from src.metacache import source_ttls
+
+# Built indexes, (source, series id): (event loop, built at, future of the EpisodeIndex)
+_indexes = {}
+
+
+class EpisodeIndex:
+    """
+    Every episode of one series from one source, looked up by (season, episode), absolute number or air date.
+    Episodes are dicts: season, episode, absolute, air_date and data (the episode as the source returned it).
+    """
+
+    def __init__(self, series, episodes):
+        self.series = series
+        self.episodes = episodes
+        self.by_number = {}
+        self.by_absolute = {}
+        self.by_air_date = {}
+        # Sources without absolute numbers count the regular seasons in order
+        if not any(ep['absolute'] for ep in episodes):
+            regular = sorted((ep for ep in episodes if ep['season'] and ep['episode'] is not None), key=lambda ep: (ep['season'], ep['episode']))
+            for number, ep in enumerate(regular, start=1):
+                ep['absolute'] = number
+        for ep in episodes:
+            if ep['season'] is not None and ep['episode'] is not None:
+                self.by_number.setdefault((ep['season'], ep['episode']), ep)
+            if ep['absolute'] and ep['season']:
+                self.by_absolute.setdefault(ep['absolute'], ep)
+            if ep['air_date']:
+                self.by_air_date.setdefault(str(ep['air_date'])[:10], []).append(ep)
+
+    def episode(self, season, episode):
+        try:
+            return self.by_number.get((int(season), int(episode)))
+        except (TypeError, ValueError):
+            return None
+
+    def absolute(self, number):
+        try:
+            return self.by_absolute.get(int(number))
+        except (TypeError, ValueError):
+            return None
+
+    def aired_on(self, air_date):
+        """Episodes that aired on a date (date, datetime or YYYY-MM-DD string)."""
+        return self.by_air_date.get(str(air_date)[:10], [])
+
+
+def index_episode(season, episode, absolute, air_date, data):
+    def number(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    return {'season': number(season), 'episode': number(episode), 'absolute': number(absolute), 'air_date': air_date or None, 'data': data}
+
+
+async def episode_index(source, series_id, build):
+    """
+    The EpisodeIndex of a series, built once with `await build()` (None when the series couldn't be fetched)
+    and reused by every episode lookup of the series for as long as the source's responses are cached.
+    The requests behind it go through the metadata cache, so a later run rebuilds it without asking the API again.
+    """
+    if not series_id or str(series_id) == '0':
+        return None
+    loop = asyncio.get_running_loop()
+    key = (source, str(series_id))
+    entry = _indexes.get(key)
+    if entry is None or entry[0] is not loop or time.time() - entry[1] > source_ttls.get(source, 86400):
+        entry = _indexes[key] = (loop, time.time(), asyncio.ensure_future(build()))
+
+        def forget_failed(future):
+            if (future.cancelled() or future.exception() is not None or future.result() is None) and _indexes.get(key) is entry:
+                del _indexes[key]
+        entry[2].add_done_callback(forget_failed)
+    try:
+        return await asyncio.shield(entry[2])
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return None
@@ -1,4 +1,7 @@
 from src.console import console
+from src.mediainfocache import get_cache
+from src.artifacts import get_store
+from src.profiling import traced
 from pymediainfo import MediaInfo
 import json
 import os
@@ -79,6 +82,60 @@ async def mi_resolution(res, guess, width, scan, height, actual_height):
     return resolution
 
 
+def parse_mediainfo(video):
+    """
+    Open the file with libmediainfo once and render both the text report and the full JSON
+    from that single parse, so headers on slow (network) storage are only read once.
+    Falls back to two MediaInfo.parse() calls if the library can't be driven directly.
+    """
+    try:
+        lib, handle, _, lib_version = MediaInfo._get_library()
+        try:
+            if lib_version >= (18, 3):
+                lib.MediaInfo_Option(handle, "Cover_Data", "")
+            lib.MediaInfo_Option(handle, "CharSet", "UTF-8")
+            lib.MediaInfo_Option(handle, "ParseSpeed", "0.5")
+            lib.MediaInfo_Option(handle, "LegacyStreamDisplay", "")
+            if lib.MediaInfo_Open(handle, video) == 0:
+                raise FileNotFoundError(video)
+            lib.MediaInfo_Option(handle, "Inform", "")
+            lib.MediaInfo_Option(handle, "Complete", "")
+            text = lib.MediaInfo_Inform(handle, 0)
+            lib.MediaInfo_Option(handle, "Inform", "JSON")
+            lib.MediaInfo_Option(handle, "Complete", "1")
+            json_text = lib.MediaInfo_Inform(handle, 0)
+            lib.MediaInfo_Close(handle)
+        finally:
+            lib.MediaInfo_Delete(handle)
+        json.loads(json_text)
+        return text, json_text
+    except Exception:
+        return MediaInfo.parse(video, output="STRING", full=False), MediaInfo.parse(video, output="JSON")
+
+
+def get_mediainfo_reports(video, debug=False):
+    """Text and JSON MediaInfo output for a file, from the persistent cache when the file is unchanged."""
+    cache = get_cache()
+    if cache is not None:
+        try:
+            cached = cache.get(video)
+        except OSError:
+            cached = None
+        if cached is not None:
+            if debug:
+                console.print(f"[green]Using cached MediaInfo for {os.path.basename(video)}")
+            return cached
+
+    text, json_text = parse_mediainfo(video)
+    if cache is not None:
+        try:
+            cache.set(video, text, json_text)
+        except Exception as e:
+            console.print(f"[yellow]Could not cache MediaInfo: {e}[/yellow]")
+    return text, json_text
+
+
+@traced('mediainfo')
 async def exportInfo(video, isdir, folder_id, base_dir, export_text, is_dvd=False, debug=False):
     def filter_mediainfo(data):
         filtered = {
@@ -261,11 +318,17 @@ async def exportInfo(video, isdir, folder_id, base_dir, export_text, is_dvd=Fals
         if platform.system() == "windows" and os.path.exists(mediainfo_binary):
             mediainfo_cmd = mediainfo_binary
 
-    if not os.path.exists(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt") and export_text:
+    store = get_store(base_dir, folder_id)
+    export_txt = not store.exists("MEDIAINFO.txt") and export_text
+    export_json = not store.exists("MediaInfo.json")
+    reports = None
+    if (export_txt or export_json) and not mediainfo_cmd:
+        # One parse (or cache hit) serves both outputs
+        reports = get_mediainfo_reports(video, debug)
+
+    if export_txt:
         if debug:
             console.print("[bold yellow]Exporting MediaInfo...")
-        if not isdir:
-            os.chdir(os.path.dirname(video))
 
         if mediainfo_cmd:
             import subprocess
@@ -281,7 +344,7 @@ async def exportInfo(video, isdir, folder_id, base_dir, export_text, is_dvd=Fals
                 console.print("[bold yellow]Falling back to standard MediaInfo...")
                 media_info = MediaInfo.parse(video, output="STRING", full=False)
         else:
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
+            media_info = reports[0]
 
         if isinstance(media_info, str):
             filtered_media_info = "\n".join(
@@ -294,14 +357,12 @@ async def exportInfo(video, isdir, folder_id, base_dir, export_text, is_dvd=Fals
                 if not line.strip().startswith("ReportBy") and not line.strip().startswith("Report created by ")
             )
 
-        with open(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt", 'w', newline="", encoding='utf-8') as export:
-            export.write(filtered_media_info.replace(video, os.path.basename(video)))
-        with open(f"{base_dir}/tmp/{folder_id}/MEDIAINFO_CLEANPATH.txt", 'w', newline="", encoding='utf-8') as export_cleanpath:
-            export_cleanpath.write(filtered_media_info.replace(video, os.path.basename(video)))
+        store.write_text("MEDIAINFO.txt", filtered_media_info.replace(video, os.path.basename(video)), newline="")
+        store.write_text("MEDIAINFO_CLEANPATH.txt", filtered_media_info.replace(video, os.path.basename(video)), newline="")
         if debug:
             console.print("[bold green]MediaInfo Exported.")
 
-    if not os.path.exists(f"{base_dir}/tmp/{folder_id}/MediaInfo.json"):
+    if export_json:
         if mediainfo_cmd:
             import subprocess
             try:
@@ -318,17 +379,12 @@ async def exportInfo(video, isdir, folder_id, base_dir, export_text, is_dvd=Fals
                 media_info_json = MediaInfo.parse(video, output="JSON")
                 media_info_dict = json.loads(media_info_json)
         else:
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
+            media_info_dict = json.loads(reports[1])
 
         filtered_info = filter_mediainfo(media_info_dict)
-        with open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", 'w', encoding='utf-8') as export:
-            json.dump(filtered_info, export, indent=4)
-
-    with open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", 'r', encoding='utf-8') as f:
-        mi = json.load(f)
+        store.write_json("MediaInfo.json", filtered_info)
 
-    return mi
+    return store.read_json("MediaInfo.json")
 
 
 def validate_mediainfo(base_dir, folder_id, path, filelist, debug):
@@ -344,17 +400,16 @@ def validate_mediainfo(base_dir, folder_id, path, filelist, debug):
         console.print(f"[cyan]Validating MediaInfo at: {mediainfo_path}")
 
     try:
-        with open(mediainfo_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip() == "General":
-                    in_general = True
-                    continue
-                if in_general:
-                    if line.strip() == "":
-                        break
-                    if line.strip().startswith("Unique ID"):
-                        unique_id = line.split(":", 1)[1].strip()
-                        break
+        for line in get_store(base_dir, folder_id).read_text("MEDIAINFO.txt").splitlines():
+            if line.strip() == "General":
+                in_general = True
+                continue
+            if in_general:
+                if line.strip() == "":
+                    break
+                if line.strip().startswith("Unique ID"):
+                    unique_id = line.split(":", 1)[1].strip()
+                    break
     except FileNotFoundError:
         console.print(f"[red]MediaInfo file not found: {mediainfo_path}[/red]")
         return False
@@ -3,8 +3,10 @@ import urllib.parse
 import requests
 import glob
 from src.console import console
+from src.profiling import traced
 
 
+@traced()
 async def gen_desc(meta):
     def clean_text(text):
         return text.replace('\r\n', '').replace('\n', '').strip()
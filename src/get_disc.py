@@ -1,8 +1,11 @@
 import os
 import itertools
 from src.discparse import DiscParse
+from src.artifacts import artifacts
+from src.profiling import traced
 
 
+@traced()
 async def get_disc(meta):
     is_disc = None
     videoloc = meta['path']
@@ -51,17 +54,11 @@ async def get_disc(meta):
             discs, bdinfo = await parse.get_bdinfo(meta, meta['discs'], meta['uuid'], meta['base_dir'], meta['discs'])
     elif is_disc == "DVD":
         discs = await parse.get_dvdinfo(discs, base_dir=meta['base_dir'])
-        export = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'w', newline="", encoding='utf-8')
-        export.write(discs[0]['ifo_mi'])
-        export.close()
-        export_clean = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'w', newline="", encoding='utf-8')
-        export_clean.write(discs[0]['ifo_mi'])
-        export_clean.close()
+        artifacts(meta).write_text("MEDIAINFO.txt", discs[0]['ifo_mi'], newline="")
+        artifacts(meta).write_text("MEDIAINFO_CLEANPATH.txt", discs[0]['ifo_mi'], newline="")
     elif is_disc == "HDDVD":
         discs = await parse.get_hddvd_info(discs, meta)
-        export = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'w', newline="", encoding='utf-8')
-        export.write(discs[0]['evo_mi'])
-        export.close()
+        artifacts(meta).write_text("MEDIAINFO.txt", discs[0]['evo_mi'], newline="")
     discs = sorted(discs, key=lambda d: d['name'])
     return is_disc, videoloc, bdinfo, discs
 
@@ -1,6 +1,8 @@
 from src.console import console
+from src.profiling import traced
 
 
+@traced()
 async def get_name(meta):
     type = meta.get('type', "").upper()
     title = meta.get('title', "")
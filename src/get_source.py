@@ -1,16 +1,15 @@
-import json
 import traceback
-from guessit import guessit
+from src.nameparse import parse_name
 from pymediainfo import MediaInfo
 from src.console import console
+from src.artifacts import get_store
 from src.exceptions import *  # noqa: F403
 
 
 async def get_source(type, video, path, is_disc, meta, folder_id, base_dir):
     if not meta.get('is_disc') == "BDMV":
         try:
-            with open(f'{base_dir}/tmp/{folder_id}/MediaInfo.json', 'r', encoding='utf-8') as f:
-                mi = json.load(f)
+            mi = get_store(base_dir, folder_id).read_json("MediaInfo.json")
         except Exception:
             if meta['debug']:
                 console.print("No mediainfo.json")
@@ -19,10 +18,10 @@ async def get_source(type, video, path, is_disc, meta, folder_id, base_dir):
             source = meta['manual_source']
         else:
             try:
-                source = guessit(video)['source']
+                source = parse_name(video)['source']
             except Exception:
                 try:
-                    source = guessit(path)['source']
+                    source = parse_name(path)['source']
                 except Exception:
                     source = "BluRay"
         if source in ("Blu-ray", "Ultra HD Blu-ray", "BluRay", "BR") or is_disc == "BDMV":
@@ -43,7 +42,7 @@ async def get_source(type, video, path, is_disc, meta, folder_id, base_dir):
                     raise WeirdSystem  # noqa: F405
             except Exception:
                 try:
-                    other = guessit(video)['other']
+                    other = parse_name(video)['other']
                     if "PAL" in other:
                         system = "PAL"
                     elif "NTSC" in other:
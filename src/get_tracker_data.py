@@ -6,10 +6,12 @@ from src.trackermeta import update_metadata_from_tracker
 from src.btnid import get_btn_torrents
 from src.clients import Clients
 from src.trackersetup import tracker_class_map
+from src.profiling import traced
 
 client = Clients(config=config)
 
 
+@traced()
 async def get_tracker_data(video, meta, search_term=None, search_file_folder=None, cat=None):
     only_id = config['DEFAULT'].get('only_id', False) if meta.get('onlyID') is None else meta.get('onlyID')
     meta['only_id'] = only_id
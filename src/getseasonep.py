@@ -1,6 +1,5 @@
 from src.console import console
-from guessit import guessit
-import anitopy
+from src.nameparse import parse_name, parse_anime, guess_field, guess_year, title_options
 from pathlib import Path
 import asyncio
 import requests
@@ -9,8 +8,10 @@ import re
 from difflib import SequenceMatcher
 from src.tmdb import get_tmdb_id, daily_to_tmdb_season_episode, get_romaji
 from src.exceptions import *  # noqa: F403
+from src.profiling import traced
 
 
+@traced()
 async def get_season_episode(video, meta):
     if meta['category'] == 'TV':
         filelist = meta['filelist']
@@ -26,7 +27,7 @@ async def get_season_episode(video, meta):
                     if meta.get('manual_date') is None and daily_match is not None:
                         meta['manual_date'] = daily_match.group().replace('.', '-')
                     is_daily = True
-                    guess_date = meta.get('manual_date', guessit(video).get('date')) if meta.get('manual_date') else guessit(video).get('date')
+                    guess_date = meta.get('manual_date', parse_name(video).get('date')) if meta.get('manual_date') else parse_name(video).get('date')
                     season_int, episode_int = await daily_to_tmdb_season_episode(meta.get('tmdb_id'), guess_date)
 
                     season = f"S{str(season_int).zfill(2)}"
@@ -36,20 +37,18 @@ async def get_season_episode(video, meta):
                     meta['daily_episode_title'] = meta.get('manual_date')
 
                 else:
+                    year = guess_year(video) or ""
                     try:
-                        guess_year = guessit(video)['year']
-                    except Exception:
-                        guess_year = ""
-                    try:
-                        if guessit(video)["season"] == guess_year:
-                            if f"s{guessit(video)['season']}" in video.lower():
-                                season_int = str(guessit(video)["season"])
+                        guess_season = parse_name(video)["season"]
+                        if guess_season == year:
+                            if f"s{guess_season}" in video.lower():
+                                season_int = str(guess_season)
                                 season = "S" + season_int.zfill(2)
                             else:
                                 season_int = "1"
                                 season = "S01"
                         else:
-                            season_int = str(guessit(video)["season"])
+                            season_int = str(guess_season)
                             season = "S" + season_int.zfill(2)
                     except Exception:
                         console.print("[bold yellow]There was an error guessing the season number. Guessing S01. Use [bold green]--season #[/bold green] to correct if needed")
@@ -65,10 +64,10 @@ async def get_season_episode(video, meta):
                 if is_daily is not True:
                     episodes = ""
                     if len(filelist) == 1:
-                        episodes = guessit(video)['episode']
+                        episodes = parse_name(video)['episode']
                         if isinstance(episodes, list):
                             episode = ""
-                            for item in guessit(video)["episode"]:
+                            for item in episodes:
                                 ep = (str(item).zfill(2))
                                 episode += f"E{ep}"
                             episode_int = episodes[0]
@@ -88,24 +87,24 @@ async def get_season_episode(video, meta):
             # If Anime
             # if the mal id is set, then we've already run get_romaji in tmdb.py
             if meta.get('mal_id') == 0 and meta['category'] == "TV":
-                parsed = anitopy.parse(Path(video).name)
+                parsed = parse_anime(Path(video).name)
                 romaji, mal_id, eng_title, seasonYear, anilist_episodes, meta['demographic'] = await get_romaji(parsed['anime_title'], meta.get('mal_id', 0))
                 if mal_id:
                     meta['mal_id'] = mal_id
                 if meta.get('tmdb_id') == 0:
                     year = parsed.get('anime_year', str(seasonYear))
-                    meta = await get_tmdb_id(guessit(parsed['anime_title'], {"excludes": ["country", "language"]})['title'], year, meta, meta['category'])
+                    meta = await get_tmdb_id(parse_name(parsed['anime_title'], title_options)['title'], year, meta, meta['category'])
                 # meta = await tmdb_other_meta(meta)
             if meta.get('mal_id') != 0 and meta['category'] == "TV":
-                parsed = anitopy.parse(Path(video).name)
+                parsed = parse_anime(Path(video).name)
                 tag = parsed.get('release_group', "")
                 if tag != "" and meta.get('tag') is None:
                     meta['tag'] = f"-{tag}"
                 if len(filelist) == 1:
                     try:
-                        episodes = parsed.get('episode_number', guessit(video).get('episode', '1'))
+                        episodes = parsed.get('episode_number', guess_field(video, 'episode', '1'))
                         if not isinstance(episodes, list) and not episodes.isnumeric():
-                            episodes = guessit(video)['episode']
+                            episodes = parse_name(video)['episode']
                         if isinstance(episodes, list):
                             episode_int = int(episodes[0])  # Always convert to integer
                             episode = "".join([f"E{str(int(item)).zfill(2)}" for item in episodes])
@@ -150,7 +149,7 @@ async def get_season_episode(video, meta):
                     if meta.get('season_int'):
                         season_int = int(meta.get('season_int'))  # Convert to integer
                     else:
-                        season = parsed.get('anime_season', guessit(video).get('season', '1'))
+                        season = parsed.get('anime_season', parse_name(video).get('season', '1'))
                         season_int = int(season)  # Convert to integer
                     season = f"S{str(season_int).zfill(2)}"
                 except Exception:
@@ -207,7 +206,7 @@ async def get_season_episode(video, meta):
                         if meta['debug']:
                             console.print_exception()
                         try:
-                            season = guessit(video).get('season', '1')
+                            season = parse_name(video).get('season', '1')
                             season_int = int(season)  # Convert to integer
                         except Exception:
                             season_int = 1  # Default to 1 if error occurs
@@ -242,7 +241,7 @@ async def get_season_episode(video, meta):
         # Guess the part of the episode (if available)
         meta['part'] = ""
         if meta['tv_pack'] == 1:
-            part = guessit(os.path.dirname(video)).get('part')
+            part = parse_name(os.path.dirname(video)).get('part')
             meta['part'] = f"Part {part}" if part else ""
 
     return meta
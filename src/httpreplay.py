@@ -0,0 +1,152 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import urlencode, urlsplit, parse_qsl
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.console import console
+
+# Query params that carry credentials, never stored or part of the match key
+secret_params = {'api_key', 'apikey', 'api_token', 'token', 'key', 'passkey', 'auth'}
+# Headers that describe the wire encoding rather than the (decoded) stored body
+dropped_headers = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+
+def request_keys(method, url, body):
+    """
+    Match keys from most to least specific: the exact request (body included), the URL with its
+    (non secret) query, and the endpoint alone. Uploads with changing bodies still match an endpoint.
+    """
+    parts = urlsplit(str(url))
+    params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in secret_params)
+    endpoint = f"{method} {parts.scheme}://{parts.netloc.lower()}{parts.path}"
+    query = f"{endpoint}?{urlencode(params)}"
+    digest = hashlib.sha1(body or b"").hexdigest()
+    return [f"{query}#{digest}", query, endpoint]
+
+
+class Cassette:
+    """
+    Recorded HTTP interactions for replaying a run without the network.
+    Responses for the same key are replayed in recorded order, the last one repeats.
+    """
+
+    def __init__(self, path, mode):
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.interactions = []
+        self.positions = {}
+        self.misses = []
+        if mode == 'replay':
+            with open(path, 'r', encoding='utf-8') as f:
+                self.interactions = json.load(f)['interactions']
+
+    def record(self, method, url, body, status, headers, content):
+        keys = request_keys(method, url, body)
+        entry = {
+            'keys': keys,
+            'status': status,
+            'headers': [[k, v] for k, v in headers if k.lower() not in dropped_headers],
+            'body': base64.b64encode(content).decode('ascii'),
+        }
+        with self.lock:
+            self.interactions.append(entry)
+
+    def find(self, method, url, body):
+        with self.lock:
+            for level, key in enumerate(request_keys(method, url, body)):
+                matches = [entry for entry in self.interactions if entry['keys'][level] == key]
+                if matches:
+                    position = self.positions.get(key, 0)
+                    self.positions[key] = position + 1
+                    entry = matches[min(position, len(matches) - 1)]
+                    return entry['status'], entry['headers'], base64.b64decode(entry['body'])
+            self.misses.append(f"{method} {urlsplit(str(url))._replace(query='').geturl()}")
+        return None
+
+    def save(self):
+        if self.mode != 'record':
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'interactions': self.interactions}, f)
+
+
+_cassette = None
+
+
+def use_cassette(path, mode):
+    """Record ('record') or replay ('replay') every pooled HTTP session of this process through `path`."""
+    global _cassette
+    _cassette = Cassette(path, mode)
+    return _cassette
+
+
+def active_cassette():
+    return _cassette
+
+
+def missing_response(request_url):
+    console.print(f"[yellow]No recorded response for {urlsplit(str(request_url))._replace(query='').geturl()}")
+    return 599, [('content-type', 'application/json')], b'{}'
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records responses to, or serves them from, the active cassette."""
+
+    def __init__(self, cassette, transport):
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        body = await request.aread()
+        if self.cassette.mode == 'replay':
+            found = self.cassette.find(request.method, request.url, body)
+            status, headers, content = found or missing_response(request.url)
+            return httpx.Response(status, headers=headers, content=content, request=request)
+
+        response = await self.transport.handle_async_request(request)
+        content = await response.aread()
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in dropped_headers]
+        self.cassette.record(request.method, request.url, body, response.status_code, headers, content)
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request, extensions=response.extensions)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """requests adapter doing the same for the pooled requests sessions."""
+
+    def __init__(self, cassette, **kwargs):
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        elif not isinstance(body, (bytes, type(None))):
+            body = None  # streamed bodies only match on the endpoint
+        if self.cassette.mode == 'replay':
+            found = self.cassette.find(request.method, request.url, body)
+            status, headers, content = found or missing_response(request.url)
+            response = requests.Response()
+            response.status_code = status
+            response.headers.update(headers)
+            response._content = content
+            response.url = request.url
+            response.request = request
+            response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+            return response
+
+        response = super().send(request, **kwargs)
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in dropped_headers]
+        self.cassette.record(request.method, request.url, body, response.status_code, headers, response.content)
+        return response
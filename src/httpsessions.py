@@ -0,0 +1,167 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.httpreplay import ReplayAdapter, ReplayTransport, active_cassette
+from src.profiling import span
+
+try:
+    import h2  # noqa F401
+    http2_available = True
+except ImportError:
+    http2_available = False
+
+# Uniform policy for every tracker/API host
+max_connections_per_host = 4
+connect_retries = 2
+api_timeout = httpx.Timeout(10.0, connect=10.0)
+upload_timeout = (10, 120)  # (connect, read) for blocking uploads run off the event loop
+
+_async_sessions = {}
+_sync_sessions = {}
+_sync_lock = threading.Lock()
+
+
+def host_key(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def get_named_session(name, factory):
+    """
+    Return the shared httpx.AsyncClient registered under `name`, creating it with `factory()`
+    on first use (or when the previous one belongs to a closed event loop).
+    """
+    loop = asyncio.get_running_loop()
+    entry = _async_sessions.get(name)
+    if entry is not None:
+        session_loop, session = entry
+        if session_loop is loop and not session.is_closed:
+            return session
+
+    session = factory()
+    _async_sessions[name] = (loop, session)
+    return session
+
+
+class TracedTransport(httpx.AsyncBaseTransport):
+    """Records every request as an http span when --profile is used (method and host only, never the path)."""
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        with span(f"{request.method} {request.url.host}", cat='http'):
+            return await self.transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def pooled_transport(max_connections=max_connections_per_host):
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2_available,
+        retries=connect_retries,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+    cassette = active_cassette()
+    if cassette is not None:
+        transport = ReplayTransport(cassette, transport)
+    return TracedTransport(transport)
+
+
+def get_async_session(url):
+    """
+    Return the shared httpx.AsyncClient for the host of `url`.
+    Clients are created on first use and keep their connections alive for the rest of the run.
+    """
+    return get_named_session(
+        host_key(url),
+        lambda: httpx.AsyncClient(transport=pooled_transport(), timeout=api_timeout, follow_redirects=False)
+    )
+
+
+@asynccontextmanager
+async def shared_session(url):
+    """
+    Drop-in for `async with httpx.AsyncClient() as client:` that reuses the host's pooled client
+    instead of opening (and closing) a new one.
+    """
+    yield get_async_session(url)
+
+
+def cookie_headers(cookies, headers=None):
+    """
+    Request headers sending a tracker's login cookies, so cookie authenticated requests can go
+    through the host's shared client without putting the cookies into its jar.
+    """
+    headers = dict(headers or {})
+    if cookies:
+        headers['Cookie'] = '; '.join(f"{name}={value}" for name, value in cookies.items())
+    return headers
+
+
+def get_sync_session(url):
+    """Return the shared requests.Session for the host of `url`."""
+    key = host_key(url)
+    with _sync_lock:
+        session = _sync_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=connect_retries,
+                connect=connect_retries,
+                read=0,
+                status=0,
+                backoff_factor=0.5,
+                allowed_methods=None,
+            )
+            cassette = active_cassette()
+            if cassette is not None:
+                adapter = ReplayAdapter(cassette, pool_connections=1, pool_maxsize=max_connections_per_host, max_retries=retry)
+            else:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections_per_host, max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sync_sessions[key] = session
+        return session
+
+
+async def session_request(method, url, **kwargs):
+    """
+    Run a requests call through the host's pooled session in a worker thread,
+    so multipart uploads keep requests' form encoding without blocking the event loop.
+    """
+    kwargs.setdefault('timeout', upload_timeout)
+    session = get_sync_session(url)
+    with span(f"{method} {urlparse(url).hostname}", cat='http'):
+        return await asyncio.to_thread(session.request, method, url, **kwargs)
+
+
+async def session_get(url, **kwargs):
+    return await session_request("GET", url, **kwargs)
+
+
+async def session_post(url, **kwargs):
+    return await session_request("POST", url, **kwargs)
+
+
+async def close_sessions():
+    """Close every pooled session, called once when the run is finished."""
+    for session_loop, session in list(_async_sessions.values()):
+        if not session.is_closed:
+            try:
+                await session.aclose()
+            except Exception:
+                pass
+    _async_sessions.clear()
+    with _sync_lock:
+        for session in _sync_sessions.values():
+            session.close()
+        _sync_sessions.clear()
@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from data.config import config
+from src.console import console
+from src.httpsessions import shared_session
+
+cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache")
+
+# Cached URLs older than this are checked with a HEAD request before being reused
+verify_after = float(config['DEFAULT'].get('image_url_verify_days', 7)) * 86400
+
+
+class ImageUrlCache:
+    """
+    SQLite index of uploaded images keyed by the SHA256 of the file and the image host,
+    so identical screenshots are never uploaded to the same host twice.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS images ("
+            "hash TEXT, host TEXT, img_url TEXT, raw_url TEXT, web_url TEXT, uploaded REAL, verified REAL, "
+            "PRIMARY KEY (hash, host))"
+        )
+        self.db.commit()
+
+    def get(self, image_hash, host):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT img_url, raw_url, web_url, verified FROM images WHERE hash = ? AND host = ?", (image_hash, host)
+            ).fetchone()
+        if row is None:
+            return None
+        img_url, raw_url, web_url, verified = row
+        return {'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url, 'verified': verified}
+
+    def set(self, image_hash, host, img_url, raw_url, web_url):
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO images (hash, host, img_url, raw_url, web_url, uploaded, verified) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (image_hash, host, img_url, raw_url, web_url, now, now)
+            )
+            self.db.commit()
+
+    def mark_verified(self, image_hash, host):
+        with self.lock:
+            self.db.execute("UPDATE images SET verified = ? WHERE hash = ? AND host = ?", (time.time(), image_hash, host))
+            self.db.commit()
+
+    def delete(self, image_hash, host):
+        with self.lock:
+            self.db.execute("DELETE FROM images WHERE hash = ? AND host = ?", (image_hash, host))
+            self.db.commit()
+
+
+_cache = None
+
+
+def get_cache():
+    global _cache
+    if not config['DEFAULT'].get('image_url_cache', True):
+        return None
+    if _cache is None:
+        try:
+            _cache = ImageUrlCache(os.path.join(cache_dir, "images.sqlite"))
+        except Exception as e:
+            console.print(f"[yellow]Image URL cache unavailable: {e}[/yellow]")
+            return None
+    return _cache
+
+
+def hash_file(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1024 * 1024):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+async def image_hash(path):
+    try:
+        return await asyncio.to_thread(hash_file, path)
+    except OSError:
+        return None
+
+
+async def url_still_exists(url):
+    """Only a definite "gone" answer invalidates a cached URL, network trouble keeps it."""
+    try:
+        async with shared_session(url) as client:
+            response = await client.head(url, follow_redirects=True)
+        return response.status_code not in (404, 410)
+    except Exception:
+        return True
+
+
+async def lookup_image(image, host, meta):
+    """Return a successful upload result for an identical image already on `host`, or None."""
+    cache = get_cache()
+    if cache is None:
+        return None
+    digest = await image_hash(image)
+    if digest is None:
+        return None
+    cached = cache.get(digest, host)
+    if cached is None:
+        return None
+
+    if time.time() - (cached['verified'] or 0) > verify_after:
+        if not await url_still_exists(cached['raw_url']):
+            if meta.get('debug'):
+                console.print(f"[yellow]Cached image URL {cached['raw_url']} is gone, uploading again")
+            cache.delete(digest, host)
+            return None
+        cache.mark_verified(digest, host)
+
+    if meta.get('debug'):
+        console.print(f"[green]Reusing {host} upload of {os.path.basename(image)}: {cached['raw_url']}")
+    return {
+        'status': 'success',
+        'img_url': cached['img_url'],
+        'raw_url': cached['raw_url'],
+        'web_url': cached['web_url'],
+        'local_file_path': image
+    }
+
+
+async def remember_image(image, host, result):
+    cache = get_cache()
+    if cache is None or result.get('status') != 'success':
+        return
+    digest = await image_hash(image)
+    if digest is not None:
+        cache.set(digest, host, result['img_url'], result['raw_url'], result['web_url'])
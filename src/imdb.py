@@ -1,4 +1,6 @@
 from src.console import console
+from src.metacache import cached_session
+from src.profiling import traced
 import json
 import httpx
 from datetime import datetime
@@ -33,7 +35,7 @@ async def get_imdb_aka_api(imdb_id, manual_language=None):
         """
     }
 
-    async with httpx.AsyncClient() as client:
+    async with cached_session('imdb') as client:
         try:
             response = await client.post("https://api.graphql.imdb.com/", json=query, headers={"Content-Type": "application/json"}, timeout=10)
             response.raise_for_status()
@@ -85,6 +87,7 @@ async def safe_get(data, path, default=None):
     return data
 
 
+@traced()
 async def get_imdb_info_api(imdbID, manual_language=None, debug=False):
     imdb_info = {}
 
@@ -295,7 +298,7 @@ async def get_imdb_info_api(imdbID, manual_language=None, debug=False):
         """
     }
 
-    async with httpx.AsyncClient() as client:
+    async with cached_session('imdb') as client:
         try:
             response = await client.post("https://api.graphql.imdb.com/", json=query, headers={"Content-Type": "application/json"}, timeout=10)
             response.raise_for_status()
@@ -421,6 +424,7 @@ async def get_imdb_info_api(imdbID, manual_language=None, debug=False):
     return imdb_info
 
 
+@traced()
 async def search_imdb(filename, search_year, quickie=False, category=None, debug=False, secondary_title=None, path=None):
     if secondary_title is not None:
         filename = secondary_title
@@ -487,7 +491,7 @@ async def search_imdb(filename, search_year, quickie=False, category=None, debug
     }
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with cached_session('imdb') as client:
             response = await client.post(url, json=query, headers={"Content-Type": "application/json"}, timeout=10)
             response.raise_for_status()
             data = response.json()
@@ -3,8 +3,10 @@ import re
 import urllib.parse
 import requests
 from src.console import console
+from src.profiling import traced
 
 
+@traced()
 async def is_scene(video, meta, imdb=None, lower=False):
     scene = False
     is_all_lowercase = False
@@ -1,20 +1,18 @@
-import aiofiles
-import os
 import cli_ui
 import re
 from src.console import console
+from src.artifacts import artifacts
 
 
 async def parsed_mediainfo(meta):
     try:
-        mediainfo_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt"
-        if os.path.exists(mediainfo_file):
-            async with aiofiles.open(mediainfo_file, 'r', encoding='utf-8') as f:
-                mediainfo_content = await f.read()
+        return artifacts(meta).load('MEDIAINFO.txt', parse_mediainfo_text)
     except Exception as e:
         console.print(f"[red]Error reading MEDIAINFO file: {e}[/red]")
         return {}
 
+
+def parse_mediainfo_text(mediainfo_content):
     parsed_data = {
         'general': {},
         'video': [],
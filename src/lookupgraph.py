@@ -0,0 +1,85 @@
+import asyncio
+
+from src.console import console
+from src.profiling import span
+
+
+class Lookup:
+    """
+    One step of metadata resolution.
+    run: coroutine function doing the lookup and writing its results into meta
+    needs: names of the lookups that have to finish first (the ones producing its inputs)
+    when: checked once the needs are done, the lookup is skipped when it returns False
+    answered: True once another source already gave what this lookup is after, it is then
+        skipped or cancelled while running, so it must only write meta after its last await
+    interactive: may ask the user something, interactive lookups never run at the same time
+    """
+
+    def __init__(self, name, run, needs=(), when=None, answered=None, interactive=False):
+        self.name = name
+        self.run = run
+        self.needs = set(needs)
+        self.when = when
+        self.answered = answered
+        self.interactive = interactive
+
+
+async def resolve(lookups, unattended=False, debug=False):
+    """
+    Run every lookup as soon as the lookups it needs have finished, so the total time
+    follows the longest chain of dependent lookups instead of the sum of all of them.
+    """
+    pending = {lookup.name: lookup for lookup in lookups}
+    unknown = {need for lookup in lookups for need in lookup.needs} - set(pending)
+    if unknown:
+        raise ValueError(f"Lookups need unknown lookups: {', '.join(sorted(unknown))}")
+    finished = set()
+    running = {}
+    cancelled = set()
+    prompt_lock = asyncio.Lock()
+
+    async def run(lookup):
+        with span(lookup.name, cat='lookup'):
+            if lookup.interactive and not unattended:
+                async with prompt_lock:
+                    await lookup.run()
+            else:
+                await lookup.run()
+
+    try:
+        while pending or running:
+            launched = True
+            while launched:
+                launched = False
+                for name, lookup in list(pending.items()):
+                    if not lookup.needs <= finished:
+                        continue
+                    del pending[name]
+                    launched = True
+                    if (lookup.when and not lookup.when()) or (lookup.answered and lookup.answered()):
+                        finished.add(name)
+                    else:
+                        running[asyncio.create_task(run(lookup))] = lookup
+            if not running:
+                if pending:
+                    raise ValueError(f"Lookups can never run: {', '.join(pending)}")
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                lookup = running.pop(task)
+                cancelled.discard(task)
+                finished.add(lookup.name)
+                if not task.cancelled():
+                    task.result()
+            for task, lookup in running.items():
+                if lookup.answered and task not in cancelled and lookup.answered():
+                    if debug:
+                        console.print(f"[cyan]{lookup.name} lookup no longer needed, cancelling it")
+                    task.cancel()
+                    cancelled.add(task)
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
@@ -0,0 +1,85 @@
+import os
+import sqlite3
+import threading
+import time
+
+from data.config import config
+from src.console import console
+
+cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache")
+
+
+class MediaInfoCache:
+    """
+    SQLite store of MediaInfo reports (text and JSON) keyed by (path, size, mtime),
+    so preparing the same file again never has to run MediaInfo.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS mediainfo ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, text TEXT, json TEXT, accessed REAL)"
+        )
+        self.db.commit()
+
+    @staticmethod
+    def file_key(video):
+        st = os.stat(video)
+        return os.path.realpath(video), st.st_size, st.st_mtime_ns
+
+    def get(self, video):
+        path, size, mtime = self.file_key(video)
+        with self.lock:
+            row = self.db.execute(
+                "SELECT text, json FROM mediainfo WHERE path = ? AND size = ? AND mtime = ?", (path, size, mtime)
+            ).fetchone()
+            if row is None:
+                return None
+            self.db.execute("UPDATE mediainfo SET accessed = ? WHERE path = ?", (time.time(), path))
+            self.db.commit()
+        return row
+
+    def set(self, video, text, json_text):
+        path, size, mtime = self.file_key(video)
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO mediainfo (path, size, mtime, text, json, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (path, size, mtime, text, json_text, time.time())
+            )
+            self.evict()
+            self.db.commit()
+
+    def evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(LENGTH(text) + LENGTH(json)), 0) FROM mediainfo").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for path, size in self.db.execute(
+            "SELECT path, LENGTH(text) + LENGTH(json) FROM mediainfo ORDER BY accessed ASC"
+        ).fetchall():
+            if total <= target:
+                break
+            self.db.execute("DELETE FROM mediainfo WHERE path = ?", (path,))
+            total -= size
+
+
+_cache = None
+
+
+def get_cache():
+    global _cache
+    if not config['DEFAULT'].get('mediainfo_cache', True):
+        return None
+    if _cache is None:
+        try:
+            max_mb = int(config['DEFAULT'].get('mediainfo_cache_size', 50))
+            _cache = MediaInfoCache(os.path.join(cache_dir, "mediainfo.sqlite"), max_mb * 1024 * 1024)
+        except Exception as e:
+            console.print(f"[yellow]MediaInfo cache unavailable: {e}[/yellow]")
+            return None
+    return _cache
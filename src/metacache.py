@@ -0,0 +1,226 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlencode
+
+import httpx
+
+from data.config import config
+from src.console import console
+from src.httpsessions import api_timeout, get_named_session, pooled_transport
+
+cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache")
+
+# How long a successful response is reused, per metadata source
+source_ttls = {
+    'tmdb': 7 * 86400,
+    'imdb': 7 * 86400,
+    'tvdb': 86400,
+    'tvmaze': 86400,
+}
+# How long a "not found" response is reused
+negative_ttl = 6 * 3600
+# Only these sources send lookups as POST (GraphQL), everything else only caches GET
+post_sources = {'imdb'}
+# Query params that carry credentials, never part of the cache key
+secret_params = {'api_key', 'apikey', 'api_token', 'token'}
+# Headers that describe the wire encoding rather than the (decoded) cached body
+dropped_headers = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+# Lookups remembered in memory for the current job
+max_flights = 1024
+
+
+class MetadataCache:
+    """
+    SQLite backed response cache for metadata APIs, keyed by source, endpoint and parameters.
+    Successful and "not found" responses are stored, least recently used entries are evicted
+    once the database grows past the configured size.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.writes = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, source TEXT, status INTEGER, headers TEXT, body BLOB, "
+            "created REAL, accessed REAL, size INTEGER)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self.db.commit()
+
+    def get(self, key, source):
+        now = time.time()
+        with self.lock:
+            row = self.db.execute("SELECT status, headers, body, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            status, headers, body, created = row
+            ttl = source_ttls.get(source, 86400) if status == 200 else negative_ttl
+            if now - created > ttl:
+                self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.db.commit()
+                return None
+            self.db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.db.commit()
+        return status, json.loads(headers), body
+
+    def set(self, key, source, status, headers, body):
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses (key, source, status, headers, body, created, accessed, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, source, status, json.dumps(headers), body, now, now, len(body))
+            )
+            self.db.commit()
+            self.writes += 1
+            if self.writes % 50 == 1:
+                self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until the cache is back under 90% of its size limit."""
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for key, size in self.db.execute("SELECT key, size FROM responses ORDER BY accessed ASC").fetchall():
+            if total <= target:
+                break
+            self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+        self.db.commit()
+
+
+_cache = None
+
+
+def get_cache():
+    global _cache
+    if not config['DEFAULT'].get('metadata_cache', True):
+        return None
+    if _cache is None:
+        try:
+            max_mb = int(config['DEFAULT'].get('metadata_cache_size', 200))
+            _cache = MetadataCache(os.path.join(cache_dir, "metadata.sqlite"), max_mb * 1024 * 1024)
+        except Exception as e:
+            console.print(f"[yellow]Metadata cache unavailable: {e}[/yellow]")
+            return None
+    return _cache
+
+
+def should_cache(source, status, body):
+    if status not in (200, 404):
+        return False
+    if source == 'tvdb' and status == 200:
+        # TVDb answers expired tokens with a 200 and an error body
+        try:
+            return json.loads(body).get('status') == 'success'
+        except Exception:
+            return False
+    return True
+
+
+def cache_key(source, request):
+    params = sorted((k, v) for k, v in request.url.params.multi_items() if k.lower() not in secret_params)
+    key = f"{source}:{request.method}:{request.url.scheme}://{request.url.host}{request.url.path}?{urlencode(params)}"
+    if request.method == "POST":
+        key += f"#{request.content.decode('utf-8', errors='replace')}"
+    return key
+
+
+# Lookups of the current job on the current event loop, cache key: future of (status, headers, body, reusable)
+_flights = {}
+_flights_loop = None
+
+
+def reset_flights():
+    """Forget the lookups of the previous job, called when a job starts."""
+    _flights.clear()
+
+
+def current_flights():
+    global _flights_loop
+    loop = asyncio.get_running_loop()
+    if _flights_loop is not loop:
+        _flights.clear()
+        _flights_loop = loop
+    return _flights
+
+
+def finish_flight(key, flight):
+    # Failed lookups (errors, rate limits, expired tokens) are sent again by the next caller
+    failed = flight.cancelled() or flight.exception() is not None or not flight.result()[3]
+    if failed and _flights.get(key) is flight:
+        del _flights[key]
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that serves repeated metadata lookups from the persistent cache.
+    Identical lookups made while one is in flight wait for it instead of going out again,
+    and answered lookups are reused from memory for the rest of the job.
+    """
+
+    def __init__(self, source, transport):
+        self.source = source
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        cacheable = request.method == "GET" or (request.method == "POST" and self.source in post_sources)
+        if not cacheable:
+            return await self.transport.handle_async_request(request)
+
+        await request.aread()
+        key = cache_key(self.source, request)
+        flights = current_flights()
+        flight = flights.get(key)
+        if flight is None:
+            if len(flights) >= max_flights:
+                for old in [k for k, f in flights.items() if f.done()][:max_flights // 4]:
+                    del flights[old]
+            flight = flights[key] = asyncio.ensure_future(self.fetch(key, request))
+            flight.add_done_callback(lambda f: finish_flight(key, f))
+        # A caller giving up doesn't cancel the lookup the others are waiting for
+        status, headers, body, _ = await asyncio.shield(flight)
+        return httpx.Response(status, headers=headers, content=body, request=request)
+
+    async def fetch(self, key, request):
+        cache = get_cache()
+        if cache is not None:
+            cached = cache.get(key, self.source)
+            if cached is not None:
+                return (*cached, True)
+
+        response = await self.transport.handle_async_request(request)
+        body = await response.aread()
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in dropped_headers]
+        reusable = should_cache(self.source, response.status_code, body)
+        if cache is not None and reusable:
+            cache.set(key, self.source, response.status_code, headers, body)
+        return response.status_code, headers, body, reusable
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+@asynccontextmanager
+async def cached_session(source, follow_redirects=False):
+    """
+    Drop-in for `async with httpx.AsyncClient() as client:` in the metadata modules,
+    yields a pooled client whose lookups go through the persistent cache.
+    """
+    yield get_named_session(
+        f"metadata:{source}:{follow_redirects}",
+        lambda: httpx.AsyncClient(
+            transport=CachingTransport(source, pooled_transport()),
+            timeout=api_timeout,
+            follow_redirects=follow_redirects
+        )
+    )
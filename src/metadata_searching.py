@@ -5,8 +5,10 @@ from src.tvmaze import search_tvmaze, get_tvmaze_episode_data
 from src.imdb import get_imdb_info_api
 from src.tmdb import tmdb_other_meta, get_tmdb_from_imdb, get_episode_details
 from src.tvdb import get_tvdb_episode_data, get_tvdb_series_data, get_tvdb_series_episodes, get_tvdb_series
+from src.profiling import traced
 
 
+@traced()
 async def all_ids(meta, tvdb_api=None, tvdb_token=None):
     # Create a list of all tasks to run in parallel
     all_tasks = [
@@ -226,6 +228,7 @@ async def all_ids(meta, tvdb_api=None, tvdb_token=None):
     return meta
 
 
+@traced()
 async def imdb_tmdb_tvdb(meta, filename, tvdb_api=None, tvdb_token=None):
     if meta['debug']:
         console.print("[yellow]IMDb, TMDb, and TVDb IDs are all present[/yellow]")
@@ -409,6 +412,7 @@ async def imdb_tmdb_tvdb(meta, filename, tvdb_api=None, tvdb_token=None):
     return meta
 
 
+@traced()
 async def imdb_tvdb(meta, filename, tvdb_api=None, tvdb_token=None):
     if meta['debug']:
         console.print("[yellow]Both IMDb and TVDB IDs are present[/yellow]")
@@ -532,6 +536,7 @@ async def imdb_tvdb(meta, filename, tvdb_api=None, tvdb_token=None):
     return meta
 
 
+@traced()
 async def imdb_tmdb(meta, filename):
     # Create a list of coroutines to run concurrently
     coroutines = [
@@ -654,6 +659,7 @@ async def imdb_tmdb(meta, filename):
     return meta
 
 
+@traced()
 async def get_tvmaze_tvdb(meta, filename, tvdb_api=None, tvdb_token=None):
     if meta['debug']:
         console.print("[yellow]Both TVMaze and TVDb IDs are present[/yellow]")
@@ -716,6 +722,7 @@ async def get_tvmaze_tvdb(meta, filename, tvdb_api=None, tvdb_token=None):
     return meta
 
 
+@traced()
 async def get_tv_data(meta, base_dir, tvdb_api=None, tvdb_token=None):
     if not meta.get('tv_pack', False) and meta.get('episode_int') != 0:
         if not meta.get('auto_episode_title') or not meta.get('overview_meta'):
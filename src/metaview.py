@@ -0,0 +1,77 @@
+import copy
+
+
+def wrap(value):
+    """Give mutable containers their own copy-on-write layer, immutable values are shared as is."""
+    if isinstance(value, dict):
+        return MetaView(value)
+    if isinstance(value, list):
+        return [wrap(item) for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+class MetaView(dict):
+    """
+    Copy-on-write view of a meta dict for code that must not change the shared meta.
+
+    Creating a view only copies the top level references. Nested dicts and lists get their own
+    layer the first time they are read through the view, so writes at any depth stay in the view
+    while everything that is only read is shared with the base. It is still a real dict, so
+    isinstance checks and json.dump keep working.
+    Writes are never merged back into the base.
+    """
+
+    def __init__(self, base):
+        super().__init__(base)
+        self._wrapped = set()
+
+    def _own(self, key):
+        if key not in self._wrapped:
+            self._wrapped.add(key)
+            value = dict.__getitem__(self, key)
+            wrapped = wrap(value)
+            if wrapped is not value:
+                dict.__setitem__(self, key, wrapped)
+        return dict.__getitem__(self, key)
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self._own(key)
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self._own(key)
+
+    def __setitem__(self, key, value):
+        self._wrapped.add(key)
+        dict.__setitem__(self, key, value)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self._own(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self._own(key)
+        return dict.pop(self, key, *default)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def values(self):
+        return [self._own(key) for key in self]
+
+    def items(self):
+        return [(key, self._own(key)) for key in self]
+
+    def copy(self):
+        return MetaView(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(dict.items(self)), memo)
@@ -0,0 +1,52 @@
+import json
+from functools import lru_cache
+
+import anitopy
+from guessit import guessit
+
+# Options used everywhere a title is guessed, country and language words are part of titles
+title_options = {"excludes": ["country", "language"]}
+
+# Distinct names parsed per run, a season pack needs a handful per episode
+cache_size = 4096
+
+
+@lru_cache(maxsize=cache_size)
+def _guessit(name, options_key):
+    return guessit(name, json.loads(options_key) if options_key else None)
+
+
+@lru_cache(maxsize=cache_size)
+def _anitopy(name, options_key):
+    if options_key:
+        return anitopy.parse(name, json.loads(options_key))
+    return anitopy.parse(name)
+
+
+def options_key(options):
+    return json.dumps(options, sort_keys=True) if options else None
+
+
+def parse_name(name, options=None):
+    """
+    guessit(name, options), parsed once per run for each distinct (name, options).
+    Returns a shallow copy, so callers may change the dict but not the values in it.
+    """
+    return dict(_guessit(name, options_key(options)))
+
+
+def parse_anime(name, options=None):
+    """anitopy.parse(name), parsed once per run for each distinct (name, options)."""
+    parsed = _anitopy(name, options_key(options))
+    return dict(parsed) if parsed is not None else None
+
+
+def guess_field(name, field, default=None, options=None):
+    try:
+        return _guessit(name, options_key(options)).get(field, default)
+    except Exception:
+        return default
+
+
+def guess_year(name):
+    return guess_field(name, 'year')
@@ -0,0 +1,161 @@
+import asyncio
+import functools
+import glob
+import json
+import os
+
+from pymediainfo import MediaInfo
+
+from src.console import console
+from src.profiling import traced
+from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
+from src.uploadscreens import upload_screens
+
+# Build per release, keyed by uuid, together with the meta it filled: (meta, task)
+_builds = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_mediainfo(path, size, mtime_ns, inform_version):
+    options = {'inform_version': '1'} if inform_version else None
+    return MediaInfo.parse(path, output="STRING", full=False, mediainfo_options=options)
+
+
+async def pack_mediainfo(path, inform_version=True):
+    """
+    MediaInfo text of one file of a pack, parsed once per file (and version of the file)
+    however many tracker descriptions include it. inform_version adds the version line UNIT3D trackers show.
+    """
+    stat = os.stat(path)
+    return await asyncio.to_thread(_parse_mediainfo, path, stat.st_size, stat.st_mtime_ns, inform_version)
+
+
+def load_saved_images(meta):
+    """Put the links from pack_image_links.json back into meta, for keys that don't have any yet."""
+    pack_images_file = os.path.join(meta['base_dir'], "tmp", meta['uuid'], "pack_image_links.json")
+    if not os.path.exists(pack_images_file):
+        return
+    try:
+        with open(pack_images_file, 'r', encoding='utf-8') as f:
+            pack_images_data = json.load(f)
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not load pack image data: {str(e)}[/yellow]")
+        return
+    for key, data in pack_images_data.get('keys', {}).items():
+        if data.get('images') and not meta.get(key):
+            meta[key] = [
+                {'img_url': img.get('img_url', ''), 'raw_url': img.get('raw_url', ''), 'web_url': img.get('web_url', '')}
+                for img in data['images']
+            ]
+
+
+def pack_items(meta, process_limit):
+    """(images key, screenshot glob, capture coroutine factory) for every extra file, disc or playlist of the release."""
+    folder = f"{meta['base_dir']}/tmp/{meta['uuid']}"
+    use_vs = meta.get('vapoursynth', False)
+    discs = meta.get('discs', [])
+    filelist = meta.get('filelist', [])
+    items = []
+
+    if len(discs) == 1 and discs[0]['type'] == "BDMV":
+        bdinfo_keys = [key for key in discs[0] if key.startswith("bdinfo")]
+        for i, key in enumerate(bdinfo_keys[1:], start=1):
+            bdinfo = discs[0][key]
+            items.append((f'new_images_playlist_{i}', f"PLAYLIST_{i}-*.png",
+                          lambda n, i=i, bdinfo=bdinfo: disc_screenshots(meta, f"PLAYLIST_{i}", bdinfo, meta['uuid'], meta['base_dir'], use_vs, [], meta.get('ffdebug', False), n, True)))
+    elif len(discs) > 1:
+        for i, each in enumerate(discs[1:], start=1):
+            if each['type'] == "BDMV":
+                items.append((f'new_images_disc_{i}', f"FILE_{i}-*.png",
+                              lambda n, i=i, each=each: disc_screenshots(meta, f"FILE_{i}", each['bdinfo'], meta['uuid'], meta['base_dir'], use_vs, [], meta.get('ffdebug', False), n, True)))
+            elif each['type'] == "DVD":
+                items.append((f'new_images_disc_{i}', f"{each['name']}-*.png",
+                              lambda n, i=i: dvd_screenshots(meta, i, n, True)))
+
+    if len(filelist) > 1:
+        for i, file in enumerate(filelist[1:process_limit], start=1):
+            items.append((f'new_images_file_{i}', f"FILE_{i}-*.png",
+                          lambda n, i=i, file=file: screenshots(file, f"FILE_{i}", meta['uuid'], meta['base_dir'], meta, n, True, None)))
+
+    return [(key, os.path.join(folder, pattern), capture) for key, pattern, capture in items]
+
+
+@traced('pack assets')
+async def _build(meta, config):
+    from src.trackers.COMMON import COMMON
+
+    multi_screens = int(config['DEFAULT'].get('multiScreens', 2))
+    process_limit = int(config['DEFAULT'].get('processLimit', 10))
+    workers = max(1, int(config['DEFAULT'].get('pack_asset_workers', 2)))
+    limiter = asyncio.Semaphore(workers)
+    common = COMMON(config)
+
+    # MediaInfo of every file is parsed in worker threads while the screenshots are taken
+    filelist = meta.get('filelist', [])
+    mediainfo_tasks = []
+    if len(filelist) > 1:
+        async def parse(file):
+            async with limiter:
+                try:
+                    await pack_mediainfo(file)
+                except Exception as e:
+                    console.print(f"[yellow]Could not read MediaInfo for {os.path.basename(file)}: {e}")
+        mediainfo_tasks = [asyncio.create_task(parse(file)) for file in filelist[1:process_limit]]
+
+    load_saved_images(meta)
+    missing = [item for item in pack_items(meta, process_limit) if not meta.get(item[0])]
+    if missing:
+        console.print(f"[cyan]Preparing screenshots for {len(missing)} more files/discs of the pack (multiScreens)")
+
+    async def upload(key, new_screens):
+        async with limiter:
+            uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {key: meta[key]})
+        if uploaded_images:
+            await common.save_image_links(meta, key, uploaded_images)
+        for img in uploaded_images:
+            meta[key].append({'img_url': img['img_url'], 'raw_url': img['raw_url'], 'web_url': img['web_url']})
+
+    # Captures run one at a time (each already uses every capture worker, and they share meta),
+    # the uploads of earlier files overlap with the next capture.
+    upload_tasks = []
+    for key, pattern, capture in missing:
+        meta[key] = []
+        new_screens = glob.glob(pattern)
+        if not new_screens:
+            try:
+                await capture(multi_screens)
+            except Exception as e:
+                console.print(f"[red]Error during pack screenshot capture for {key}: {e}")
+            new_screens = glob.glob(pattern)
+        if new_screens and not meta.get('skip_imghost_upload', False):
+            upload_tasks.append(asyncio.create_task(upload(key, [os.path.basename(screen) for screen in sorted(new_screens)])))
+
+    for result in await asyncio.gather(*upload_tasks, *mediainfo_tasks, return_exceptions=True):
+        if isinstance(result, Exception):
+            console.print(f"[red]Error while uploading pack screenshots: {result}")
+
+    if missing:
+        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
+            json.dump(meta, f, indent=4)
+
+
+async def build_pack_assets(meta, config):
+    """
+    Screenshots, image uploads and MediaInfo for the extra files/discs of a pack, built once per release
+    before any tracker description is written. Trackers writing their descriptions at the same time
+    wait for the same build, then read the images from meta['new_images_*'] and the text from pack_mediainfo().
+    """
+    if int(config['DEFAULT'].get('multiScreens', 2)) == 0:
+        return
+    if not pack_items(meta, int(config['DEFAULT'].get('processLimit', 10))):
+        return
+    uuid = meta['uuid']
+    entry = _builds.get(uuid)
+    if entry is None or entry[0] is not meta:
+        entry = _builds[uuid] = (meta, asyncio.ensure_future(_build(meta, config)))
+        # Later calls find everything in meta and the MediaInfo cache, only concurrent ones need the task
+        entry[1].add_done_callback(lambda task: _builds.pop(uuid) if _builds.get(uuid) is entry else None)
+    try:
+        await asyncio.shield(entry[1])
+    except Exception as e:
+        console.print(f"[red]Error preparing pack assets: {e}")
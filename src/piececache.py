@@ -0,0 +1,321 @@
+import bisect
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from torf import Torrent
+
+from data.config import config
+from src.console import console
+
+cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache")
+
+# Missing pieces handed to one hashing thread at a time, read sequentially
+max_span_pieces = 256
+
+
+class PieceHashCache:
+    """
+    SQLite store of SHA1 piece hashes per file, keyed by (path, size, mtime, inode, piece size, phase).
+    The phase is where the file starts inside a piece (its offset in the torrent modulo the piece size),
+    and the hashes are those of the pieces that lie entirely inside the file. Those pieces only depend on
+    the file itself and its phase, so they can be reused wherever the file lands in a torrent.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS file_pieces ("
+            "path TEXT, size INTEGER, mtime INTEGER, inode INTEGER, piece_size INTEGER, phase INTEGER, hashes BLOB, accessed REAL, "
+            "PRIMARY KEY (path, size, mtime, inode, piece_size, phase))"
+        )
+        self.db.commit()
+
+    @staticmethod
+    def file_key(filepath):
+        st = os.stat(filepath)
+        return os.path.realpath(filepath), st.st_size, st.st_mtime_ns, st.st_ino
+
+    def get(self, filepath, piece_size, phase=0):
+        path, size, mtime, inode = self.file_key(filepath)
+        with self.lock:
+            row = self.db.execute(
+                "SELECT hashes FROM file_pieces WHERE path = ? AND size = ? AND mtime = ? AND inode = ? AND piece_size = ? AND phase = ?",
+                (path, size, mtime, inode, piece_size, phase)
+            ).fetchone()
+            if row is None:
+                return None
+            self.db.execute(
+                "UPDATE file_pieces SET accessed = ? WHERE path = ? AND piece_size = ? AND phase = ?",
+                (time.time(), path, piece_size, phase)
+            )
+            self.db.commit()
+        hashes = row[0]
+        if len(hashes) != inner_pieces(size, piece_size, phase) * 20:
+            return None
+        return hashes
+
+    def piece_sizes(self, filepath):
+        """Piece sizes that have cached hashes for the current version of a file starting on a piece boundary."""
+        path, size, mtime, inode = self.file_key(filepath)
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT piece_size FROM file_pieces WHERE path = ? AND size = ? AND mtime = ? AND inode = ? AND phase = 0",
+                (path, size, mtime, inode)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def set(self, filepath, piece_size, hashes, phase=0):
+        path, size, mtime, inode = self.file_key(filepath)
+        with self.lock:
+            # Older versions of the file are never looked up again
+            self.db.execute(
+                "DELETE FROM file_pieces WHERE path = ? AND piece_size = ? AND phase = ?", (path, piece_size, phase)
+            )
+            self.db.execute(
+                "INSERT INTO file_pieces (path, size, mtime, inode, piece_size, phase, hashes, accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, size, mtime, inode, piece_size, phase, bytes(hashes), time.time())
+            )
+            self.evict()
+            self.db.commit()
+
+    def evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(LENGTH(hashes)), 0) FROM file_pieces").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for path, piece_size, phase, size in self.db.execute(
+            "SELECT path, piece_size, phase, LENGTH(hashes) FROM file_pieces ORDER BY accessed ASC"
+        ).fetchall():
+            if total <= target:
+                break
+            self.db.execute(
+                "DELETE FROM file_pieces WHERE path = ? AND piece_size = ? AND phase = ?", (path, piece_size, phase)
+            )
+            total -= size
+
+
+_cache = None
+
+
+def get_cache():
+    global _cache
+    if not config['DEFAULT'].get('piece_hash_cache', True):
+        return None
+    if _cache is None:
+        try:
+            max_mb = int(config['DEFAULT'].get('piece_hash_cache_size', 100))
+            _cache = PieceHashCache(os.path.join(cache_dir, "pieces.sqlite"), max_mb * 1024 * 1024)
+        except Exception as e:
+            console.print(f"[yellow]Piece hash cache unavailable: {e}[/yellow]")
+            return None
+    return _cache
+
+
+def inner_pieces(size, piece_size, phase):
+    """Number of pieces lying entirely inside a file of `size` bytes that starts `phase` bytes into a piece."""
+    lead = (piece_size - phase) % piece_size
+    return max(0, (size - lead) // piece_size)
+
+
+def file_layout(filepaths, sizes=None):
+    """(filepath, offset, size) of every file in the concatenated stream of a torrent."""
+    layout = []
+    offset = 0
+    for i, filepath in enumerate(filepaths):
+        size = sizes[i] if sizes is not None else os.path.getsize(filepath)
+        layout.append((filepath, offset, size))
+        offset += size
+    return layout
+
+
+def first_inner_piece(offset, piece_size):
+    return -(-offset // piece_size)
+
+
+def cached_pieces(cache, layout, piece_size):
+    """
+    Piece index: hash for every piece that lies inside a file with cached hashes,
+    and the layout entries of the files that have pieces of their own but no cached hashes.
+    """
+    hashes = {}
+    uncached = []
+    for filepath, offset, size in layout:
+        phase = offset % piece_size
+        if not inner_pieces(size, piece_size, phase):
+            continue
+        cached = cache.get(filepath, piece_size, phase)
+        if cached is None:
+            uncached.append((filepath, offset, size))
+            continue
+        first = first_inner_piece(offset, piece_size)
+        for i in range(len(cached) // 20):
+            hashes[first + i] = cached[i * 20:(i + 1) * 20]
+    return hashes, uncached
+
+
+def store_pieces(cache, layout, piece_size, pieces):
+    """Cache the hashes of the pieces inside each file from a torrent's full `pieces` string."""
+    for filepath, offset, size in layout:
+        phase = offset % piece_size
+        count = inner_pieces(size, piece_size, phase)
+        if not count or not os.path.isfile(filepath) or os.path.getsize(filepath) != size:
+            continue
+        first = first_inner_piece(offset, piece_size)
+        cache.set(filepath, piece_size, pieces[first * 20:(first + count) * 20], phase)
+
+
+def is_fully_cached(cache, filepaths, piece_size):
+    """True when every piece inside a file can be served from the cache (only reads across file boundaries needed)."""
+    for filepath, offset, size in file_layout(filepaths):
+        phase = offset % piece_size
+        if inner_pieces(size, piece_size, phase) and cache.get(filepath, piece_size, phase) is None:
+            return False
+    return True
+
+
+def cached_piece_size(filepaths, max_size):
+    """
+    Return a piece size for which the whole layout is already hashed, or None.
+    Used to skip an external hasher entirely when nothing changed since the last run.
+    """
+    cache = get_cache()
+    if cache is None or not filepaths:
+        return None
+    try:
+        for piece_size in sorted(cache.piece_sizes(filepaths[0]), reverse=True):
+            if piece_size <= max_size and is_fully_cached(cache, filepaths, piece_size):
+                return piece_size
+    except OSError:
+        return None
+    return None
+
+
+def hash_span(layout, piece_size, start, stop):
+    """SHA1 of pieces start..stop-1 of the concatenated stream, read sequentially across files."""
+    total = layout[-1][1] + layout[-1][2]
+    position = start * piece_size
+    end = min(stop * piece_size, total)
+    offsets = [offset for _, offset, _ in layout]
+    index = bisect.bisect_right(offsets, position) - 1
+    digests = []
+    piece = bytearray()
+    handle = None
+    try:
+        while position < end:
+            filepath, offset, size = layout[index]
+            if position >= offset + size:
+                index += 1
+                if handle:
+                    handle.close()
+                    handle = None
+                continue
+            if handle is None:
+                handle = open(filepath, 'rb')
+                handle.seek(position - offset)
+            want = min(piece_size - len(piece), offset + size - position, end - position)
+            chunk = handle.read(want)
+            if not chunk:
+                raise OSError(f"{filepath} is shorter than expected")
+            piece += chunk
+            position += len(chunk)
+            if len(piece) == piece_size or position == end:
+                digests.append(hashlib.sha1(piece).digest())
+                piece = bytearray()
+    finally:
+        if handle:
+            handle.close()
+    return digests
+
+
+def generate_pieces(torrent, callback=None, interval=5, threads=None, debug=False):
+    """
+    Fill torrent.metainfo['info']['pieces'] like torrent.generate(), reusing cached hashes for every piece
+    inside a file that was hashed before and hashing the remaining pieces in `threads` threads.
+    Returns False (without touching the torrent) when the cache is disabled or has none of the pieces,
+    torrent.generate() is the faster way to hash everything, followed by remember_pieces().
+    """
+    cache = get_cache()
+    if cache is None:
+        return False
+
+    piece_size = torrent.piece_size
+    layout = file_layout([str(f) for f in torrent.filepaths])
+    pieces_total = torrent.pieces
+    known, uncached = cached_pieces(cache, layout, piece_size)
+    if not known:
+        return False
+
+    missing = [i for i in range(pieces_total) if i not in known]
+    spans = []
+    for i in missing:
+        if spans and spans[-1][1] == i and spans[-1][1] - spans[-1][0] < max_span_pieces:
+            spans[-1][1] = i + 1
+        else:
+            spans.append([i, i + 1])
+
+    hashes = dict(known)
+    pieces_done = len(known)
+    last_report = 0.0
+    if callback:
+        callback(torrent, layout[0][0], pieces_done, pieces_total)
+    if spans:
+        with ThreadPoolExecutor(max_workers=threads or os.cpu_count() or 1) as executor:
+            futures = {executor.submit(hash_span, layout, piece_size, start, stop): start for start, stop in spans}
+            for future in as_completed(futures):
+                start = futures[future]
+                digests = future.result()
+                for i, digest in enumerate(digests):
+                    hashes[start + i] = digest
+                pieces_done += len(digests)
+                if callback and time.time() - last_report >= interval:
+                    last_report = time.time()
+                    callback(torrent, layout[0][0], pieces_done, pieces_total)
+
+    pieces = b''.join(hashes[i] for i in range(pieces_total))
+    torrent.metainfo['info']['pieces'] = pieces
+    store_pieces(cache, uncached, piece_size, pieces)
+    if callback:
+        callback(torrent, layout[-1][0], pieces_total, pieces_total)
+    if debug:
+        console.print(f"[cyan]Reused {len(known)}/{pieces_total} cached piece hashes")
+    return True
+
+
+def remember_pieces(torrent):
+    """Store the piece hashes of a torrent hashed by torrent.generate() for the next run."""
+    cache = get_cache()
+    if cache is None:
+        return
+    try:
+        store_pieces(cache, file_layout([str(f) for f in torrent.filepaths]), torrent.piece_size, torrent.metainfo['info']['pieces'])
+    except Exception as e:
+        console.print(f"[yellow]Could not store piece hashes: {e}[/yellow]")
+
+
+def remember_torrent(torrent_path, content_path):
+    """
+    Store the piece hashes of an existing .torrent (e.g. one written by mkbrr) for every file,
+    so later runs can build the same files from the cache.
+    """
+    cache = get_cache()
+    if cache is None:
+        return
+    try:
+        torrent = Torrent.read(torrent_path)
+        info = torrent.metainfo['info']
+        if 'files' in info:
+            files = [(os.path.join(content_path, *entry['path']), entry['length']) for entry in info['files']]
+        else:
+            files = [(content_path, info['length'])]
+        layout = file_layout([filepath for filepath, _ in files], [size for _, size in files])
+        store_pieces(cache, layout, info['piece length'], info['pieces'])
+    except Exception as e:
+        console.print(f"[yellow]Could not store piece hashes from {torrent_path}: {e}[/yellow]")
@@ -22,13 +22,15 @@ from src.get_source import get_source
 from src.sonarr import get_sonarr_data
 from src.radarr import get_radarr_data
 from src.languages import parsed_mediainfo
+from src.nameparse import parse_name, title_options
+from src.lookupgraph import Lookup, resolve
+from src.profiling import traced
 
 try:
     import traceback
     import os
     import re
     import asyncio
-    from guessit import guessit
     import ntpath
     from pathlib import Path
     import time
@@ -55,6 +57,7 @@ class Prep():
         self.config = config
         self.img_host = img_host.lower()
 
+    @traced()
     async def gather_prep(self, meta, mode):
         # set some details we'll need
         meta['cutoff'] = int(self.config['DEFAULT'].get('cutoff_screens', 1))
@@ -109,23 +112,23 @@ class Prep():
             search_file_folder = 'folder'
             try:
                 guess_name = bdinfo['title'].replace('-', ' ')
-                filename = guessit(re.sub(r"[^0-9a-zA-Z\[\\]]+", " ", guess_name), {"excludes": ["country", "language"]})['title']
+                filename = parse_name(re.sub(r"[^0-9a-zA-Z\[\\]]+", " ", guess_name), title_options)['title']
                 untouched_filename = bdinfo['title']
                 try:
-                    meta['search_year'] = guessit(bdinfo['title'])['year']
+                    meta['search_year'] = parse_name(bdinfo['title'])['year']
                 except Exception:
                     meta['search_year'] = ""
             except Exception:
                 guess_name = bdinfo['label'].replace('-', ' ')
-                filename = guessit(re.sub(r"[^0-9a-zA-Z\[\\]]+", " ", guess_name), {"excludes": ["country", "language"]})['title']
+                filename = parse_name(re.sub(r"[^0-9a-zA-Z\[\\]]+", " ", guess_name), title_options)['title']
                 untouched_filename = bdinfo['label']
                 try:
-                    meta['search_year'] = guessit(bdinfo['label'])['year']
+                    meta['search_year'] = parse_name(bdinfo['label'])['year']
                 except Exception:
                     meta['search_year'] = ""
 
             if meta.get('resolution', None) is None:
-                meta['resolution'] = await mi_resolution(bdinfo['video'][0]['res'], guessit(video), width="OTHER", scan="p", height="OTHER", actual_height=0)
+                meta['resolution'] = await mi_resolution(bdinfo['video'][0]['res'], parse_name(video), width="OTHER", scan="p", height="OTHER", actual_height=0)
                 try:
                     is_hfr = bdinfo['video'][0]['fps'].split()[0] if bdinfo['video'] else "25"
                     if int(float(is_hfr)) > 30:
@@ -145,10 +148,10 @@ class Prep():
             search_term = os.path.basename(meta['path'])
             search_file_folder = 'folder'
             guess_name = meta['discs'][0]['path'].replace('-', ' ')
-            filename = guessit(guess_name, {"excludes": ["country", "language"]})['title']
+            filename = parse_name(guess_name, title_options)['title']
             untouched_filename = os.path.basename(os.path.dirname(meta['discs'][0]['path']))
             try:
-                meta['search_year'] = guessit(meta['discs'][0]['path'])['year']
+                meta['search_year'] = parse_name(meta['discs'][0]['path'])['year']
             except Exception:
                 meta['search_year'] = ""
             if not meta.get('edit', False):
@@ -158,7 +161,7 @@ class Prep():
                 mi = meta['mediainfo']
 
             meta['dvd_size'] = await get_dvd_size(meta['discs'], meta.get('manual_dvds'))
-            meta['resolution'], meta['hfr'] = await get_resolution(guessit(video), meta['uuid'], base_dir)
+            meta['resolution'], meta['hfr'] = await get_resolution(parse_name(video), meta['uuid'], base_dir)
             meta['sd'] = await is_sd(meta['resolution'])
 
         elif meta['is_disc'] == "HDDVD":
@@ -167,11 +170,11 @@ class Prep():
             search_term = os.path.basename(meta['path'])
             search_file_folder = 'folder'
             guess_name = meta['discs'][0]['path'].replace('-', '')
-            filename = guessit(guess_name, {"excludes": ["country", "language"]})['title']
+            filename = parse_name(guess_name, title_options)['title']
             untouched_filename = os.path.basename(meta['discs'][0]['path'])
             videopath = meta['discs'][0]['largest_evo']
             try:
-                meta['search_year'] = guessit(meta['discs'][0]['path'])['year']
+                meta['search_year'] = parse_name(meta['discs'][0]['path'])['year']
             except Exception:
                 meta['search_year'] = ""
             if not meta.get('edit', False):
@@ -179,7 +182,7 @@ class Prep():
                 meta['mediainfo'] = mi
             else:
                 mi = meta['mediainfo']
-            meta['resolution'], meta['hfr'] = await get_resolution(guessit(video), meta['uuid'], base_dir)
+            meta['resolution'], meta['hfr'] = await get_resolution(parse_name(video), meta['uuid'], base_dir)
             meta['sd'] = await is_sd(meta['resolution'])
 
         else:
@@ -267,12 +270,12 @@ class Prep():
             if title:
                 filename = title
             else:
-                filename = guessit(re.sub(r"[^0-9a-zA-Z\[\\]]+", " ", guess_name), {"excludes": ["country", "language"]}).get("title", guessit(re.sub("[^0-9a-zA-Z]+", " ", guess_name), {"excludes": ["country", "language"]})["title"])
+                filename = parse_name(re.sub(r"[^0-9a-zA-Z\[\\]]+", " ", guess_name), title_options).get("title", parse_name(re.sub("[^0-9a-zA-Z]+", " ", guess_name), title_options)["title"])
             untouched_filename = os.path.basename(video)
 
             # rely only on guessit for search_year for tv matching
             try:
-                meta['search_year'] = guessit(video)['year']
+                meta['search_year'] = parse_name(video)['year']
             except Exception:
                 meta['search_year'] = ""
 
@@ -283,7 +286,7 @@ class Prep():
                 mi = meta['mediainfo']
 
             if meta.get('resolution', None) is None:
-                meta['resolution'], meta['hfr'] = await get_resolution(guessit(video), meta['uuid'], base_dir)
+                meta['resolution'], meta['hfr'] = await get_resolution(parse_name(video), meta['uuid'], base_dir)
 
             meta['sd'] = await is_sd(meta['resolution'])
 
@@ -528,75 +531,155 @@ class Prep():
         if meta.get("not_anime", False) and meta.get("category") == "TV":
             meta = await get_season_episode(video, meta)
 
-        # Run a check against mediainfo to see if it has tmdb/imdb
-        if (meta.get('tmdb_id') == 0 or meta.get('imdb_id') == 0):
+        # bluray.com data if config
+        get_bluray_info = self.config['DEFAULT'].get('get_bluray_info', False)
+        meta['bluray_score'] = int(float(self.config['DEFAULT'].get('bluray_score', 100)))
+        meta['bluray_single_score'] = int(float(self.config['DEFAULT'].get('bluray_single_score', 100)))
+        meta['use_bluray_images'] = self.config['DEFAULT'].get('use_bluray_images', False)
+        essential_fields = ['title', 'year', 'genres', 'overview']
+
+        # Each lookup below runs as soon as the lookups it needs are done: the IMDb, TVmaze/TVDb and
+        # bluray.com chains overlap once the ids are settled, instead of running one after the other
+        async def find_mediainfo_ids():
+            # Run a check against mediainfo to see if it has tmdb/imdb
             meta['category'], meta['tmdb_id'], meta['imdb_id'] = await get_tmdb_imdb_from_mediainfo(
                 mi, meta['category'], meta['is_disc'], meta['tmdb_id'], meta['imdb_id']
             )
 
-        # run a search to find tmdb and imdb ids if we don't have them
-        if meta.get('tmdb_id') == 0 and meta.get('imdb_id') == 0:
-            if meta.get('category') == "TV":
-                year = meta.get('manual_year', '') or meta.get('search_year', '') or meta.get('year', '')
-            else:
-                year = meta.get('manual_year', '') or meta.get('year', '') or meta.get('search_year', '')
-            tmdb_task = get_tmdb_id(filename, year, meta.get('category', None), untouched_filename, attempted=0, debug=meta['debug'], secondary_title=meta.get('secondary_title', None), path=meta.get('path', None))
-            imdb_task = search_imdb(filename, year, quickie=True, category=meta.get('category', None), debug=meta['debug'], secondary_title=meta.get('secondary_title', None), path=meta.get('path', None))
-            tmdb_result, imdb_result = await asyncio.gather(tmdb_task, imdb_task)
-            tmdb_id, category = tmdb_result
-            meta['category'] = category
-            meta['tmdb_id'] = int(tmdb_id)
-            meta['imdb_id'] = int(imdb_result)
-            meta['quickie_search'] = True
-
-        # If we have an IMDb ID but no TMDb ID, fetch TMDb ID from IMDb
-        elif meta.get('imdb_id') != 0 and meta.get('tmdb_id') == 0:
-            category, tmdb_id, original_language = await get_tmdb_from_imdb(
-                meta['imdb_id'],
-                meta.get('tvdb_id'),
-                meta.get('search_year'),
-                filename,
-                debug=meta.get('debug', False),
-                mode=meta.get('mode', 'discord'),
-                category_preference=meta.get('category'),
-                imdb_info=meta.get('imdb_info', None)
-                )
+        async def search_ids():
+            # run a search to find tmdb and imdb ids if we don't have them
+            if meta.get('tmdb_id') == 0 and meta.get('imdb_id') == 0:
+                if meta.get('category') == "TV":
+                    year = meta.get('manual_year', '') or meta.get('search_year', '') or meta.get('year', '')
+                else:
+                    year = meta.get('manual_year', '') or meta.get('year', '') or meta.get('search_year', '')
+                tmdb_task = get_tmdb_id(filename, year, meta.get('category', None), untouched_filename, attempted=0, debug=meta['debug'], secondary_title=meta.get('secondary_title', None), path=meta.get('path', None))
+                imdb_task = search_imdb(filename, year, quickie=True, category=meta.get('category', None), debug=meta['debug'], secondary_title=meta.get('secondary_title', None), path=meta.get('path', None))
+                tmdb_result, imdb_result = await asyncio.gather(tmdb_task, imdb_task)
+                tmdb_id, category = tmdb_result
+                meta['category'] = category
+                meta['tmdb_id'] = int(tmdb_id)
+                meta['imdb_id'] = int(imdb_result)
+                meta['quickie_search'] = True
 
-            meta['category'] = category
-            meta['tmdb_id'] = int(tmdb_id)
-            meta['original_language'] = original_language
+            # If we have an IMDb ID but no TMDb ID, fetch TMDb ID from IMDb
+            elif meta.get('imdb_id') != 0 and meta.get('tmdb_id') == 0:
+                category, tmdb_id, original_language = await get_tmdb_from_imdb(
+                    meta['imdb_id'],
+                    meta.get('tvdb_id'),
+                    meta.get('search_year'),
+                    filename,
+                    debug=meta.get('debug', False),
+                    mode=meta.get('mode', 'discord'),
+                    category_preference=meta.get('category'),
+                    imdb_info=meta.get('imdb_info', None)
+                    )
 
-        # if we have all of the ids, search everything all at once
-        if int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0 and int(meta['tmdb_id']) != 0 and int(meta['tvmaze_id']) != 0:
-            meta = await all_ids(meta, tvdb_api, tvdb_token)
+                meta['category'] = category
+                meta['tmdb_id'] = int(tmdb_id)
+                meta['original_language'] = original_language
 
-        # Check if IMDb, TMDb, and TVDb IDs are all present
-        elif int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0 and int(meta['tmdb_id']) != 0 and not meta.get('quickie_search', False):
-            meta = await imdb_tmdb_tvdb(meta, filename, tvdb_api, tvdb_token)
+        async def fetch_id_data():
+            nonlocal meta
+            # if we have all of the ids, search everything all at once
+            if int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0 and int(meta['tmdb_id']) != 0 and int(meta['tvmaze_id']) != 0:
+                meta = await all_ids(meta, tvdb_api, tvdb_token)
+
+            # Check if IMDb, TMDb, and TVDb IDs are all present
+            elif int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0 and int(meta['tmdb_id']) != 0 and not meta.get('quickie_search', False):
+                meta = await imdb_tmdb_tvdb(meta, filename, tvdb_api, tvdb_token)
+
+            # Check if both IMDb and TVDB IDs are present
+            elif int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0 and not meta.get('quickie_search', False):
+                meta = await imdb_tvdb(meta, filename, tvdb_api, tvdb_token)
+
+            # Check if both IMDb and TMDb IDs are present
+            elif int(meta['imdb_id']) != 0 and int(meta['tmdb_id']) != 0 and not meta.get('quickie_search', False):
+                meta = await imdb_tmdb(meta, filename)
+
+        async def fetch_tmdb_data():
+            # we have tmdb id one way or another, so lets get data if needed
+            if int(meta['tmdb_id']) != 0:
+                if not meta.get('edit', False):
+                    # if we have these fields already, we probably got them from a multi id searching
+                    # and don't need to fetch them again
+                    tmdb_metadata_populated = all(meta.get(field) is not None for field in essential_fields)
+                else:
+                    # if we're in that blastard edit mode, ignore any previous set data and get fresh
+                    tmdb_metadata_populated = False
+
+                if not tmdb_metadata_populated:
+                    max_attempts = 2
+                    delay_seconds = 5
+                    for attempt in range(1, max_attempts + 1):
+                        try:
+                            tmdb_metadata = await tmdb_other_meta(
+                                tmdb_id=meta['tmdb_id'],
+                                path=meta.get('path'),
+                                search_year=meta.get('search_year'),
+                                category=meta.get('category'),
+                                imdb_id=meta.get('imdb_id', 0),
+                                manual_language=meta.get('manual_language'),
+                                anime=meta.get('anime', False),
+                                mal_manual=meta.get('mal_manual'),
+                                aka=meta.get('aka', ''),
+                                original_language=meta.get('original_language'),
+                                poster=meta.get('poster'),
+                                debug=meta.get('debug', False),
+                                mode=meta.get('mode', 'cli'),
+                                tvdb_id=meta.get('tvdb_id', 0),
+                                quickie_search=meta.get('quickie_search', False),
+                            )
+
+                            if tmdb_metadata and all(tmdb_metadata.get(field) for field in ['title', 'year']):
+                                meta.update(tmdb_metadata)
+                                break  # Success, exit loop
+                            else:
+                                error_msg = f"Failed to retrieve essential metadata from TMDB ID: {meta['tmdb_id']}"
+                                console.print(f"[bold red]{error_msg}[/bold red]")
+                                if attempt < max_attempts:
+                                    console.print(f"[yellow]Retrying TMDB metadata fetch in {delay_seconds} seconds... (Attempt {attempt + 1}/{max_attempts})[/yellow]")
+                                    await asyncio.sleep(delay_seconds)
+                                else:
+                                    raise ValueError(error_msg)
+                        except Exception as e:
+                            error_msg = f"TMDB metadata retrieval failed for ID {meta['tmdb_id']}: {str(e)}"
+                            console.print(f"[bold red]{error_msg}[/bold red]")
+                            if attempt < max_attempts:
+                                console.print(f"[yellow]Retrying TMDB metadata fetch in {delay_seconds} seconds... (Attempt {attempt + 1}/{max_attempts})[/yellow]")
+                                await asyncio.sleep(delay_seconds)
+                            else:
+                                raise RuntimeError(error_msg) from e
 
-        # Check if both IMDb and TVDB IDs are present
-        elif int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0 and not meta.get('quickie_search', False):
-            meta = await imdb_tvdb(meta, filename, tvdb_api, tvdb_token)
+        async def check_tmdb_ids():
+            if meta.get('retrieved_aka', None) is not None:
+                meta['aka'] = meta['retrieved_aka']
 
-        # Check if both IMDb and TMDb IDs are present
-        elif int(meta['imdb_id']) != 0 and int(meta['tmdb_id']) != 0 and not meta.get('quickie_search', False):
-            meta = await imdb_tmdb(meta, filename)
+            # If there's a mismatch between IMDb and TMDb IDs, try to resolve it
+            if meta.get('imdb_mismatch', False):
+                if meta['debug']:
+                    console.print("[yellow]IMDb ID mismatch detected, attempting to resolve...[/yellow]")
+                # if there's a secondary title, TMDb is probably correct
+                if meta.get('secondary_title', None):
+                    meta['imdb_id'] = 0
+                    meta['imdb_info'] = None
+                # Otherwise, IMDb used some other regex and we'll trust it more than guessit
+                else:
+                    category, tmdb_id, original_language = await get_tmdb_from_imdb(
+                        meta['imdb_id'],
+                        meta.get('tvdb_id'),
+                        meta.get('search_year'),
+                        filename,
+                        debug=meta.get('debug', False),
+                        mode=meta.get('mode', 'discord'),
+                        category_preference=meta.get('category'),
+                        imdb_info=meta.get('imdb_info', None)
+                    )
 
-        # we have tmdb id one way or another, so lets get data if needed
-        if int(meta['tmdb_id']) != 0:
-            if not meta.get('edit', False):
-                # if we have these fields already, we probably got them from a multi id searching
-                # and don't need to fetch them again
-                essential_fields = ['title', 'year', 'genres', 'overview']
-                tmdb_metadata_populated = all(meta.get(field) is not None for field in essential_fields)
-            else:
-                # if we're in that blastard edit mode, ignore any previous set data and get fresh
-                tmdb_metadata_populated = False
+                    meta['category'] = category
+                    meta['tmdb_id'] = int(tmdb_id)
+                    meta['original_language'] = original_language
 
-            if not tmdb_metadata_populated:
-                max_attempts = 2
-                delay_seconds = 5
-                for attempt in range(1, max_attempts + 1):
                     try:
                         tmdb_metadata = await tmdb_other_meta(
                             tmdb_id=meta['tmdb_id'],
@@ -616,116 +699,61 @@ class Prep():
                             quickie_search=meta.get('quickie_search', False),
                         )
 
-                        if tmdb_metadata and all(tmdb_metadata.get(field) for field in ['title', 'year']):
-                            meta.update(tmdb_metadata)
-                            break  # Success, exit loop
-                        else:
+                        if not tmdb_metadata or not all(tmdb_metadata.get(field) for field in ['title', 'year']):
                             error_msg = f"Failed to retrieve essential metadata from TMDB ID: {meta['tmdb_id']}"
                             console.print(f"[bold red]{error_msg}[/bold red]")
-                            if attempt < max_attempts:
-                                console.print(f"[yellow]Retrying TMDB metadata fetch in {delay_seconds} seconds... (Attempt {attempt + 1}/{max_attempts})[/yellow]")
-                                await asyncio.sleep(delay_seconds)
-                            else:
-                                raise ValueError(error_msg)
-                    except Exception as e:
-                        error_msg = f"TMDB metadata retrieval failed for ID {meta['tmdb_id']}: {str(e)}"
-                        console.print(f"[bold red]{error_msg}[/bold red]")
-                        if attempt < max_attempts:
-                            console.print(f"[yellow]Retrying TMDB metadata fetch in {delay_seconds} seconds... (Attempt {attempt + 1}/{max_attempts})[/yellow]")
-                            await asyncio.sleep(delay_seconds)
-                        else:
-                            raise RuntimeError(error_msg) from e
-
-        if meta.get('retrieved_aka', None) is not None:
-            meta['aka'] = meta['retrieved_aka']
-
-        # If there's a mismatch between IMDb and TMDb IDs, try to resolve it
-        if meta.get('imdb_mismatch', False):
-            if meta['debug']:
-                console.print("[yellow]IMDb ID mismatch detected, attempting to resolve...[/yellow]")
-            # if there's a secondary title, TMDb is probably correct
-            if meta.get('secondary_title', None):
-                meta['imdb_id'] = 0
-                meta['imdb_info'] = None
-            # Otherwise, IMDb used some other regex and we'll trust it more than guessit
-            else:
-                category, tmdb_id, original_language = await get_tmdb_from_imdb(
-                    meta['imdb_id'],
-                    meta.get('tvdb_id'),
-                    meta.get('search_year'),
-                    filename,
-                    debug=meta.get('debug', False),
-                    mode=meta.get('mode', 'discord'),
-                    category_preference=meta.get('category'),
-                    imdb_info=meta.get('imdb_info', None)
-                )
+                            raise ValueError(error_msg)
 
-                meta['category'] = category
-                meta['tmdb_id'] = int(tmdb_id)
-                meta['original_language'] = original_language
-
-                try:
-                    tmdb_metadata = await tmdb_other_meta(
-                        tmdb_id=meta['tmdb_id'],
-                        path=meta.get('path'),
-                        search_year=meta.get('search_year'),
-                        category=meta.get('category'),
-                        imdb_id=meta.get('imdb_id', 0),
-                        manual_language=meta.get('manual_language'),
-                        anime=meta.get('anime', False),
-                        mal_manual=meta.get('mal_manual'),
-                        aka=meta.get('aka', ''),
-                        original_language=meta.get('original_language'),
-                        poster=meta.get('poster'),
-                        debug=meta.get('debug', False),
-                        mode=meta.get('mode', 'cli'),
-                        tvdb_id=meta.get('tvdb_id', 0),
-                        quickie_search=meta.get('quickie_search', False),
-                    )
+                        meta.update(tmdb_metadata)
 
-                    if not tmdb_metadata or not all(tmdb_metadata.get(field) for field in ['title', 'year']):
-                        error_msg = f"Failed to retrieve essential metadata from TMDB ID: {meta['tmdb_id']}"
+                    except Exception as e:
+                        error_msg = f"TMDB metadata retrieval failed for ID {meta['tmdb_id']}: {str(e)}"
                         console.print(f"[bold red]{error_msg}[/bold red]")
-                        raise ValueError(error_msg)
+                        raise RuntimeError(error_msg) from e
 
-                    meta.update(tmdb_metadata)
-
-                except Exception as e:
-                    error_msg = f"TMDB metadata retrieval failed for ID {meta['tmdb_id']}: {str(e)}"
-                    console.print(f"[bold red]{error_msg}[/bold red]")
-                    raise RuntimeError(error_msg) from e
-
-        # Get IMDb ID if not set
-        if meta.get('imdb_id') == 0:
+        async def search_imdb_id():
+            # Get IMDb ID if not set
             meta['imdb_id'] = await search_imdb(filename, meta['search_year'], quickie=False, category=meta.get('category', None), debug=meta.get('debug', False))
 
-        # Ensure IMDb info is retrieved if it wasn't already fetched
-        if meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0:
-            imdb_info = await get_imdb_info_api(meta['imdb_id'], manual_language=meta.get('manual_language'), debug=meta.get('debug', False))
-            meta['imdb_info'] = imdb_info
-            meta['tv_year'] = imdb_info.get('tv_year', None)
-        check_valid_data = meta.get('imdb_info', {}).get('title', "")
-        if check_valid_data:
-            aka = meta.get('imdb_info', {}).get('aka', "").strip()
-            title = meta.get('imdb_info', {}).get('title', "").strip().lower()
-            year = str(meta.get('imdb_info', {}).get('year', ""))
-
-            if aka and not meta.get('aka'):
-                aka_trimmed = aka[4:].strip().lower() if aka.lower().startswith("aka") else aka.lower()
-                difference = SequenceMatcher(None, title, aka_trimmed).ratio()
-                if difference >= 0.7 or not aka_trimmed or aka_trimmed in title:
-                    aka = None
-
-                if aka is not None:
-                    if f"({year})" in aka:
-                        aka = aka.replace(f"({year})", "").strip()
-                    meta['aka'] = f"AKA {aka.strip()}"
-                    meta['title'] = f"{meta.get('imdb_info', {}).get('title', '').strip()}"
-
-        if meta.get('aka', None) is None:
-            meta['aka'] = ""
-
-        if meta['category'] == "TV":
+        prefetched_imdb_id = None
+
+        async def prefetch_imdb_info():
+            # Fetched while TMDb is asked, the imdb_info lookup then gets the answer from the lookup cache
+            nonlocal prefetched_imdb_id
+            prefetched_imdb_id = meta['imdb_id']
+            try:
+                await get_imdb_info_api(prefetched_imdb_id, manual_language=meta.get('manual_language'), debug=meta.get('debug', False))
+            except Exception:
+                pass
+
+        async def fetch_imdb_info():
+            # Ensure IMDb info is retrieved if it wasn't already fetched
+            if meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0:
+                imdb_info = await get_imdb_info_api(meta['imdb_id'], manual_language=meta.get('manual_language'), debug=meta.get('debug', False))
+                meta['imdb_info'] = imdb_info
+                meta['tv_year'] = imdb_info.get('tv_year', None)
+            check_valid_data = meta.get('imdb_info', {}).get('title', "")
+            if check_valid_data:
+                aka = meta.get('imdb_info', {}).get('aka', "").strip()
+                title = meta.get('imdb_info', {}).get('title', "").strip().lower()
+                year = str(meta.get('imdb_info', {}).get('year', ""))
+
+                if aka and not meta.get('aka'):
+                    aka_trimmed = aka[4:].strip().lower() if aka.lower().startswith("aka") else aka.lower()
+                    difference = SequenceMatcher(None, title, aka_trimmed).ratio()
+                    if difference >= 0.7 or not aka_trimmed or aka_trimmed in title:
+                        aka = None
+
+                    if aka is not None:
+                        if f"({year})" in aka:
+                            aka = aka.replace(f"({year})", "").strip()
+                        meta['aka'] = f"AKA {aka.strip()}"
+                        meta['title'] = f"{meta.get('imdb_info', {}).get('title', '').strip()}"
+
+            if meta.get('aka', None) is None:
+                meta['aka'] = ""
+
+        async def find_tvmaze_ids():
             if meta.get('tvmaze_id', 0) == 0 and meta.get('tvdb_id', 0) == 0:
                 await get_tvmaze_tvdb(meta, filename, tvdb_api, tvdb_token)
             elif meta.get('tvmaze_id', 0) == 0:
@@ -738,51 +766,52 @@ class Prep():
                 )
             else:
                 meta.setdefault('tvmaze_id', 0)
-            if meta.get('tvdb_id', 0) == 0 and tvdb_api and tvdb_token:
-                meta['tvdb_id'] = await get_tvdb_series(base_dir, title=meta.get('title', ''), year=meta.get('year', ''), apikey=tvdb_api, token=tvdb_token, debug=meta.get('debug', False))
 
+        async def search_tvdb_series():
+            meta['tvdb_id'] = await get_tvdb_series(base_dir, title=meta.get('title', ''), year=meta.get('year', ''), apikey=tvdb_api, token=tvdb_token, debug=meta.get('debug', False))
+
+        async def find_season_episode():
             # if it was skipped earlier, make sure we have the season/episode data
-            if not meta.get('not_anime', False):
-                meta = await get_season_episode(video, meta)
+            nonlocal meta
+            meta = await get_season_episode(video, meta)
+
+        async def fetch_tv_data():
             # all your episode data belongs to us
+            nonlocal meta
             meta = await get_tv_data(meta, base_dir, tvdb_api, tvdb_token)
 
-        # if we're using tvdb, lets use it's series name if it applies
-        # language check since tvdb returns original language names
-        if tvdb_api and tvdb_token and meta.get('original_language', "") == "en":
-            if meta.get('tvdb_episode_data') and meta.get('tvdb_episode_data').get('series_name') != "" and meta.get('title') != meta.get('tvdb_episode_data').get('series_name'):
-                series_name = meta.get('tvdb_episode_data').get('series_name', '')
-                if meta['debug']:
-                    console.print(f"[yellow]tvdb series name: {series_name}")
-                year_match = re.search(r'\b(19|20)\d{2}\b', series_name)
-                if year_match:
-                    extracted_year = year_match.group(0)
-                    meta['search_year'] = extracted_year
-                    series_name = re.sub(r'\s*\b(19|20)\d{2}\b\s*', '', series_name).strip()
-                series_name = series_name.replace('(', '').replace(')', '').strip()
-                meta['title'] = series_name
-            elif meta.get('tvdb_series_name') and meta.get('tvdb_series_name') != "" and meta.get('title') != meta.get('tvdb_series_name'):
-                series_name = meta.get('tvdb_series_name')
-                if meta['debug']:
-                    console.print(f"[yellow]tvdb series name: {series_name}")
-                year_match = re.search(r'\b(19|20)\d{2}\b', series_name)
-                if year_match:
-                    extracted_year = year_match.group(0)
-                    meta['search_year'] = extracted_year
-                    series_name = re.sub(r'\s*\b(19|20)\d{2}\b\s*', '', series_name).strip()
-                series_name = series_name.replace('(', '').replace(')', '').strip()
-                meta['title'] = series_name
-
-        # bluray.com data if config
-        get_bluray_info = self.config['DEFAULT'].get('get_bluray_info', False)
-        meta['bluray_score'] = int(float(self.config['DEFAULT'].get('bluray_score', 100)))
-        meta['bluray_single_score'] = int(float(self.config['DEFAULT'].get('bluray_single_score', 100)))
-        meta['use_bluray_images'] = self.config['DEFAULT'].get('use_bluray_images', False)
-        if meta.get('is_disc') == "BDMV" and get_bluray_info and (meta.get('distributor') is None or meta.get('region') is None) and meta.get('imdb_id') != 0:
+        async def use_tvdb_title():
+            # if we're using tvdb, lets use it's series name if it applies
+            # language check since tvdb returns original language names
+            if tvdb_api and tvdb_token and meta.get('original_language', "") == "en":
+                if meta.get('tvdb_episode_data') and meta.get('tvdb_episode_data').get('series_name') != "" and meta.get('title') != meta.get('tvdb_episode_data').get('series_name'):
+                    series_name = meta.get('tvdb_episode_data').get('series_name', '')
+                    if meta['debug']:
+                        console.print(f"[yellow]tvdb series name: {series_name}")
+                    year_match = re.search(r'\b(19|20)\d{2}\b', series_name)
+                    if year_match:
+                        extracted_year = year_match.group(0)
+                        meta['search_year'] = extracted_year
+                        series_name = re.sub(r'\s*\b(19|20)\d{2}\b\s*', '', series_name).strip()
+                    series_name = series_name.replace('(', '').replace(')', '').strip()
+                    meta['title'] = series_name
+                elif meta.get('tvdb_series_name') and meta.get('tvdb_series_name') != "" and meta.get('title') != meta.get('tvdb_series_name'):
+                    series_name = meta.get('tvdb_series_name')
+                    if meta['debug']:
+                        console.print(f"[yellow]tvdb series name: {series_name}")
+                    year_match = re.search(r'\b(19|20)\d{2}\b', series_name)
+                    if year_match:
+                        extracted_year = year_match.group(0)
+                        meta['search_year'] = extracted_year
+                        series_name = re.sub(r'\s*\b(19|20)\d{2}\b\s*', '', series_name).strip()
+                    series_name = series_name.replace('(', '').replace(')', '').strip()
+                    meta['title'] = series_name
+
+        async def fetch_bluray_releases():
             await get_bluray_releases(meta)
 
-        # and if we getting bluray images, we'll rehost them
-        if meta.get('is_disc') == "BDMV" and meta.get('use_bluray_images', False):
+        async def rehost_covers():
+            # and if we getting bluray images, we'll rehost them
             from src.rehostimages import check_hosts
             url_host_mapping = {
                 "ibb.co": "imgbb",
@@ -793,6 +822,31 @@ class Prep():
             approved_image_hosts = ['imgbox', 'imgbb', 'pixhost']
             await check_hosts(meta, "covers", url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=approved_image_hosts)
 
+        def is_tv():
+            return meta['category'] == "TV"
+
+        await resolve([
+            Lookup('mediainfo_ids', find_mediainfo_ids, when=lambda: meta.get('tmdb_id') == 0 or meta.get('imdb_id') == 0),
+            Lookup('search_ids', search_ids, needs=['mediainfo_ids'], interactive=True),
+            Lookup('id_data', fetch_id_data, needs=['search_ids']),
+            Lookup('tmdb', fetch_tmdb_data, needs=['id_data']),
+            Lookup('tmdb_ids', check_tmdb_ids, needs=['tmdb'], interactive=True),
+            Lookup('imdb_id', search_imdb_id, needs=['tmdb_ids'], when=lambda: meta.get('imdb_id') == 0, interactive=True),
+            Lookup('imdb_prefetch', prefetch_imdb_info, needs=['search_ids'],
+                   when=lambda: int(meta['imdb_id']) != 0 and not meta.get('quickie_search', False),
+                   answered=lambda: meta.get('imdb_info') is not None or prefetched_imdb_id not in (None, meta['imdb_id'])),
+            Lookup('imdb_info', fetch_imdb_info, needs=['imdb_id']),
+            Lookup('tvmaze', find_tvmaze_ids, needs=['imdb_id', 'imdb_info'], when=is_tv, interactive=True),
+            Lookup('tvdb_series', search_tvdb_series, needs=['tvmaze', 'imdb_info'],
+                   when=lambda: is_tv() and meta.get('tvdb_id', 0) == 0 and tvdb_api and tvdb_token),
+            Lookup('season_episode', find_season_episode, needs=['tvdb_series'], when=lambda: is_tv() and not meta.get('not_anime', False), interactive=True),
+            Lookup('tv_data', fetch_tv_data, needs=['season_episode'], when=is_tv),
+            Lookup('tvdb_title', use_tvdb_title, needs=['tv_data', 'imdb_info']),
+            Lookup('bluray', fetch_bluray_releases, needs=['imdb_id', 'tvmaze'], interactive=True,
+                   when=lambda: meta.get('is_disc') == "BDMV" and get_bluray_info and (meta.get('distributor') is None or meta.get('region') is None) and meta.get('imdb_id') != 0),
+            Lookup('covers', rehost_covers, needs=['bluray'], when=lambda: meta.get('is_disc') == "BDMV" and meta.get('use_bluray_images', False), interactive=True),
+        ], unattended=meta.get('unattended', False), debug=meta.get('debug', False))
+
         # user override check that only sets data after metadata setting
         if user_overrides and not meta.get('no_override', False):
             meta = await get_source_override(meta)
@@ -819,7 +873,7 @@ class Prep():
 
         meta['source'], meta['type'] = await get_source(meta['type'], video, meta['path'], meta['is_disc'], meta, folder_id, base_dir)
 
-        meta['uhd'] = await get_uhd(meta['type'], guessit(meta['path']), meta['resolution'], meta['path'])
+        meta['uhd'] = await get_uhd(meta['type'], parse_name(meta['path']), meta['resolution'], meta['path'])
         meta['hdr'] = await get_hdr(mi, bdinfo)
 
         meta['distributor'] = await get_distributor(meta['distributor'])
@@ -0,0 +1,178 @@
+import asyncio
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from rich.table import Table
+
+from src.console import console
+
+# Trace of the job the running code belongs to, None when --profile isn't used.
+# Context variables follow asyncio tasks and asyncio.to_thread, so spans deep inside
+# gathers and worker threads still land in the right job.
+_current = contextvars.ContextVar('profile_trace', default=None)
+_jobs = {}
+
+
+class JobTrace:
+    """Spans recorded for one release, written as a Chrome trace (chrome://tracing, Perfetto)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.events = []
+        self.lanes = {}
+        self.lock = threading.Lock()
+
+    def lane(self):
+        """Trace row for the running task or thread, so concurrent spans don't overlap on one row."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            key, label = id(task), task.get_name()
+        else:
+            key, label = threading.get_ident(), threading.current_thread().name
+        with self.lock:
+            tid = self.lanes.get(key)
+            if tid is None:
+                tid = self.lanes[key] = len(self.lanes) + 1
+                self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': label}})
+        return tid
+
+    def add(self, name, cat, start, end, tid, args=None):
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'pid': 1,
+            'tid': tid,
+            'ts': round((start - self.start) * 1e6),
+            'dur': round((end - start) * 1e6),
+        }
+        if args:
+            event['args'] = args
+        with self.lock:
+            self.events.append(event)
+
+    def spans(self):
+        return [event for event in self.events if event['ph'] == 'X']
+
+
+@contextmanager
+def span(name, cat='stage', **args):
+    """Time the enclosed block as one span of the current job, does nothing without --profile."""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    tid = trace.lane()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, cat, start, time.perf_counter(), tid, args)
+
+
+def traced(name=None, cat='stage'):
+    """Decorator recording every call of a function (sync or async) as a span."""
+    def decorator(func):
+        label = name or func.__name__
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current.get() is None:
+                    return await func(*args, **kwargs)
+                with span(label, cat):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return func(*args, **kwargs)
+            with span(label, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_job(meta):
+    """Start tracing the release in meta when --profile is set, the trace follows the current task."""
+    if not meta.get('profile'):
+        return
+    trace = _jobs[meta['path']] = JobTrace(os.path.basename(meta['path']))
+    _current.set(trace)
+
+
+@contextmanager
+def job_context(meta):
+    """Make the release's trace current in another task, e.g. a later pipeline stage."""
+    trace = _jobs.get(meta.get('path'))
+    if trace is None:
+        yield
+        return
+    token = _current.set(trace)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def finish_job(meta):
+    """Write tmp/{uuid}/trace.json and print where the time went."""
+    trace = _jobs.pop(meta.get('path'), None)
+    if trace is None:
+        return
+    if _current.get() is trace:
+        _current.set(None)
+    end = time.perf_counter()
+    trace.add(trace.name, 'job', trace.start, end, 0)
+
+    if meta.get('uuid'):
+        trace_path = os.path.join(meta['base_dir'], "tmp", meta['uuid'], "trace.json")
+    else:
+        trace_path = os.path.join(meta['base_dir'], "tmp", f"trace_{trace.name}.json")
+    try:
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace.events, 'displayTimeUnit': 'ms'}, f)
+    except OSError as e:
+        console.print(f"[red]Could not write trace file {trace_path}: {e}")
+        trace_path = None
+
+    print_summary(trace, end - trace.start)
+    if trace_path:
+        console.print(f"[cyan]Trace written to {trace_path}")
+
+
+def print_summary(trace, wall, limit=30):
+    totals = {}
+    for event in trace.spans():
+        if event['cat'] == 'job':
+            continue
+        entry = totals.setdefault((event['cat'], event['name']), [0, 0, 0])
+        entry[0] += 1
+        entry[1] += event['dur']
+        entry[2] = max(entry[2], event['dur'])
+
+    table = Table(title=f"Profile: {trace.name} ({wall:.2f}s)")
+    table.add_column("Stage")
+    table.add_column("Type")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("% of run", justify="right")
+    ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+    for (cat, name), (count, total, longest) in ranked[:limit]:
+        table.add_row(
+            name, cat, str(count), f"{total / 1e6:.2f}s", f"{longest / 1e6:.2f}s",
+            f"{total / 1e6 / wall * 100:.1f}%" if wall else "-"
+        )
+    console.print(table)
+    if len(ranked) > limit:
+        console.print(f"[dim]{len(ranked) - limit} more stages in the trace file")
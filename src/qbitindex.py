@@ -0,0 +1,118 @@
+import asyncio
+from collections import defaultdict
+
+import qbittorrentapi
+
+from src.console import console
+
+
+class QbitTorrentIndex:
+    """
+    Local index of the torrents in a qBittorrent client, keyed by name and infohash.
+    Built from a full sync/maindata response the first time it is used, then kept up to date
+    incrementally with the rid returned by qBittorrent, so every lookup is a dict access.
+    """
+
+    def __init__(self):
+        self.rid = 0
+        self.torrents = {}
+        self.by_name = defaultdict(set)
+        self.file_counts = {}
+        self.lock = None
+
+    def __len__(self):
+        return len(self.torrents)
+
+    def _unindex(self, torrent_hash):
+        fields = self.torrents.get(torrent_hash)
+        if fields is None:
+            return
+        self.by_name[fields.get('name')].discard(torrent_hash)
+
+    def _index(self, torrent_hash):
+        fields = self.torrents[torrent_hash]
+        self.by_name[fields.get('name')].add(torrent_hash)
+
+    def apply(self, data):
+        """Merge a sync/maindata response (full or partial) into the index."""
+        if data.get('full_update'):
+            self.torrents.clear()
+            self.by_name.clear()
+
+        for torrent_hash, fields in (data.get('torrents') or {}).items():
+            self._unindex(torrent_hash)
+            torrent = self.torrents.setdefault(torrent_hash, {'hash': torrent_hash})
+            torrent.update(fields)
+            self._index(torrent_hash)
+
+        for torrent_hash in data.get('torrents_removed') or []:
+            self._unindex(torrent_hash)
+            self.torrents.pop(torrent_hash, None)
+            self.file_counts.pop(torrent_hash, None)
+
+        self.rid = data.get('rid', self.rid)
+
+    async def refresh(self, qbt_client):
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            data = await asyncio.to_thread(qbt_client.sync_maindata, rid=self.rid)
+            self.apply(data)
+
+    def _torrents(self, hashes, qbt_client):
+        return [qbittorrentapi.TorrentDictionary(dict(self.torrents[h]), client=qbt_client) for h in hashes if h in self.torrents]
+
+    def get(self, torrent_hash, qbt_client):
+        torrents = self._torrents([torrent_hash.lower()], qbt_client)
+        return torrents[0] if torrents else None
+
+    def find_by_name(self, name, qbt_client):
+        return self._torrents(self.by_name.get(name, ()), qbt_client)
+
+    async def file_count(self, torrent_hash, qbt_client):
+        """Number of files in a torrent, fetched once per torrent and remembered."""
+        if torrent_hash not in self.file_counts:
+            files = await asyncio.to_thread(qbt_client.torrents_files, torrent_hash=torrent_hash)
+            self.file_counts[torrent_hash] = len(files)
+        return self.file_counts[torrent_hash]
+
+
+_indexes = {}
+_clients = {}
+
+
+async def get_qbit_client(client, timeout=None):
+    """
+    Return a logged in qbittorrentapi.Client for a client config, shared by every item processed in this session
+    (qbittorrentapi logs in again by itself when the session expires). Login errors are raised to the caller.
+    """
+    key = (client.get('qbit_url'), str(client.get('qbit_port')), client.get('qbit_user'), timeout)
+    qbt_client = _clients.get(key)
+    if qbt_client is None:
+        qbt_client = qbittorrentapi.Client(
+            host=client['qbit_url'],
+            port=client['qbit_port'],
+            username=client['qbit_user'],
+            password=client['qbit_pass'],
+            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True),
+            REQUESTS_ARGS={'timeout': timeout} if timeout else {}
+        )
+        login = asyncio.to_thread(qbt_client.auth_log_in)
+        await (asyncio.wait_for(login, timeout=timeout) if timeout else login)
+        _clients[key] = qbt_client
+    return qbt_client
+
+
+async def get_qbit_index(client, qbt_client, debug=False):
+    """
+    Return the index for a qBittorrent client config, shared by every item processed in this session,
+    after pulling the changes made since the last lookup.
+    """
+    key = (client.get('qbit_url'), str(client.get('qbit_port')), client.get('qbit_user'))
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = QbitTorrentIndex()
+    await index.refresh(qbt_client)
+    if debug:
+        console.print(f"[cyan]qBittorrent index holds {len(index)} torrents (rid {index.rid})")
+    return index
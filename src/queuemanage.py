@@ -8,6 +8,9 @@ from src.console import console
 from rich.markdown import Markdown
 from rich.style import Style
 
+# Video files picked up from folders by queues and watch mode
+queue_extensions = ('.mkv', '.mp4', '.ts')
+
 
 async def get_log_file(base_dir, queue_name):
     """
@@ -27,6 +30,26 @@ async def load_processed_files(log_file):
     return set()
 
 
+async def save_processed_file(log_file, file_path):
+    """
+    Adds a processed file to the log, deduplicating and always appending to the end.
+    """
+    if os.path.exists(log_file):
+        with open(log_file, "r") as f:
+            try:
+                processed_files = json.load(f)
+            except Exception:
+                processed_files = []
+    else:
+        processed_files = []
+
+    processed_files = [entry for entry in processed_files if entry != file_path]
+    processed_files.append(file_path)
+
+    with open(log_file, "w") as f:
+        json.dump(processed_files, f, indent=4)
+
+
 async def gather_files_recursive(path, allowed_extensions=None):
     """
     Gather files and first-level subfolders.
@@ -161,11 +184,10 @@ async def display_queue(queue, base_dir, queue_name, save_to_log=True):
 
 
 async def handle_queue(path, meta, paths, base_dir):
-    allowed_extensions = ['.mkv', '.mp4', '.ts']
+    allowed_extensions = list(queue_extensions)
     queue = []
 
     log_file = os.path.join(base_dir, "tmp", f"{meta['queue']}_queue.log")
-    allowed_extensions = ['.mkv', '.mp4', '.ts']
 
     if path.endswith('.txt') and meta.get('unit3d'):
         console.print(f"[bold yellow]Detected a text file for queue input: {path}[/bold yellow]")
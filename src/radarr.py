@@ -1,8 +1,10 @@
 import httpx
 from data.config import config
 from src.console import console
+from src.profiling import traced
 
 
+@traced()
 async def get_radarr_data(tmdb_id=None, filename=None, debug=False):
     if not any(key.startswith('radarr_api_key') for key in config['DEFAULT']):
         console.print("[red]No Radarr API keys are configured.[/red]")
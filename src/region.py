@@ -1,5 +1,5 @@
 import re
-from guessit import guessit
+from src.nameparse import parse_name, title_options
 
 
 async def get_region(bdinfo, region=None):
@@ -133,13 +133,13 @@ async def get_service(video=None, tag=None, audio=None, guess_title=None, get_se
 
     if get_services_only:
         return services
-    service = guessit(video).get('streaming_service', "")
+    service = parse_name(video).get('streaming_service', "")
 
     video_name = re.sub(r"[.()]", " ", video.replace(tag, '').replace(guess_title, ''))
     if "DTS-HD MA" in audio:
         video_name = video_name.replace("DTS-HD.MA.", "").replace("DTS-HD MA ", "")
     for key, value in services.items():
-        if (' ' + key + ' ') in video_name and key not in guessit(video, {"excludes": ["country", "language"]}).get('title', ''):
+        if (' ' + key + ' ') in video_name and key not in parse_name(video, title_options).get('title', ''):
             service = value
         elif key == service:
             service = value
@@ -257,21 +257,21 @@ async def handle_image_upload(meta, tracker, url_host_mapping, approved_image_ho
 
     # Fallback: glob for indexed screenshots if still not enough
     if len(all_screenshots) < multi_screens:
-        os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
+        tmp_dir = f"{meta['base_dir']}/tmp/{meta['uuid']}"
         image_patterns = ["*.png", ".[!.]*.png"]
         image_glob = []
         for pattern in image_patterns:
-            image_glob.extend(glob.glob(pattern))
+            image_glob.extend(glob.glob(os.path.join(tmp_dir, pattern)))
             if meta['debug']:
                 console.print(f"[cyan]Found {len(image_glob)} files matching pattern: {pattern}")
 
         unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
         unwanted_files = set()
         for pattern in unwanted_patterns:
-            unwanted_files.update(glob.glob(pattern))
+            unwanted_files.update(glob.glob(os.path.join(tmp_dir, pattern)))
             if pattern.startswith("FILE") or pattern.startswith("PLAYLIST") or pattern.startswith("POSTER"):
                 hidden_pattern = "." + pattern
-                unwanted_files.update(glob.glob(hidden_pattern))
+                unwanted_files.update(glob.glob(os.path.join(tmp_dir, hidden_pattern)))
 
         # Remove unwanted files
         image_glob = [file for file in image_glob if file not in unwanted_files]
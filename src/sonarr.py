@@ -1,8 +1,10 @@
 import httpx
 from data.config import config
 from src.console import console
+from src.profiling import traced
 
 
+@traced()
 async def get_sonarr_data(tvdb_id=None, filename=None, title=None, debug=False):
     if not any(key.startswith('sonarr_api_key') for key in config['DEFAULT']):
         console.print("[red]No Sonarr API keys are configured.[/red]")
@@ -1,7 +1,7 @@
 import os
 import re
 import json
-from guessit import guessit
+from src.nameparse import parse_name
 from src.console import console
 
 
@@ -42,7 +42,7 @@ async def get_tag(video, meta):
     # If regex patterns didn't work, fall back to guessit
     if not release_group:
         try:
-            parsed = guessit(video)
+            parsed = parse_name(video)
             release_group = parsed.get('release_group')
             if meta['debug']:
                 console.print(f"Guessit match: {release_group}")
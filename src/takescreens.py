@@ -18,6 +18,8 @@ from pymediainfo import MediaInfo
 from src.console import console
 from data.config import config
 from src.cleanup import cleanup, reset_terminal
+from src.artifacts import get_store
+from src.profiling import traced
 
 img_host = [
     config["DEFAULT"][key].lower()
@@ -38,25 +40,22 @@ optimize_images = config['DEFAULT'].get('optimize_images', True)
 algorithm = config['DEFAULT'].get('algorithm', 'mobius').strip()
 desat = float(config['DEFAULT'].get('desat', 10.0))
 frame_overlay = config['DEFAULT'].get('frame_overlay', False)
+frame_analysis = config['DEFAULT'].get('frame_analysis', True)
+frame_analysis_timeout = float(config['DEFAULT'].get('frame_analysis_timeout', 120))
 
 
-async def run_ffmpeg(command):
+def compile_ffmpeg(command):
+    cmd_list = command.compile()
     if platform.system() == 'Linux':
         ffmpeg_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'bin', 'ffmpeg', 'ffmpeg')
         if os.path.exists(ffmpeg_path):
-            cmd_list = command.compile()
             cmd_list[0] = ffmpeg_path
+    return cmd_list
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd_list,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            return process.returncode, stdout, stderr
 
+async def run_ffmpeg(command):
     process = await asyncio.create_subprocess_exec(
-        *command.compile(),
+        *compile_ffmpeg(command),
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE
     )
@@ -69,6 +68,7 @@ async def sanitize_filename(filename):
     return re.sub(r'[<>:"/\\|?*]', '_', filename)
 
 
+@traced()
 async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs, image_list, ffdebug, num_screens=None, force_screenshots=False):
     screens = meta['screens']
     if meta['debug']:
@@ -113,8 +113,7 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
     keyframe = 'nokey' if "VC-1" in bdinfo['video'][0]['codec'] or bdinfo['video'][0]['hdr_dv'] != "" else 'none'
     if meta['debug']:
         print(f"File: {file}, Length: {length}, Frame Rate: {frame_rate}")
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
-    existing_screens = glob.glob(f"{sanitized_filename}-*.png")
+    existing_screens = glob.glob(os.path.join(f"{base_dir}/tmp/{folder_id}", f"{sanitized_filename}-*.png"))
     total_existing = len(existing_screens) + len(existing_images)
     if not force_screenshots:
         num_screens = max(0, screens - total_existing)
@@ -435,6 +434,7 @@ async def capture_disc_task(index, file, ss_time, image_path, keyframe, loglevel
         return None
 
 
+@traced()
 async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
     screens = meta['screens']
     if 'image_list' not in meta:
@@ -518,7 +518,6 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
         return fallback_duration, 0
 
     main_set = meta['discs'][disc_num]['main_set'][1:] if len(meta['discs'][disc_num]['main_set']) > 1 else meta['discs'][disc_num]['main_set']
-    os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
     voblength, n = await _is_vob_good(0, 0, num_screens)
     ss_times = await valid_ss_time([], num_screens, voblength, frame_rate, meta, retake=retry_cap)
     capture_tasks = []
@@ -823,6 +822,7 @@ async def capture_dvd_screenshot(task):
         return (index, None)
 
 
+@traced()
 async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=None, force_screenshots=False, manual_frames=None):
     screens = meta['screens']
     if meta['debug']:
@@ -838,51 +838,50 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
         return
 
     try:
-        with open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", encoding='utf-8') as f:
-            mi = json.load(f)
-            video_track = mi['media']['track'][1]
+        mi = get_store(base_dir, folder_id).read_json("MediaInfo.json")
+        video_track = mi['media']['track'][1]
 
-            def safe_float(value, default=0.0, field_name=""):
-                if isinstance(value, (int, float)):
+        def safe_float(value, default=0.0, field_name=""):
+            if isinstance(value, (int, float)):
+                return float(value)
+            elif isinstance(value, str):
+                try:
                     return float(value)
-                elif isinstance(value, str):
-                    try:
-                        return float(value)
-                    except ValueError:
-                        console.print(f"[yellow]Warning: Could not convert string '{value}' to float for {field_name}, using default {default}[/yellow]")
-                        return default
-                elif isinstance(value, dict):
-                    for key in ['#value', 'value', 'duration', 'Duration']:
-                        if key in value:
-                            return safe_float(value[key], default, field_name)
-                    console.print(f"[yellow]Warning: {field_name} is a dict but no usable value found: {value}, using default {default}[/yellow]")
-                    return default
-                else:
-                    console.print(f"[yellow]Warning: Unable to convert to float: {type(value)} {value} for {field_name}, using default {default}[/yellow]")
+                except ValueError:
+                    console.print(f"[yellow]Warning: Could not convert string '{value}' to float for {field_name}, using default {default}[/yellow]")
                     return default
+            elif isinstance(value, dict):
+                for key in ['#value', 'value', 'duration', 'Duration']:
+                    if key in value:
+                        return safe_float(value[key], default, field_name)
+                console.print(f"[yellow]Warning: {field_name} is a dict but no usable value found: {value}, using default {default}[/yellow]")
+                return default
+            else:
+                console.print(f"[yellow]Warning: Unable to convert to float: {type(value)} {value} for {field_name}, using default {default}[/yellow]")
+                return default
 
-            length = safe_float(
-                video_track.get('Duration'),
-                safe_float(mi['media']['track'][0].get('Duration'), 3600.0, "General Duration"),
-                "Video Duration"
-            )
+        length = safe_float(
+            video_track.get('Duration'),
+            safe_float(mi['media']['track'][0].get('Duration'), 3600.0, "General Duration"),
+            "Video Duration"
+        )
 
-            width = safe_float(video_track.get('Width'), 1920.0, "Width")
-            height = safe_float(video_track.get('Height'), 1080.0, "Height")
-            par = safe_float(video_track.get('PixelAspectRatio'), 1.0, "PixelAspectRatio")
-            dar = safe_float(video_track.get('DisplayAspectRatio'), 16.0/9.0, "DisplayAspectRatio")
-            frame_rate = safe_float(video_track.get('FrameRate'), 24.0, "FrameRate")
-
-            if par == 1:
-                sar = w_sar = h_sar = 1
-            elif par < 1:
-                new_height = dar * height
-                sar = width / new_height
-                w_sar = 1
-                h_sar = sar
-            else:
-                sar = w_sar = par
-                h_sar = 1
+        width = safe_float(video_track.get('Width'), 1920.0, "Width")
+        height = safe_float(video_track.get('Height'), 1080.0, "Height")
+        par = safe_float(video_track.get('PixelAspectRatio'), 1.0, "PixelAspectRatio")
+        dar = safe_float(video_track.get('DisplayAspectRatio'), 16.0/9.0, "DisplayAspectRatio")
+        frame_rate = safe_float(video_track.get('FrameRate'), 24.0, "FrameRate")
+
+        if par == 1:
+            sar = w_sar = h_sar = 1
+        elif par < 1:
+            new_height = dar * height
+            sar = width / new_height
+            w_sar = 1
+            h_sar = sar
+        else:
+            sar = w_sar = par
+            h_sar = 1
     except Exception as e:
         console.print(f"[red]Error processing MediaInfo.json: {e}")
         if meta.get('debug', False):
@@ -891,7 +890,6 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
         return
     meta['frame_rate'] = frame_rate
     loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
 
     if manual_frames and meta['debug']:
         console.print(f"[yellow]Using manual frames: {manual_frames}")
@@ -939,23 +937,31 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
 
     num_capture = num_screens - existing_images_count
 
+    analyzed_frames = {}
+    if not ss_times and frame_analysis and not force_screenshots:
+        analyzed_frames = await pick_analyzed_frames(path, num_capture, length, frame_rate, meta)
+        ss_times = sorted(analyzed_frames)
+
     if not ss_times:
         ss_times = await valid_ss_time([], num_capture, length, frame_rate, meta, retake=force_screenshots)
 
     if frame_overlay:
         console.print("[yellow]Getting frame information for overlays...")
-        frame_info_tasks = [
-            get_frame_info(path, ss_times[i], meta)
+        meta['frame_info_map'] = {}
+        # Frames picked by the analysis scan are keyframes with a known timestamp already
+        for ss_time, info in analyzed_frames.items():
+            meta['frame_info_map'][ss_time] = info
+        frame_info_times = [
+            ss_times[i]
             for i in range(num_capture)
-            if not os.path.exists(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{i}.png")
-            or meta.get('retake', False)
+            if ss_times[i] not in analyzed_frames
+            and (not os.path.exists(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{i}.png") or meta.get('retake', False))
         ]
-        frame_info_results = await asyncio.gather(*frame_info_tasks)
-        meta['frame_info_map'] = {}
+        frame_info_results = await asyncio.gather(*[get_frame_info(path, ss_time, meta) for ss_time in frame_info_times])
 
         # Create a mapping from time to frame info
-        for i, info in enumerate(frame_info_results):
-            meta['frame_info_map'][ss_times[i]] = info
+        for ss_time, info in zip(frame_info_times, frame_info_results):
+            meta['frame_info_map'][ss_time] = info
 
         if meta['debug']:
             console.print(f"[cyan]Collected frame information for {len(frame_info_results)} frames")
@@ -1437,6 +1443,134 @@ async def valid_ss_time(ss_times, num_screens, length, frame_rate, meta, retake=
     return result_times
 
 
+async def analyze_frames(path, start, end, meta):
+    """
+    Scan the keyframes between start and end in one decode-only ffmpeg pass, reading
+    brightness, contrast and entropy for each one from a small downscaled copy.
+    Returns a list of {'time', 'yavg', 'yrange', 'entropy', 'ydif'} dicts, or [] when the scan fails.
+    """
+    command = (
+        ffmpeg
+        .input(path, ss=start, t=max(end - start, 1), skip_frame='nokey')['v']
+        .filter('scale', 320, -2)
+        # 8-bit so the thresholds in score_frame hold for 10-bit sources too
+        .filter('format', 'yuv420p')
+        .filter('signalstats')
+        .filter('entropy')
+        .filter('metadata', mode='print')
+        .output('-', format='null')
+        .global_args('-loglevel', 'info', '-nostats')
+    )
+    if meta.get('debug', False):
+        console.print(f"[cyan]FFmpeg frame analysis command: {' '.join(command.compile())}[/cyan]")
+
+    process = await asyncio.create_subprocess_exec(
+        *compile_ffmpeg(command),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout=frame_analysis_timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        console.print(f"[yellow]Frame analysis took longer than {frame_analysis_timeout:.0f}s, using evenly spaced frames.")
+        return []
+    if process.returncode != 0:
+        return []
+
+    frames = []
+    current = None
+    for line in stderr.decode('utf-8', errors='replace').splitlines():
+        pts_match = re.search(r'pts_time:(-?\d+(?:\.\d+)?)', line)
+        if pts_match:
+            current = {'time': start + float(pts_match.group(1))}
+            frames.append(current)
+            continue
+        value_match = re.search(r'lavfi\.([\w.]+)=(-?[\d.]+|nan|inf)', line)
+        if value_match and current is not None:
+            current[value_match.group(1)] = float(value_match.group(2))
+
+    return [
+        {
+            'time': frame['time'],
+            'yavg': frame.get('signalstats.YAVG', 0.0),
+            'yrange': frame.get('signalstats.YMAX', 0.0) - frame.get('signalstats.YMIN', 0.0),
+            'entropy': frame.get('entropy.normalized_entropy.normal.Y', 0.0),
+            'ydif': frame.get('signalstats.YDIF', 0.0),
+        }
+        for frame in frames
+    ]
+
+
+def score_frame(frame, previous):
+    """
+    Score a keyframe for use as a screenshot, None when it shouldn't be used at all.
+    Black, blank and low detail frames are rejected, keyframes that land right on a large
+    jump from the previous one (cuts into fades/flashes) are scored lower.
+    """
+    if frame['yavg'] < 25 or frame['yrange'] < 50 or frame['entropy'] < 0.55:
+        return None
+    score = frame['entropy'] + min(frame['yrange'], 200) / 1000
+    if previous is not None and abs(frame['yavg'] - previous['yavg']) > 60:
+        score -= 0.1
+    return score
+
+
+@traced('frame_analysis')
+async def pick_analyzed_frames(path, num_screens, length, frame_rate, meta):
+    """
+    Choose screenshot times from a single keyframe analysis pass, taking the best scoring
+    keyframe from each of num_screens equal sections of the video.
+    Returns {ss_time: frame_info}, empty when the analysis can't provide enough frames.
+    """
+    if num_screens <= 0 or length <= 0 or os.path.isdir(path):
+        return {}
+    start = length * 0.05
+    end = length * 0.9
+    analysis_start = time.time()
+    frames = await analyze_frames(path, start, end, meta)
+
+    scored = []
+    previous = None
+    for frame in frames:
+        score = score_frame(frame, previous)
+        previous = frame
+        if score is not None:
+            scored.append((score, frame['time']))
+
+    if len(scored) < num_screens:
+        if meta['debug']:
+            console.print(f"[yellow]Frame analysis found {len(scored)} usable keyframes, using evenly spaced frames.")
+        return {}
+
+    section = (end - start) / num_screens
+    chosen = []
+    for i in range(num_screens):
+        section_frames = [f for f in scored if start + i * section <= f[1] < start + (i + 1) * section]
+        if section_frames:
+            chosen.append(max(section_frames)[1])
+    # Sections without a usable keyframe take the best remaining ones from anywhere
+    for score, ss_time in sorted(scored, reverse=True):
+        if len(chosen) >= num_screens:
+            break
+        if ss_time not in chosen:
+            chosen.append(ss_time)
+
+    if meta['debug']:
+        console.print(f"[cyan]Analyzed {len(frames)} keyframes ({len(scored)} usable) in {time.time() - analysis_start:.2f}s, chose {sorted(chosen)}")
+
+    return {
+        ss_time: {
+            'frame_type': 'I',
+            'pts_time': ss_time,
+            'frame_number': int(ss_time * frame_rate)
+        }
+        for ss_time in chosen
+    }
+
+
+@traced('oxipng')
 async def worker_wrapper(image, optimize_image_task, executor):
     """ Async wrapper to run optimize_image_task in a separate process """
     loop = asyncio.get_running_loop()
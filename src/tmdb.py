@@ -1,16 +1,17 @@
 from src.console import console
+from src.episodeindex import EpisodeIndex, episode_index, index_episode
+from src.metacache import cached_session
 from src.imdb import get_imdb_aka_api, get_imdb_info_api
 from src.args import Args
 from data.config import config
 import re
-from guessit import guessit
+from src.nameparse import parse_name, parse_anime, title_options
+from src.profiling import traced
 import cli_ui
-import anitopy
 from datetime import datetime
 from difflib import SequenceMatcher
 import requests
 import json
-import httpx
 import asyncio
 import os
 
@@ -18,6 +19,7 @@ TMDB_API_KEY = config['DEFAULT'].get('tmdb_api', False)
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 
 
+@traced()
 async def get_tmdb_from_imdb(imdb_id, tvdb_id=None, search_year=None, filename=None, debug=False, mode="discord", category_preference=None, imdb_info=None):
     """Fetches TMDb ID using IMDb or TVDb ID.
 
@@ -35,7 +37,7 @@ async def get_tmdb_from_imdb(imdb_id, tvdb_id=None, search_year=None, filename=N
         url = f"{TMDB_BASE_URL}/find/{external_id}"
         params = {"api_key": TMDB_API_KEY, "external_source": source}
 
-        async with httpx.AsyncClient() as client:
+        async with cached_session('tmdb') as client:
             try:
                 response = await client.get(url, params=params, timeout=10)
                 response.raise_for_status()
@@ -137,6 +139,7 @@ async def get_tmdb_from_imdb(imdb_id, tvdb_id=None, search_year=None, filename=N
     return category, tmdb_id, original_language
 
 
+@traced()
 async def get_tmdb_id(filename, search_year, category, untouched_filename="", attempted=0, debug=False, secondary_title=None, path=None, final_attempt=None):
     search_results = {"results": []}
     secondary_results = {"results": []}
@@ -145,7 +148,7 @@ async def get_tmdb_id(filename, search_year, category, untouched_filename="", at
     if attempted is None:
         attempted = 0
 
-    async with httpx.AsyncClient() as client:
+    async with cached_session('tmdb') as client:
         try:
             # Primary search attempt with year
             if category == "MOVIE":
@@ -325,8 +328,8 @@ async def get_tmdb_id(filename, search_year, category, untouched_filename="", at
         # Last attempt: Try parsing a better title
         if attempted == 1:
             try:
-                parsed_title = anitopy.parse(
-                    guessit(untouched_filename, {"excludes": ["country", "language"]})['title']
+                parsed_title = parse_anime(
+                    parse_name(untouched_filename, title_options)['title']
                 )['anime_title']
                 original_category = "MOVIE"
                 console.print(f"[bold yellow]Trying parsed title: {parsed_title}[/bold yellow]")
@@ -338,7 +341,7 @@ async def get_tmdb_id(filename, search_year, category, untouched_filename="", at
         if attempted > 1 and path and not final_attempt:
             try:
                 folder_name = os.path.basename(path).replace("_", "").replace("-", "") if path else ""
-                title = guessit(folder_name, {"excludes": ["country", "language"]})['title']
+                title = parse_name(folder_name, title_options)['title']
                 original_category = "MOVIE"
                 console.print(f"[bold yellow]Trying folder name: {title}[/bold yellow]")
                 return await get_tmdb_id(title, search_year, original_category, untouched_filename, attempted + 3, debug=debug, secondary_title=secondary_title, path=path, final_attempt=True)
@@ -356,6 +359,7 @@ async def get_tmdb_id(filename, search_year, category, untouched_filename="", at
         return tmdb_id, category
 
 
+@traced()
 async def tmdb_other_meta(
     tmdb_id,
     path=None,
@@ -402,10 +406,10 @@ async def tmdb_other_meta(
 
     if tmdb_id == 0:
         try:
-            title = guessit(path, {"excludes": ["country", "language"]})['title'].lower()
+            title = parse_name(path, title_options)['title'].lower()
             title = title.split('aka')[0]
             result = await get_tmdb_id(
-                guessit(title, {"excludes": ["country", "language"]})['title'],
+                parse_name(title, title_options)['title'],
                 search_year,
                 {'tmdb_id': 0, 'search_year': search_year, 'debug': debug, 'category': category, 'mode': mode},
                 category
@@ -441,7 +445,7 @@ async def tmdb_other_meta(
     year = None
     original_imdb_id = imdb_id
 
-    async with httpx.AsyncClient() as client:
+    async with cached_session('tmdb') as client:
         # Get main media details first (movie or TV show)
         main_url = f"{TMDB_BASE_URL}/{('movie' if category == 'MOVIE' else 'tv')}/{tmdb_id}"
 
@@ -690,7 +694,7 @@ async def get_keywords(tmdb_id, category):
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/keywords"
 
-    async with httpx.AsyncClient() as client:
+    async with cached_session('tmdb') as client:
         try:
             response = await client.get(url, params={"api_key": TMDB_API_KEY})
             try:
@@ -739,7 +743,7 @@ async def get_directors(tmdb_id, category):
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/credits"
 
-    async with httpx.AsyncClient() as client:
+    async with cached_session('tmdb') as client:
         try:
             response = await client.get(url, params={"api_key": TMDB_API_KEY})
             try:
@@ -894,6 +898,7 @@ async def get_romaji(tmdb_name, mal):
     return romaji, mal_id, eng_title, season_year, episodes, demographic
 
 
+@traced()
 async def get_tmdb_imdb_from_mediainfo(mediainfo, category, is_disc, tmdbid, imdbid):
     if not is_disc:
         if mediainfo['media']['track'][0].get('extra'):
@@ -935,72 +940,92 @@ def extract_imdb_id(value):
     return None
 
 
-async def daily_to_tmdb_season_episode(tmdbid, date):
-    date = datetime.fromisoformat(str(date))
+async def get_tmdb_episode_index(tmdb_id):
+    """Every episode of a TMDb show: the show, then its seasons 20 at a time with append_to_response (see src/episodeindex.py)."""
+    return await episode_index('tmdb', tmdb_id, lambda: fetch_tmdb_episode_index(tmdb_id))
 
-    async with httpx.AsyncClient() as client:
-        # Get TV show information to get seasons
-        response = await client.get(
-            f"{TMDB_BASE_URL}/tv/{tmdbid}",
-            params={"api_key": TMDB_API_KEY}
-        )
-        try:
+
+async def fetch_tmdb_episode_index(tmdb_id):
+    try:
+        async with cached_session('tmdb') as client:
+            response = await client.get(f"{TMDB_BASE_URL}/tv/{tmdb_id}", params={"api_key": TMDB_API_KEY})
             response.raise_for_status()
             tv_data = response.json()
-            seasons = tv_data.get('seasons', [])
-        except Exception:
-            console.print(f"[bold red]Failed to fetch TV data: {response.status_code}[/bold red]")
-            return 0, 0
-
-        # Find the latest season that aired before or on the target date
-        season = 1
-        for each in seasons:
-            if not each.get('air_date'):
-                continue
-
-            air_date = datetime.fromisoformat(each['air_date'])
-            if air_date <= date:
-                season = int(each['season_number'])
-
-        # Get the specific season information
-        season_response = await client.get(
-            f"{TMDB_BASE_URL}/tv/{tmdbid}/season/{season}",
-            params={"api_key": TMDB_API_KEY}
-        )
-        try:
-            season_response.raise_for_status()
-            season_data = season_response.json()
-            season_info = season_data.get('episodes', [])
-        except Exception:
-            console.print(f"[bold red]Failed to fetch season data: {season_response.status_code}[/bold red]")
-            return 0, 0
-
-        # Find the episode that aired on the target date
-        episode = 1
-        for each in season_info:
-            if str(each.get('air_date', '')) == str(date.date()):
-                episode = int(each['episode_number'])
-                break
-        else:
-            console.print(f"[yellow]Unable to map the date ([bold yellow]{str(date)}[/bold yellow]) to a Season/Episode number")
+
+            season_numbers = [each['season_number'] for each in tv_data.get('seasons', []) if each.get('season_number') is not None]
+            batches = [[f"season/{number}" for number in season_numbers[i:i + 20]] for i in range(0, len(season_numbers), 20)]
+            responses = await asyncio.gather(*[
+                client.get(f"{TMDB_BASE_URL}/tv/{tmdb_id}", params={"api_key": TMDB_API_KEY, "append_to_response": ",".join(batch)})
+                for batch in batches
+            ])
+    except Exception as e:
+        console.print(f"[red]Error fetching TMDb episode list for {tmdb_id}: {e}[/red]")
+        return None
+
+    episodes = []
+    for batch, response in zip(batches, responses):
+        if response.status_code != 200:
+            console.print(f"[bold red]Failed to fetch season data: {response.status_code}[/bold red]")
+            return None
+        data = response.json()
+        for key in batch:
+            for each in data.get(key, {}).get('episodes', []):
+                episodes.append(index_episode(each.get('season_number'), each.get('episode_number'), None, each.get('air_date'), each))
+    return EpisodeIndex(tv_data, episodes)
+
+
+async def daily_to_tmdb_season_episode(tmdbid, date):
+    date = datetime.fromisoformat(str(date))
+
+    # Every daily episode of a show is mapped with the show's season lists
+    index = await get_tmdb_episode_index(tmdbid)
+    if index is None:
+        console.print(f"[bold red]Failed to fetch TV data for {tmdbid}[/bold red]")
+        return 0, 0
+
+    # Find the latest season that aired before or on the target date
+    season = 1
+    for each in index.series.get('seasons', []):
+        if not each.get('air_date'):
+            continue
+
+        air_date = datetime.fromisoformat(each['air_date'])
+        if air_date <= date:
+            season = int(each['season_number'])
+
+    # Find the episode that aired on the target date
+    episode = 1
+    for each in index.aired_on(date.date()):
+        if each['season'] == season:
+            episode = each['episode']
+            break
+    else:
+        console.print(f"[yellow]Unable to map the date ([bold yellow]{str(date)}[/bold yellow]) to a Season/Episode number")
 
     return season, episode
 
 
 async def get_episode_details(tmdb_id, season_number, episode_number, debug=False):
-    async with httpx.AsyncClient() as client:
+    # Every episode file of a show is answered from the show's season lists. Those don't carry
+    # the episode's external ids or images, so neither is part of the returned details.
+    index = await get_tmdb_episode_index(tmdb_id)
+    indexed = index.episode(season_number, episode_number) if index else None
+    async with cached_session('tmdb') as client:
         try:
-            # Get episode details
-            response = await client.get(
-                f"{TMDB_BASE_URL}/tv/{tmdb_id}/season/{season_number}/episode/{episode_number}",
-                params={"api_key": TMDB_API_KEY, "append_to_response": "images,credits,external_ids"}
-            )
-            try:
-                response.raise_for_status()
-                episode_data = response.json()
-            except Exception:
-                console.print(f"[bold red]Failed to fetch episode data: {response.status_code}[/bold red]")
-                return {}
+            if indexed:
+                episode_data = indexed['data']
+            else:
+                # Get episode details
+                response = await client.get(
+                    f"{TMDB_BASE_URL}/tv/{tmdb_id}/season/{season_number}/episode/{episode_number}",
+                    params={"api_key": TMDB_API_KEY}
+                )
+                try:
+                    response.raise_for_status()
+                    episode_data = response.json()
+                except Exception:
+                    console.print(f"[bold red]Failed to fetch episode data: {response.status_code}[/bold red]")
+                    return {}
 
             if debug:
                 console.print(f"[cyan]Episode Data: {json.dumps(episode_data, indent=2)[:600]}...")
@@ -1018,8 +1043,7 @@ async def get_episode_details(tmdb_id, season_number, episode_number, debug=Fals
                 'crew': [],
                 'guest_stars': [],
                 'director': '',
-                'writer': '',
-                'imdb_id': episode_data.get('external_ids', {}).get('imdb_id', '')
+                'writer': ''
             }
 
             # Extract crew information
@@ -1084,7 +1108,7 @@ async def get_logo(tmdb_id, category, debug=False, logo_languages=None, TMDB_API
                 console.print("[cyan]Using provided logo_json data instead of making an HTTP request[/cyan]")
         else:
             # Make HTTP request only if logo_json is not provided
-            async with httpx.AsyncClient() as client:
+            async with cached_session('tmdb') as client:
                 endpoint = "tv" if category == "TV" else "movie"
                 image_response = await client.get(
                     f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/images",
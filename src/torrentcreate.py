@@ -13,6 +13,8 @@ import sys
 import platform
 import glob
 from src.console import console
+from src.piececache import cached_piece_size, generate_pieces, remember_pieces, remember_torrent
+from src.profiling import traced
 
 
 def calculate_piece_size(total_size, min_size, max_size, files, meta):
@@ -124,6 +126,7 @@ def build_mkbrr_exclude_string(root_folder, filelist):
     return exclude_str
 
 
+@traced('hashing')
 def create_torrent(meta, path, output_filename, tracker_url=None):
     if meta['isdir']:
         if meta['keep_folder']:
@@ -141,7 +144,6 @@ def create_torrent(meta, path, output_filename, tracker_url=None):
                 include = []
                 exclude = []
             elif not meta.get('tv_pack', False):
-                os.chdir(path)
                 globs = glob.glob1(path, "*.mkv") + glob.glob1(path, "*.mp4") + glob.glob1(path, "*.ts")
                 no_sample_globs = [
                     os.path.abspath(f"{path}{os.sep}{file}") for file in globs
@@ -221,8 +223,15 @@ def create_torrent(meta, path, output_filename, tracker_url=None):
             if meta['debug']:
                 console.print("[green]Season pack completeness verified")
 
+    # A layout that was fully hashed before is rebuilt from the piece hash cache instead of running mkbrr again
+    cached_size = None
+    if meta.get('mkbrr') and tracker_url is None:
+        cached_size = get_cached_piece_size(meta, path, exclude, include)
+        if cached_size and meta['debug']:
+            console.print(f"[cyan]All pieces cached at {cached_size // 1024} KiB, skipping mkbrr")
+
     # If using mkbrr, run the external application
-    if meta.get('mkbrr'):
+    if meta.get('mkbrr') and not cached_size:
         try:
             mkbrr_binary = get_mkbrr_path(meta)
             output_path = os.path.join(meta['base_dir'], "tmp", meta['uuid'], f"{output_filename}.torrent")
@@ -309,6 +318,7 @@ def create_torrent(meta, path, output_filename, tracker_url=None):
                 console.print("[bold red]mkbrr did not create a torrent file!")
                 raise FileNotFoundError(f"Expected torrent file {output_path} was not created")
             else:
+                remember_torrent(output_path, str(path))
                 return output_path
 
         except subprocess.CalledProcessError as e:
@@ -327,7 +337,7 @@ def create_torrent(meta, path, output_filename, tracker_url=None):
         for root, dirs, files in os.walk(path):
             initial_size += sum(os.path.getsize(os.path.join(root, f)) for f in files if os.path.isfile(os.path.join(root, f)))
 
-    piece_size = calculate_piece_size(initial_size, 32768, 134217728, [], meta)
+    piece_size = cached_size or calculate_piece_size(initial_size, 32768, 134217728, [], meta)
 
     # Fallback to CustomTorrent if mkbrr is not used
     torrent = CustomTorrent(
@@ -344,7 +354,14 @@ def create_torrent(meta, path, output_filename, tracker_url=None):
         piece_size=piece_size
     )
 
-    torrent.generate(callback=torf_cb, interval=5)
+    try:
+        cache_used = generate_pieces(torrent, callback=torf_cb, interval=5, debug=meta['debug'])
+    except Exception as e:
+        console.print(f"[yellow]Piece hash cache failed, hashing everything: {e}")
+        cache_used = False
+    if not cache_used:
+        torrent.generate(callback=torf_cb, interval=5)
+        remember_pieces(torrent)
     torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent", overwrite=True)
     torrent.verify_filesize(path)
 
@@ -360,6 +377,23 @@ def create_torrent(meta, path, output_filename, tracker_url=None):
     return torrent
 
 
+def get_cached_piece_size(meta, path, exclude, include):
+    if meta.get('max_piece_size'):
+        try:
+            max_size = min(int(meta['max_piece_size']) * 1024 * 1024, torf.Torrent.piece_size_max)
+        except ValueError:
+            max_size = 134217728
+    else:
+        max_size = 134217728
+    try:
+        layout = torf.Torrent(path=path, exclude_globs=exclude or [], include_globs=include or [])
+        return cached_piece_size([str(f) for f in layout.filepaths], max_size)
+    except Exception as e:
+        if meta['debug']:
+            console.print(f"[yellow]Could not check piece hash cache: {e}")
+        return None
+
+
 torf_start_time = time.time()
 
 
@@ -1,13 +1,36 @@
 import asyncio
+import time
 import traceback
 import cli_ui
-from src.trackers.THR import THR
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP
 from src.trackers.COMMON import COMMON
 from src.manualpackage import package
+from src.profiling import span, traced
+from src.trackerstatus import forget_credentials
 from cogs.redaction import redact_private_info
 
+# Minimum number of seconds between two uploads to the same tracker.
+# Can be overridden per tracker with 'upload_delay' in the tracker config.
+tracker_upload_delays = {
+    'SN': 16,
+    'PTP': 5,
+}
+
+# Trackers that may prompt the user during upload, these never run their
+# upload alongside another prompting tracker when not in unattended mode.
+interactive_trackers = {
+    'BHD', 'BLU', 'FL', 'HDT', 'HUNO', 'MANUAL', 'MTV', 'OTW', 'PTP', 'THR', 'TIK', 'TTG', 'TVC', 'ULCX'
+}
+
+# Trackers that rehost screenshots (check_hosts switches meta['imghost'] while it uploads) or write
+# pack images into meta, these never run their upload alongside each other, attended or not.
+image_trackers = {
+    'BHD', 'DC', 'HUNO', 'MTV', 'NYAA', 'OE', 'PTP'
+}
+
+_last_upload_times = {}
+_rate_limit_locks = {}
+
 
 async def check_mod_q_and_draft(tracker_class, meta, debug, disctype):
     tracker_capabilities = {
@@ -34,10 +57,49 @@ async def check_mod_q_and_draft(tracker_class, meta, debug, disctype):
     return modq, draft
 
 
+async def wait_for_rate_limit(tracker, config):
+    """Sleep until the tracker's upload delay has passed since its last upload."""
+    tracker_config = config['TRACKERS'].get(tracker, {})
+    delay = float(tracker_config.get('upload_delay', tracker_upload_delays.get(tracker, 0)) or 0)
+    if delay <= 0:
+        return
+    last_upload = _last_upload_times.get(tracker)
+    if last_upload is not None:
+        remaining = delay - (time.monotonic() - last_upload)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+
+def mark_uploaded(tracker):
+    _last_upload_times[tracker] = time.monotonic()
+
+
+async def rate_limited_upload(tracker, config, upload):
+    """Run an upload coroutine function, spacing calls to the same tracker by its upload delay."""
+    lock = _rate_limit_locks.setdefault(tracker, asyncio.Lock())
+    async with lock:
+        await wait_for_rate_limit(tracker, config)
+        try:
+            with span(f"upload {tracker}", cat='tracker'):
+                return await upload()
+        finally:
+            mark_uploaded(tracker)
+
+
+@traced('tracker_uploads')
 async def process_trackers(meta, config, client, console, api_trackers, tracker_class_map, http_trackers, other_api_trackers):
     common = COMMON(config=config)
     tracker_setup = TRACKER_SETUP(config=config)
     enabled_trackers = tracker_setup.trackers_enabled(meta)
+    upload_limit = max(1, int(config['DEFAULT'].get('tracker_upload_limit', 4)))
+    upload_semaphore = asyncio.Semaphore(upload_limit)
+    prompt_lock = asyncio.Lock()
+    image_lock = asyncio.Lock()
+    client_lock = asyncio.Lock()
+
+    async def add_to_client(tracker_name):
+        async with client_lock:
+            await client.add_to_client(meta, tracker_name)
 
     async def process_single_tracker(tracker):
         tracker_class = tracker_class_map[tracker](config=config)
@@ -62,7 +124,7 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                     if draft == "Yes":
                         console.print(f"(draft: {draft})")
                     try:
-                        await tracker_class.upload(meta, disctype)
+                        await rate_limited_upload(tracker, config, lambda: tracker_class.upload(meta, disctype))
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
@@ -72,7 +134,7 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                     return
                 status = meta.get('tracker_status', {}).get(tracker_class.tracker, {})
                 if 'status_message' in status and "data error" not in str(status['status_message']):
-                    await client.add_to_client(meta, tracker_class.tracker)
+                    await add_to_client(tracker_class.tracker)
 
         elif tracker in other_api_trackers:
             tracker_status = meta.get('tracker_status', {})
@@ -82,19 +144,17 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                     if tracker == "RTF":
                         await tracker_class.api_test(meta)
                     try:
-                        await tracker_class.upload(meta, disctype)
+                        await rate_limited_upload(tracker, config, lambda: tracker_class.upload(meta, disctype))
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
                         return
-                    if tracker == 'SN':
-                        await asyncio.sleep(16)
                 except Exception:
                     console.print(traceback.format_exc())
                     return
                 status = meta.get('tracker_status', {}).get(tracker_class.tracker, {})
                 if 'status_message' in status and "data error" not in str(status['status_message']):
-                    await client.add_to_client(meta, tracker_class.tracker)
+                    await add_to_client(tracker_class.tracker)
 
         elif tracker in http_trackers:
             tracker_status = meta.get('tracker_status', {})
@@ -104,17 +164,21 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                     if tracker == "AR":
                         await tracker_class.validate_credentials(meta) is True
                     try:
-                        await tracker_class.upload(meta, disctype)
+                        await rate_limited_upload(tracker, config, lambda: tracker_class.upload(meta, disctype))
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
+                        forget_credentials(tracker)
                         return
                 except Exception:
                     console.print(traceback.format_exc())
+                    forget_credentials(tracker)
                     return
                 status = meta.get('tracker_status', {}).get(tracker_class.tracker, {})
                 if 'status_message' in status and "data error" not in str(status['status_message']):
-                    await client.add_to_client(meta, tracker_class.tracker)
+                    await add_to_client(tracker_class.tracker)
+                else:
+                    forget_credentials(tracker)
 
         elif tracker == "MANUAL":
             if meta['unattended']:
@@ -141,38 +205,66 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
             tracker_status = meta.get('tracker_status', {})
             upload_status = tracker_status.get(tracker, {}).get('upload', False)
             if upload_status:
-                thr = THR(config=config)
+                thr = tracker_class_map['THR'](config=config)
                 try:
-                    await thr.upload(meta, disctype)
+                    await rate_limited_upload(tracker, config, lambda: thr.upload(meta, disctype))
                 except Exception as e:
                     console.print(f"[red]Upload failed: {e}")
                     console.print(traceback.format_exc())
                     return
-                await client.add_to_client(meta, "THR")
+                await add_to_client("THR")
 
         elif tracker == "PTP":
             tracker_status = meta.get('tracker_status', {})
             upload_status = tracker_status.get(tracker, {}).get('upload', False)
             if upload_status:
                 try:
-                    ptp = PTP(config=config)
+                    ptp = tracker_class_map['PTP'](config=config)
                     groupID = meta.get('ptp_groupID', None)
                     ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
                     try:
-                        await ptp.upload(meta, ptpUrl, ptpData, disctype)
-                        await asyncio.sleep(5)
+                        await rate_limited_upload(tracker, config, lambda: ptp.upload(meta, ptpUrl, ptpData, disctype))
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
                         return
-                    await client.add_to_client(meta, "PTP")
+                    await add_to_client("PTP")
                 except Exception:
                     console.print(traceback.format_exc())
                     return
 
-    # Process each tracker sequentially
-    for tracker in enabled_trackers:
-        await process_single_tracker(tracker)
+    async def run_tracker(tracker):
+        if tracker in image_trackers:
+            async with image_lock:
+                await process_single_tracker(tracker)
+        else:
+            await process_single_tracker(tracker)
+
+    async def schedule_tracker(tracker):
+        async with upload_semaphore:
+            # Always taken before the image lock, so the two can't deadlock
+            if not meta['unattended'] and tracker in interactive_trackers:
+                async with prompt_lock:
+                    await run_tracker(tracker)
+            else:
+                await run_tracker(tracker)
+
+    # Manual packaging rewrites every tracker description, so finish it before any upload starts
+    if "MANUAL" in enabled_trackers:
+        await schedule_tracker("MANUAL")
+    upload_trackers = [tracker for tracker in enabled_trackers if tracker != "MANUAL"]
+
+    # Upload to trackers concurrently, each tracker only writes its own tracker_status entry
+    results = await asyncio.gather(*[schedule_tracker(tracker) for tracker in upload_trackers], return_exceptions=True)
+    for tracker, result in zip(upload_trackers, results):
+        if isinstance(result, Exception):
+            console.print(f"[red]{tracker} upload task failed: {result}")
+
+    # Keep the status order matching the enabled tracker order
+    tracker_status = meta.get('tracker_status', {})
+    ordered_status = {tracker: tracker_status[tracker] for tracker in enabled_trackers if tracker in tracker_status}
+    ordered_status.update({tracker: status for tracker, status in tracker_status.items() if tracker not in ordered_status})
+    meta['tracker_status'] = ordered_status
 
     try:
         if meta.get('print_tracker_messages', False):
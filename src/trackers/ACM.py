@@ -5,7 +5,9 @@ import requests
 import os
 import platform
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_get, session_post, shared_session
 from src.console import console
+from src.artifacts import read_artifact
 import bencodepy
 import httpx
 
@@ -204,15 +206,15 @@ class ACM():
             anon = 1
 
         if meta['bdinfo'] is not None:
-            # bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            # bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
             mi_dump = None
             bd_dump = ""
             for each in meta['discs']:
                 bd_dump = bd_dump + each['summary'].strip() + "\n\n"
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO.txt")
             bd_dump = None
-        desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
         open_torrent = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", 'rb')
         files = {'torrent': open_torrent}
         data = {
@@ -257,7 +259,7 @@ class ACM():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await session_post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 meta['tracker_status'][self.tracker]['status_message'] = response.json()
             except Exception:
@@ -282,7 +284,7 @@ class ACM():
         }
         # Adding Name to search seems to override tmdb
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -292,7 +294,7 @@ class ACM():
                 else:
                     console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
         except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 5 seconds")
+            console.print("[bold red]Request timed out")
         except httpx.RequestError as e:
             console.print(f"[bold red]Unable to search for existing torrents: {e}")
         except Exception as e:
@@ -342,7 +344,7 @@ class ACM():
         return name
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as descfile:
             from src.bbcode import BBCODE
             # Add This line for all web-dls
@@ -394,7 +396,7 @@ class ACM():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await session_get(self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import os
 import glob
 import httpx
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post, shared_session
 from src.console import console
 from src.languages import process_desc_language, has_english_language
+from src.artifacts import read_artifact
 
 
 class AITHER():
@@ -48,11 +49,11 @@ class AITHER():
             anon = 1
         if meta['bdinfo'] is not None:
             mi_dump = None
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO.txt")
             bd_dump = None
-        desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
         torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
         open_torrent = open(torrent_file_path, 'rb')
         files = {'torrent': open_torrent}
@@ -113,7 +114,7 @@ class AITHER():
             data['season_number'] = meta.get('season_int', '0')
             data['episode_number'] = meta.get('episode_int', '0')
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await session_post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 meta['tracker_status'][self.tracker]['status_message'] = response.json()
                 # adding torrent link to comment of torrent file
@@ -241,7 +242,7 @@ class AITHER():
             params['name'] = params['name'] + f" {meta['edition']}"
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -254,7 +255,7 @@ class AITHER():
                 else:
                     console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
         except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 5 seconds")
+            console.print("[bold red]Request timed out")
         except httpx.RequestError as e:
             console.print(f"[bold red]Unable to search for existing torrents: {e}")
         except Exception as e:
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import httpx
 import json
 
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_get, session_post, shared_session
 from src.console import console
+from src.artifacts import read_artifact
 
 
 class AL():
@@ -165,7 +166,7 @@ class AL():
         return name
 
     async def get_mal_data(self, anime_id, meta):
-        response = requests.get(f"https://api.jikan.moe/v4/anime/{anime_id}")
+        response = await session_get(f"https://api.jikan.moe/v4/anime/{anime_id}")
         content = response.json()
         title = content['data']['title'] if content['data']['title'] else None
         meta['mal_rating'] = content['data']['rating'].upper() if content['data']['rating'] else None
@@ -307,11 +308,11 @@ class AL():
 
         if meta['bdinfo'] is not None:
             mi_dump = None
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO.txt")
             bd_dump = None
-        desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
         open_torrent = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", 'rb')
         files = {'torrent': open_torrent}
         data = {
@@ -358,7 +359,7 @@ class AL():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await session_post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 meta['tracker_status'][self.tracker]['status_message'] = response.json()
                 # adding torrent link to comment of torrent file
@@ -390,7 +391,7 @@ class AL():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -400,7 +401,7 @@ class AL():
                 else:
                     console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
         except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 5 seconds")
+            console.print("[bold red]Request timed out")
         except httpx.RequestError as e:
             console.print(f"[bold red]Unable to search for existing torrents: {e}")
         except Exception as e:
@@ -2,15 +2,16 @@
 # import discord
 import os
 import asyncio
-import requests
 import platform
 import httpx
 import json
 from pymediainfo import MediaInfo
 from pathlib import Path
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post, shared_session
 from src.console import console
 from src.torrentcreate import create_torrent
+from src.artifacts import read_artifact
 
 
 class ANT():
@@ -79,7 +80,7 @@ class ANT():
         flags = await self.get_flags(meta)
 
         if meta['bdinfo'] is not None:
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
             bd_dump = f'[spoiler=BDInfo][pre]{bd_dump}[/pre][/spoiler]'
             path = os.path.join(meta['bdinfo']['path'], 'STREAM')
             longest_file = max(
@@ -91,7 +92,7 @@ class ANT():
             media_info_output = str(MediaInfo.parse(m2ts, output="text", full=False))
             mi_dump = media_info_output.replace('\r\n', '\n')
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO.txt")
         open_torrent = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", 'rb')
         files = {'file_input': open_torrent}
         data = {
@@ -117,7 +118,7 @@ class ANT():
 
         try:
             if not meta['debug']:
-                response = requests.post(url=self.upload_url, files=files, data=data, headers=headers)
+                response = await session_post(url=self.upload_url, files=files, data=data, headers=headers)
                 if response.status_code in [200, 201]:
                     response_data = response.json()
                     meta['tracker_status'][self.tracker]['status_message'] = response_data
@@ -161,7 +162,7 @@ class ANT():
             params['imdb'] = meta['imdb']
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session('https://anthelion.me/api') as client:
                 response = await client.get(url='https://anthelion.me/api', params=params)
                 if response.status_code == 200:
                     try:
@@ -199,7 +200,7 @@ class ANT():
                     console.print(f"[bold red]ANT Failed to search torrents. HTTP Status: {response.status_code}")
                     meta['skipping'] = "ANT"
         except httpx.TimeoutException:
-            console.print("[bold red]ANT Request timed out after 5 seconds")
+            console.print("[bold red]ANT Request timed out")
             meta['skipping'] = "ANT"
         except httpx.RequestError as e:
             console.print(f"[bold red]ANT Unable to search for existing torrents: {e}")
@@ -13,6 +13,7 @@ from src.exceptions import *  # noqa F403
 from bs4 import BeautifulSoup
 from src.console import console
 from src.trackers.COMMON import COMMON
+from src.artifacts import read_artifact
 from pymediainfo import MediaInfo
 
 
@@ -267,7 +268,7 @@ class AR():
         heading = "[COLOR=GREEN][size=6]"
         subheading = "[COLOR=RED][size=4]"
         heading_end = "[/size][/COLOR]"
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         base = re.sub(r'\[center\]\[spoiler=Scene NFO:\].*?\[/center\]', '', base, flags=re.DOTALL)
         base = re.sub(r'\[center\]\[spoiler=FraMeSToR NFO:\].*?\[/center\]', '', base, flags=re.DOTALL)
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf8') as descfile:
@@ -300,7 +301,7 @@ class AR():
                     media_info = MediaInfo.parse(video, output="STRING", full=False, mediainfo_options={"inform": f"file://{mi_template}"})
                     description += (f"""[code]\n{media_info}\n[/code]\n""")
                     # adding full mediainfo as spoiler
-                    full_mediainfo = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read()
+                    full_mediainfo = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt")
                     description += f"[hide=FULL MEDIAINFO][code]{full_mediainfo}[/code][/hide]\n"
                 else:
                     console.print("[bold red]Couldn't find the MediaInfo template")
@@ -9,6 +9,7 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 from pymediainfo import MediaInfo
 from src.console import console
+from src.httpsessions import shared_session
 from src.exceptions import UploadException
 from src.languages import process_desc_language
 
@@ -214,7 +215,7 @@ class ASC(COMMON):
 
         url = f"https://api.themoviedb.org/3/{endpoint}?api_key={tmdb_api}&language=pt-BR&append_to_response=credits,videos"
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with shared_session(url) as client:
                 response = await client.get(url)
                 if response.status_code == 200:
                     return response.json()
@@ -286,7 +287,7 @@ class ASC(COMMON):
         async def _fetch(payload):
             try:
                 await self.load_cookies(meta)
-                response = self.session.post(url, data=payload, timeout=20)
+                response = await asyncio.to_thread(self.session.post, url, data=payload, timeout=20)
                 response.raise_for_status()
                 return response.json().get('ASC')
             except Exception:
@@ -604,7 +605,7 @@ class ASC(COMMON):
 
         with open(torrent_path, 'rb') as torrent_file:
             files = {'torrent': (f"{self.tracker}.{meta.get('infohash', '')}.placeholder.torrent", torrent_file, "application/x-bittorrent")}
-            response = self.session.post(upload_url, data=data, files=files, timeout=60)
+            response = await asyncio.to_thread(self.session.post, upload_url, data=data, files=files, timeout=60)
 
         if "foi enviado com sucesso" in response.text:
             await self.successful_upload(response.text, meta)
@@ -642,7 +643,7 @@ class ASC(COMMON):
         try:
             torrent_id = relative_url.split('id=')[-1]
             approval_url = f"{self.base_url}/uploader_app.php?id={torrent_id}"
-            approval_response = self.session.get(approval_url, timeout=30)
+            approval_response = await asyncio.to_thread(self.session.get, approval_url, timeout=30)
             approval_response.raise_for_status()
         except Exception as e:
             console.print(f"[bold red]Erro durante a tentativa de aprovação automática: {e}[/bold red]")
@@ -660,7 +661,7 @@ class ASC(COMMON):
 
         try:
             await self.load_cookies(meta)
-            response = self.session.get(search_url, timeout=30)
+            response = await asyncio.to_thread(self.session.get, search_url, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             releases = soup.find_all('li', class_='list-group-item dark-gray')
@@ -706,7 +707,7 @@ class ASC(COMMON):
 
                     torrent_id = details_link_tag['href'].split('id=')[-1]
                     file_page_url = f"{self.base_url}/torrents-arquivos.php?id={torrent_id}"
-                    file_page_response = self.session.get(file_page_url, timeout=15)
+                    file_page_response = await asyncio.to_thread(self.session.get, file_page_url, timeout=15)
                     file_page_response.raise_for_status()
                     file_page_soup = BeautifulSoup(file_page_response.text, 'html.parser')
 
@@ -741,7 +742,7 @@ class ASC(COMMON):
         try:
             test_url = f"{self.base_url}/gerador.php"
 
-            response = self.session.get(test_url, timeout=10, allow_redirects=False)
+            response = await asyncio.to_thread(self.session.get, test_url, timeout=10, allow_redirects=False)
 
             if response.status_code == 200 and 'gerador.php' in response.url:
                 return True
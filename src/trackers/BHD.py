@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 from difflib import SequenceMatcher
 import os
 import platform
@@ -11,8 +10,10 @@ import re
 import cli_ui
 import glob
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post, shared_session
 from src.console import console
 from src.rehostimages import check_hosts
+from src.artifacts import read_artifact
 
 
 class BHD():
@@ -65,7 +66,7 @@ class BHD():
         else:
             mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8')
 
-        desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
         torrent_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
         files = {
             'mediainfo': mi_dump,
@@ -126,7 +127,7 @@ class BHD():
         url = self.upload_url + self.config['TRACKERS'][self.tracker]['api_key'].strip()
         details_link = {}
         if meta['debug'] is False:
-            response = requests.post(url=url, files=files, data=data, headers=headers)
+            response = await session_post(url=url, files=files, data=data, headers=headers)
             try:
                 response = response.json()
                 if int(response['status_code']) == 0:
@@ -134,7 +135,7 @@ class BHD():
                     if response['status_message'].startswith('Invalid imdb_id'):
                         console.print('[yellow]RETRYING UPLOAD')
                         data['imdb_id'] = 1
-                        response = requests.post(url=url, files=files, data=data, headers=headers)
+                        response = await session_post(url=url, files=files, data=data, headers=headers)
                         response = response.json()
                     elif response['status_message'].startswith('Invalid name value'):
                         console.print(f"[bold yellow]Submitted Name: {bhd_name}")
@@ -236,7 +237,7 @@ class BHD():
         return type_id
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         base = base.replace("[user]", "").replace("[/user]", "")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as desc:
             if meta.get('discs', []) != []:
@@ -366,7 +367,7 @@ class BHD():
 
         url = f"https://beyond-hd.me/api/torrents/{self.config['TRACKERS']['BHD']['api_key'].strip()}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(url) as client:
                 response = await client.post(url, params=data)
                 if response.status_code == 200:
                     data = response.json()
@@ -388,7 +389,7 @@ class BHD():
                 else:
                     console.print(f"[bold red]HTTP request failed. Status: {response.status_code}")
         except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 5 seconds")
+            console.print("[bold red]Request timed out")
         except httpx.RequestError as e:
             console.print(f"[bold red]Unable to search for existing torrents: {e}")
         except Exception as e:
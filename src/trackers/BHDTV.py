@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 # import discord
-import requests
 from src.console import console
 from pprint import pprint
 import os
 import traceback
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post
+from src.artifacts import read_artifact
 from pymediainfo import MediaInfo
 
 
@@ -53,11 +54,11 @@ class BHDTV():
 
         if meta['bdinfo'] is not None:
             mi_dump = None
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt")
             bd_dump = None
-        desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
         open_torrent = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", 'rb')
         files = {'file': open_torrent}
 
@@ -86,7 +87,7 @@ class BHDTV():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, data=data, files=files)
+            response = await session_post(url=self.upload_url, data=data, files=files)
             try:
                 # pprint(data)
                 meta['tracker_status'][self.tracker]['status_message'] = response.json()
@@ -184,7 +185,7 @@ class BHDTV():
         return resolution_id
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as desc:
             desc.write(base.replace("[img=250]", "[img=250x250]"))
             images = meta['image_list']
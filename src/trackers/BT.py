@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import httpx
 import langcodes
 import os
@@ -10,6 +11,7 @@ from bs4 import BeautifulSoup
 from http.cookiejar import MozillaCookieJar
 from langcodes.tag_parser import LanguageTagError
 from src.console import console
+from src.httpsessions import shared_session
 from src.languages import process_desc_language
 
 
@@ -131,7 +133,7 @@ class BT(COMMON):
 
         url = f"https://api.themoviedb.org/3/{self.category.lower()}/{self.tmdb_id}?api_key={tmdb_api}&language=pt-BR&append_to_response=videos"
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with shared_session(url) as client:
                 response = await client.get(url)
                 if response.status_code == 200:
                     return response.json()
@@ -161,7 +163,7 @@ class BT(COMMON):
 
         found_items = []
         try:
-            response = self.session.get(search_url)
+            response = await asyncio.to_thread(self.session.get, search_url)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -180,7 +182,7 @@ class BT(COMMON):
 
             for group_link in group_links:
                 group_url = f"{self.base_url}/{group_link}"
-                group_response = self.session.get(group_url)
+                group_response = await asyncio.to_thread(self.session.get, group_url)
                 group_response.raise_for_status()
                 group_soup = BeautifulSoup(group_response.text, 'html.parser')
 
@@ -240,7 +242,7 @@ class BT(COMMON):
 
         try:
             upload_page_url = f"{self.base_url}/upload.php"
-            response = self.session.get(upload_page_url, timeout=10, allow_redirects=True)
+            response = await asyncio.to_thread(self.session.get, upload_page_url, timeout=10, allow_redirects=True)
 
             if 'login.php' in str(response.url):
                 console.print(f"[bold red]Falha na validação do {self.tracker}. O cookie parece estar expirado ou é inválido.[/bold red]")
@@ -697,7 +699,7 @@ class BT(COMMON):
             files = {'file_input': (f"{self.tracker}.placeholder.torrent", torrent_file, "application/x-bittorrent")}
 
             try:
-                response = self.session.post(upload_url, data=final_data, files=files, timeout=60)
+                response = await asyncio.to_thread(self.session.post, upload_url, data=final_data, files=files, timeout=60)
 
                 if response.status_code == 200 and 'torrents.php?id=' in str(response.url):
                     final_url = str(response.url)
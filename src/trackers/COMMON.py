@@ -1,3 +1,4 @@
+import asyncio
 from torf import Torrent
 import os
 import requests
@@ -6,13 +7,18 @@ import json
 import click
 import sys
 import glob
-from pymediainfo import MediaInfo
 import secrets
 from src.bbcode import BBCODE
 from src.console import console
+from src.httpsessions import session_get
 from src.uploadscreens import upload_screens
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
 from src.languages import process_desc_language
+from src.artifacts import read_artifact
+from src.packassets import build_pack_assets, pack_mediainfo
+
+# One lock per release: descriptions of trackers uploading at the same time fill meta['new_images_*'] and meta['retry_count'] in turn
+_desc_locks = {}
 
 
 class COMMON():
@@ -52,12 +58,18 @@ class COMMON():
             Torrent.copy(new_torrent).write(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}].torrent", overwrite=True)
 
     async def unit3d_edit_desc(self, meta, tracker, signature, comparison=False, desc_header="", image_list=None):
+        lock = _desc_locks.setdefault(meta['uuid'], asyncio.Lock())
+        async with lock:
+            return await self._unit3d_edit_desc(meta, tracker, signature, comparison, desc_header, image_list)
+
+    async def _unit3d_edit_desc(self, meta, tracker, signature, comparison=False, desc_header="", image_list=None):
         if image_list is not None:
             images = image_list
             multi_screens = 0
         else:
             images = meta['image_list']
             multi_screens = int(self.config['DEFAULT'].get('multiScreens', 2))
+            await build_pack_assets(meta, self.config)
 
         # Check for saved pack_image_links.json file
         pack_images_file = os.path.join(meta['base_dir'], "tmp", meta['uuid'], "pack_image_links.json")
@@ -72,7 +84,7 @@ class COMMON():
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not load pack image data: {str(e)}[/yellow]")
 
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         char_limit = int(self.config['DEFAULT'].get('charLimit', 14000))
         file_limit = int(self.config['DEFAULT'].get('fileLimit', 5))
         thumb_size = int(self.config['DEFAULT'].get('pack_thumb_size', '300'))
@@ -564,7 +576,7 @@ class COMMON():
                     # Write filename in BBCode format with MediaInfo in spoiler if not the first file
                     if multi_screens != 0:
                         if i > 0 and char_count < max_char_limit:
-                            mi_dump = MediaInfo.parse(file, output="STRING", full=False, mediainfo_options={'inform_version': '1'})
+                            mi_dump = await pack_mediainfo(file)
                             parsed_mediainfo = self.parser.parse_mediainfo(mi_dump)
                             formatted_bbcode = self.parser.format_bbcode(parsed_mediainfo)
                             descfile.write(f"[center][spoiler={filename}]{formatted_bbcode}[/spoiler][/center]\n")
@@ -804,7 +816,7 @@ class COMMON():
         """Get region and distributor information from API response"""
         params = {'api_token': self.config['TRACKERS'][tracker].get('api_key', '')}
         url = f"{torrent_url}{id}"
-        response = requests.get(url=url, params=params)
+        response = await session_get(url=url, params=params)
         try:
             json_response = response.json()
         except ValueError:
@@ -893,7 +905,7 @@ class COMMON():
             return None, None, None, None, None, None, None, None, None
 
         # Make the GET request with proper encoding handled by 'params'
-        response = requests.get(url=url, params=params)
+        response = await session_get(url=url, params=params)
         # console.print(f"[blue]Raw API Response: {response}[/blue]")
 
         try:
@@ -1056,11 +1068,11 @@ class COMMON():
         # get douban url
         if int(meta.get('imdb_id')) != 0:
             data['search'] = f"tt{meta['imdb_id']}"
-            ptgen = requests.get(url, params=data)
+            ptgen = await session_get(url, params=data)
             if ptgen.json()["error"] is not None:
                 for retry in range(ptgen_retry):
                     try:
-                        ptgen = requests.get(url, params=params)
+                        ptgen = await session_get(url, params=params)
                         if ptgen.json()["error"] is None:
                             break
                     except requests.exceptions.JSONDecodeError:
@@ -1074,10 +1086,10 @@ class COMMON():
             console.print("[red]No IMDb id was found.")
             params['url'] = console.input("[red]Please enter [yellow]Douban[/yellow] link: ")
         try:
-            ptgen = requests.get(url, params=params)
+            ptgen = await session_get(url, params=params)
             if ptgen.json()["error"] is not None:
                 for retry in range(ptgen_retry):
-                    ptgen = requests.get(url, params=params)
+                    ptgen = await session_get(url, params=params)
                     if ptgen.json()["error"] is None:
                         break
             ptgen = ptgen.json()
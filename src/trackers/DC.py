@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import os
 import re
 import requests
@@ -136,7 +137,7 @@ class DC(COMMON):
         auth_params = {'username': self.username, 'password': self.password, 'captcha': self.api_key}
 
         try:
-            response = self.session.get(login_url, params=auth_params, timeout=10)
+            response = await asyncio.to_thread(self.session.get, login_url, params=auth_params, timeout=10)
 
             if response.status_code == 200 and response.cookies:
                 self.auth_cookies = response.cookies
@@ -165,7 +166,7 @@ class DC(COMMON):
         search_params = {'searchText': imdb_id}
 
         try:
-            response = self.session.get(search_url, params=search_params, cookies=self.auth_cookies, timeout=15)
+            response = await asyncio.to_thread(self.session.get, search_url, params=search_params, cookies=self.auth_cookies, timeout=15)
             response.raise_for_status()
 
             if response.text and response.text != '[]':
@@ -261,7 +262,7 @@ class DC(COMMON):
                 upload_url = f"{self.api_base_url}/torrents/upload"
 
                 if meta['debug'] is False:
-                    response = self.session.post(upload_url, data=data, files=files, cookies=self.auth_cookies, timeout=90)
+                    response = await asyncio.to_thread(self.session.post, upload_url, data=data, files=files, cookies=self.auth_cookies, timeout=90)
                     response.raise_for_status()
                     json_response = response.json()
                     meta['tracker_status'][self.tracker]['status_message'] = response.json()
@@ -12,6 +12,8 @@ import httpx
 from src.trackers.COMMON import COMMON
 from src.exceptions import *  # noqa F403
 from src.console import console
+from src.httpsessions import cookie_headers, session_post, shared_session
+from src.artifacts import read_artifact
 
 
 class FL():
@@ -136,9 +138,9 @@ class FL():
         fl_desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', newline='', encoding='utf-8').read()
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
         if meta['bdinfo'] is not None:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt")
         with open(torrent_path, 'rb') as torrentFile:
             torrentFileName = unidecode(torrentFileName)
             files = {
@@ -176,7 +178,7 @@ class FL():
                     cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/FL.pkl")
                     with open(cookiefile, 'rb') as cf:
                         session.cookies.update(pickle.load(cf))
-                    up = session.post(url=url, data=data, files=files)
+                    up = await asyncio.to_thread(session.post, url=url, data=data, files=files)
                     torrentFile.close()
 
                     # Match url to verify successful upload
@@ -215,8 +217,8 @@ class FL():
             }
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
-                response = await client.get(search_url, params=params)
+            async with shared_session(search_url) as client:
+                response = await client.get(search_url, params=params, headers=cookie_headers(cookies), timeout=10.0)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     find = soup.find_all('a', href=True)
@@ -261,7 +263,7 @@ class FL():
             with requests.Session() as session:
                 with open(cookiefile, 'rb') as cf:
                     session.cookies.update(pickle.load(cf))
-                resp = session.get(url=url)
+                resp = await asyncio.to_thread(session.get, url=url)
                 if meta['debug']:
                     console.print(resp.url)
                 if resp.text.find("Logout") != -1:
@@ -273,7 +275,7 @@ class FL():
 
     async def login(self, cookiefile):
         with requests.Session() as session:
-            r = session.get("https://filelist.io/login.php")
+            r = await asyncio.to_thread(session.get, "https://filelist.io/login.php")
             await asyncio.sleep(0.5)
             soup = BeautifulSoup(r.text, 'html.parser')
             validator = soup.find('input', {'name': 'validator'}).get('value')
@@ -283,10 +285,10 @@ class FL():
                 'password': self.password,
                 'unlock': '1',
             }
-            response = session.post('https://filelist.io/takelogin.php', data=data)
+            response = await asyncio.to_thread(session.post, 'https://filelist.io/takelogin.php', data=data)
             await asyncio.sleep(0.5)
             index = 'https://filelist.io/index.php'
-            response = session.get(index)
+            response = await asyncio.to_thread(session.get, index)
             if response.text.find("Logout") != -1:
                 console.print('[green]Successfully logged into FL')
                 with open(cookiefile, 'wb') as cf:
@@ -299,7 +301,7 @@ class FL():
 
     async def download_new_torrent(self, session, id, torrent_path):
         download_url = f"https://filelist.io/download.php?id={id}"
-        r = session.get(url=download_url)
+        r = await asyncio.to_thread(session.get, url=download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
@@ -309,7 +311,7 @@ class FL():
         return
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', newline='', encoding='utf-8') as descfile:
             from src.bbcode import BBCODE
             bbcode = BBCODE()
@@ -331,7 +333,7 @@ class FL():
                 files = []
                 for screen in screen_glob:
                     files.append(('images', (os.path.basename(screen), open(f"{meta['base_dir']}/tmp/{meta['uuid']}/{screen}", 'rb'), 'image/png')))
-                response = requests.post(url, data=data, files=files, auth=(self.fltools['user'], self.fltools['pass']))
+                response = await session_post(url, data=data, files=files, auth=(self.fltools['user'], self.fltools['pass']))
                 final_desc = response.text.replace('\r\n', '\n')
             else:
                 # BD Description Generator
@@ -346,7 +348,7 @@ class FL():
                     files = []
                     for screen in screen_glob:
                         files.append(('images', (os.path.basename(screen), open(f"{meta['base_dir']}/tmp/{meta['uuid']}/{screen}", 'rb'), 'image/png')))
-                    response = requests.post(url, files=files, auth=(self.fltools['user'], self.fltools['pass']))
+                    response = await session_post(url, files=files, auth=(self.fltools['user'], self.fltools['pass']))
                     final_desc += response.text.replace('\r\n', '\n')
             descfile.write(final_desc)
 
@@ -9,11 +9,13 @@ import httpx
 from unidecode import unidecode
 from urllib.parse import urlparse, quote
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_get, session_post, shared_session
 from src.exceptions import *  # noqa F403
 from src.console import console
 from datetime import datetime
 from torf import Torrent
 from src.torrentcreate import CustomTorrent, torf_cb, create_torrent
+from src.artifacts import read_artifact
 
 
 class HDB():
@@ -218,7 +220,7 @@ class HDB():
             return
 
         # Download new .torrent from site
-        hdb_desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        hdb_desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
         torrent = Torrent.read(torrent_path)
 
@@ -296,7 +298,7 @@ class HDB():
                     data['origin'] = 1
             # If not BDMV fill mediainfo
             if meta.get('is_disc', '') != "BDMV":
-                data['techinfo'] = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read()
+                data['techinfo'] = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt")
             # If tv, submit tvdb_id/season/episode
             if meta.get('tvdb_id', 0) != 0:
                 data['tvdb'] = meta['tvdb_id']
@@ -320,7 +322,7 @@ class HDB():
                 with requests.Session() as session:
                     cookiefile = f"{meta['base_dir']}/data/cookies/HDB.txt"
                     session.cookies.update(await common.parseCookieFile(cookiefile))
-                    up = session.post(url=url, data=data, files=files)
+                    up = await asyncio.to_thread(session.post, url=url, data=data, files=files)
                     torrentFile.close()
 
                     # Match url to verify successful upload
@@ -376,7 +378,7 @@ class HDB():
 
             try:
                 # Send POST request with JSON body
-                async with httpx.AsyncClient(timeout=5.0) as client:
+                async with shared_session(url) as client:
                     response = await client.post(url, json=data)
 
                     if response.status_code == 200:
@@ -421,7 +423,7 @@ class HDB():
             'passkey': self.passkey
         }
         try:
-            r = requests.post(url, data=json.dumps(data)).json()
+            r = (await session_post(url, data=json.dumps(data))).json()
             if r.get('status', 5) == 0:
                 return True
             return False
@@ -435,7 +437,7 @@ class HDB():
         if os.path.exists(cookiefile):
             with requests.Session() as session:
                 session.cookies.update(await common.parseCookieFile(cookiefile))
-                resp = session.get(url=url)
+                resp = await asyncio.to_thread(session.get, url=url)
                 if resp.text.find("""<a href="/logout.php">Logout</a>""") != -1:
                     return True
                 else:
@@ -452,7 +454,7 @@ class HDB():
             'passkey': self.passkey,
             'id': id
         }
-        r = requests.get(url=api_url, data=json.dumps(data))
+        r = await session_get(url=api_url, data=json.dumps(data))
         filename = r.json()['data'][0]['filename']
 
         # Download new .torrent
@@ -462,13 +464,13 @@ class HDB():
             'id': id
         }
 
-        r = requests.get(url=download_url, params=params)
+        r = await session_get(url=download_url, params=params)
         with open(torrent_path, "wb") as tor:
             tor.write(r.content)
         return
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as descfile:
             from src.bbcode import BBCODE
             # Add This line for all web-dls
@@ -670,7 +672,7 @@ class HDB():
 
             if meta['debug']:
                 console.print(f"[green]Uploading {len(files)} images to HDB...")
-            response = requests.post(url, data=data, files=files)
+            response = await session_post(url, data=data, files=files)
 
             if response.status_code == 200:
                 console.print("[green]Upload successful!")
@@ -714,7 +716,7 @@ class HDB():
         }
 
         try:
-            response = requests.post(url, json=data)
+            response = await session_post(url, json=data)
             if response.ok:
                 response_json = response.json()
 
@@ -785,7 +787,7 @@ class HDB():
             # console.print(f"[yellow]Using this data: {data}")
 
         try:
-            response = requests.post(url, json=data)
+            response = await session_post(url, json=data)
             if response.ok:
                 try:
                     response_json = response.json()
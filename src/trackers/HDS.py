@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import os
 import re
 import requests
@@ -122,7 +123,7 @@ class HDS(COMMON):
         search_url = f"{self.base_url}/index.php?page=torrents&search={imdb_id}&active=0&options=2"
 
         try:
-            response = self.session.get(search_url, timeout=20)
+            response = await asyncio.to_thread(self.session.get, search_url, timeout=20)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -149,7 +150,7 @@ class HDS(COMMON):
         try:
             test_url = f"{self.base_url}/index.php?page=upload"
 
-            response = self.session.get(test_url, timeout=10, allow_redirects=False)
+            response = await asyncio.to_thread(self.session.get, test_url, timeout=10, allow_redirects=False)
 
             if response.status_code == 200 and 'index.php?page=upload' in response.url:
                 return True
@@ -251,7 +252,7 @@ class HDS(COMMON):
 
             if meta['debug'] is False:
                 upload_url = f"{self.base_url}/index.php?page=upload"
-                response = self.session.post(upload_url, data=data, files=files, timeout=60)
+                response = await asyncio.to_thread(self.session.post, upload_url, data=data, files=files, timeout=60)
 
                 if "This torrent may already exist in our database." in response.text:
                     console.print(f"[bold red]Upload to {self.tracker} failed: The torrent already exists on the site.[/bold red]")
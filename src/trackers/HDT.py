@@ -178,7 +178,7 @@ class HDT():
                     cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/HDT.txt")
 
                     session.cookies.update(await common.parseCookieFile(cookiefile))
-                    up = session.post(url=url, data=data, files=files)
+                    up = await asyncio.to_thread(session.post, url=url, data=data, files=files)
                     torrentFile.close()
 
                     # Match url to verify successful upload
@@ -232,7 +232,7 @@ class HDT():
                 }
             if meta['debug']:
                 console.print(f"[cyan]Searching for existing torrents on {search_url} with params: {params}")
-            r = session.get(search_url, params=params)
+            r = await asyncio.to_thread(session.get, search_url, params=params)
             await asyncio.sleep(0.5)
             soup = BeautifulSoup(r.text, 'html.parser')
             find = soup.find_all('a', href=True)
@@ -262,7 +262,7 @@ class HDT():
         if os.path.exists(cookiefile):
             with requests.Session() as session:
                 session.cookies.update(await common.parseCookieFile(cookiefile))
-                res = session.get(url=url)
+                res = await asyncio.to_thread(session.get, url=url)
                 if meta['debug']:
                     console.print(res.url)
                 if res.text.find("Logout") != -1:
@@ -273,7 +273,7 @@ class HDT():
             return False
 
     async def get_csrfToken(self, session, url):
-        r = session.get(url)
+        r = await asyncio.to_thread(session.get, url)
         await asyncio.sleep(0.5)
         soup = BeautifulSoup(r.text, 'html.parser')
         csrfToken = soup.find('input', {'name': 'csrfToken'}).get('value')
@@ -1,16 +1,17 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import os
 import re
 import platform
 import cli_ui
 import httpx
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post, shared_session
 from src.console import console
 from src.rehostimages import check_hosts
 from src.languages import parsed_mediainfo, process_desc_language
+from src.artifacts import read_artifact
 
 
 class HUNO():
@@ -67,9 +68,9 @@ class HUNO():
 
         if meta['bdinfo'] is not None:
             mi_dump = None
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO.txt")
             bd_dump = None
         desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[HUNO]DESCRIPTION.txt", 'r', encoding='utf-8').read()
         open_torrent = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[HUNO].torrent", 'rb')
@@ -119,7 +120,7 @@ class HUNO():
 
         if meta['debug'] is False:
             try:
-                response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+                response = await session_post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
                 meta['tracker_status'][self.tracker]['status_message'] = response.json()
             except Exception as e:
                 meta['tracker_status'][self.tracker]['status_message'] = f" data error - Error uploading torrent: {e}"
@@ -395,7 +396,7 @@ class HUNO():
         if meta.get('edition', "") != "":
             params['name'] + meta['edition']
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -409,7 +410,7 @@ class HUNO():
                 else:
                     console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
         except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 5 seconds")
+            console.print("[bold red]Request timed out")
         except httpx.RequestError as e:
             console.print(f"[bold red]Unable to search for existing torrents: {e}")
         except Exception as e:
@@ -11,9 +11,11 @@ import pickle
 import re
 from pathlib import Path
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_get, shared_session
 from datetime import datetime
 from src.torrentcreate import CustomTorrent, torf_cb, create_torrent
 from src.rehostimages import check_hosts
+from src.artifacts import read_artifact
 
 
 class MTV():
@@ -155,7 +157,7 @@ class MTV():
             with requests.Session() as session:
                 with open(cookiefile, 'rb') as cf:
                     session.cookies.update(pickle.load(cf))
-                response = session.post(url=self.upload_url, data=data, files=files, allow_redirects=True)
+                response = await asyncio.to_thread(session.post, url=self.upload_url, data=data, files=files, allow_redirects=True)
                 try:
                     if "torrents.php" in str(response.url):
                         meta['tracker_status'][self.tracker]['status_message'] = response.url
@@ -187,14 +189,14 @@ class MTV():
         return
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
 
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as desc:
             if meta['bdinfo'] is not None:
                 mi_dump = None
-                bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+                bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
             else:
-                mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read().strip()
+                mi_dump = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt").strip()
                 bd_dump = None
 
             if bd_dump:
@@ -471,7 +473,7 @@ class MTV():
             'apikey': self.config['TRACKERS'][self.tracker]['api_key'].strip(),
         }
         try:
-            r = requests.get(url, params=params)
+            r = await session_get(url, params=params)
             if not r.ok:
                 if "unauthorized api key" in r.text.lower():
                     console.print("[red]Invalid API Key")
@@ -493,7 +495,7 @@ class MTV():
 
                     # Add error handling for the request
                     try:
-                        resp = session.get(url=url, timeout=10)
+                        resp = await asyncio.to_thread(session.get, url=url, timeout=10)
                         if resp.text.find("Logout") != -1:
                             return True
                         else:
@@ -524,7 +526,7 @@ class MTV():
                     with open(cookiefile, 'rb') as cf:
                         session.cookies.update(pickle.load(cf))
                     try:
-                        resp = session.get(url=url, timeout=10)
+                        resp = await asyncio.to_thread(session.get, url=url, timeout=10)
                         if "authkey=" in resp.text:
                             auth = resp.text.rsplit('authkey=', 1)[1][:32]
                             return auth
@@ -558,11 +560,11 @@ class MTV():
                 }
 
                 try:
-                    res = session.get(url="https://www.morethantv.me/login", timeout=15)
+                    res = await asyncio.to_thread(session.get, url="https://www.morethantv.me/login", timeout=15)
                     token = res.text.rsplit('name="token" value="', 1)[1][:48]
                     # token and CID from cookie needed for post to login
                     payload["token"] = token
-                    resp = session.post(url=url, data=payload, timeout=10)
+                    resp = await asyncio.to_thread(session.post, url=url, data=payload, timeout=10)
 
                     # handle 2fa
                     if resp.url.endswith('twofactor/login'):
@@ -578,7 +580,7 @@ class MTV():
                             'code': mfa_code,
                             'submit': 'login'
                         }
-                        resp = session.post(url="https://www.morethantv.me/twofactor/login", data=two_factor_payload)
+                        resp = await asyncio.to_thread(session.post, url="https://www.morethantv.me/twofactor/login", data=two_factor_payload)
                     # checking if logged in
                     if 'authkey=' in resp.text:
                         console.print('[green]Successfully logged in to MTV')
@@ -622,7 +624,7 @@ class MTV():
             params['q'] = meta['title'].replace(': ', ' ').replace('’', '').replace("'", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(url=self.search_url, params=params)
 
                 if response.status_code == 200 and response.text:
@@ -644,7 +646,7 @@ class MTV():
                     else:
                         console.print("[red]Site Seems to be down or not responding to API")
         except httpx.TimeoutException:
-            console.print("[red]Request timed out after 5 seconds")
+            console.print("[red]Request timed out")
         except httpx.RequestError as e:
             console.print(f"[red]Unable to search for existing torrents: {e}")
         except Exception:
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 import json
-import requests
 import httpx
 
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post, shared_session
 from src.console import console
+from src.artifacts import read_artifact
 
 
 class NBL():
@@ -47,9 +48,9 @@ class NBL():
         await common.edit_torrent(meta, self.tracker, self.source_flag)
 
         if meta['bdinfo'] is not None:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read().strip()
+            mi_dump = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt").strip()
         open_torrent = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", 'rb')
         files = {'file_input': open_torrent}
         data = {
@@ -61,7 +62,7 @@ class NBL():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data)
+            response = await session_post(url=self.upload_url, files=files, data=data)
             try:
                 if response.ok:
                     response = response.json()
@@ -110,7 +111,7 @@ class NBL():
         }
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.post(self.search_url, json=payload)
                 if response.status_code == 200:
                     try:
@@ -126,7 +127,7 @@ class NBL():
                     meta['skipping'] = "NBL"
 
         except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 5 seconds")
+            console.print("[bold red]Request timed out")
             meta['skipping'] = "NBL"
         except httpx.RequestError as e:
             console.print(f"[bold red]An error occurred while making the request: {e}")
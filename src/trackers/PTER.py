@@ -1,4 +1,5 @@
 from bs4 import BeautifulSoup
+import asyncio
 import requests
 import re
 import os
@@ -10,8 +11,10 @@ import httpx
 from unidecode import unidecode
 from urllib.parse import urlparse
 from src.trackers.COMMON import COMMON
+from src.httpsessions import cookie_headers, session_get, shared_session
 from src.exceptions import *  # noqa E403
 from src.console import console
+from src.artifacts import read_artifact
 
 
 class PTER():
@@ -44,7 +47,7 @@ class PTER():
         if os.path.exists(cookiefile):
             with requests.Session() as session:
                 session.cookies.update(await common.parseCookieFile(cookiefile))
-                resp = session.get(url=url)
+                resp = await asyncio.to_thread(session.get, url=url)
 
                 if resp.text.find("""<a href="#" data-url="logout.php" id="logout-confirm">""") != -1:
                     return True
@@ -67,8 +70,8 @@ class PTER():
         search_url = f"https://pterclub.com/torrents.php?search={imdb}&incldead=0&search_mode=0&source{source}=1"
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
-                response = await client.get(search_url)
+            async with shared_session(search_url) as client:
+                response = await client.get(search_url, headers=cookie_headers(cookies), timeout=10.0)
 
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'lxml')
@@ -155,7 +158,7 @@ class PTER():
         return medium_id
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as descfile:
             from src.bbcode import BBCODE
             from src.trackers.COMMON import COMMON
@@ -179,7 +182,7 @@ class PTER():
                         descfile.write(f"[hide=mediainfo][{each['vob_mi']}[/hide] [hide=mediainfo][{each['ifo_mi']}[/hide]\n")
                         descfile.write("\n")
             else:
-                mi = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read()
+                mi = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt")
                 descfile.write(f"[hide=mediainfo]{mi}[/hide]")
                 descfile.write("\n")
             desc = base
@@ -224,7 +227,7 @@ class PTER():
             if os.path.exists(cookiefile):
                 with open(cookiefile, 'rb') as cf:
                     session.cookies.update(pickle.load(cf))
-                r = session.get("https://s3.pterclub.com")
+                r = await asyncio.to_thread(session.get, "https://s3.pterclub.com")
                 loggedIn = await self.validate_login(r)
             else:
                 console.print("[yellow]Pterimg Cookies not found. Creating new session.")
@@ -236,9 +239,9 @@ class PTER():
                     'password': self.password,
                     'keep-login': 1
                 }
-                r = session.get("https://s3.pterclub.com")
+                r = await asyncio.to_thread(session.get, "https://s3.pterclub.com")
                 data['auth_token'] = re.search(r'auth_token.*?\"(\w+)\"', r.text).groups()[0]
-                loginresponse = session.post(url='https://s3.pterclub.com/login', data=data)
+                loginresponse = await asyncio.to_thread(session.post, url='https://s3.pterclub.com/login', data=data)
                 if not loginresponse.ok:
                     raise LoginException("Failed to login to Pterimg. ")  # noqa #F405
                 auth_token = re.search(r'auth_token = *?\"(\w+)\"', loginresponse.text).groups()[0]
@@ -272,7 +275,7 @@ class PTER():
                     files = {}
                     for i in range(len(images)):
                         files = {'source': open(images[i], 'rb')}
-                        req = session.post(f'{url}/json', data=data, files=files)
+                        req = await asyncio.to_thread(session.post, f'{url}/json', data=data, files=files)
                         try:
                             res = req.json()
                         except json.decoder.JSONDecodeError:
@@ -384,7 +387,7 @@ class PTER():
                 if os.path.exists(cookiefile):
                     with requests.Session() as session:
                         session.cookies.update(await common.parseCookieFile(cookiefile))
-                        up = session.post(url=url, data=data, files=files)
+                        up = await asyncio.to_thread(session.post, url=url, data=data, files=files)
                         torrentFile.close()
                         mi_dump.close()
 
@@ -400,7 +403,7 @@ class PTER():
 
     async def download_new_torrent(self, id, torrent_path):
         download_url = f"https://pterclub.com/download.php?id={id}&passkey={self.passkey}"
-        r = requests.get(url=download_url)
+        r = await session_get(url=download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
@@ -12,6 +12,7 @@ import click
 import httpx
 from pymediainfo import MediaInfo
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_get, session_post, shared_session
 from src.bbcode import BBCODE
 from src.exceptions import *  # noqa F403
 from src.console import console
@@ -20,6 +21,8 @@ from datetime import datetime
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
 from src.uploadscreens import upload_screens
 from src.torrentcreate import CustomTorrent, torf_cb, create_torrent
+from src.artifacts import read_artifact
+from src.packassets import build_pack_assets, pack_mediainfo
 
 
 class PTP():
@@ -98,7 +101,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url, params=params, headers=headers)
+        response = await session_get(url, params=params, headers=headers)
         await asyncio.sleep(1)
         console.print(f"[green]Searching PTP for: [bold yellow]{filename}[/bold yellow]")
 
@@ -169,7 +172,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url, params=params, headers=headers)
+        response = await session_get(url, params=params, headers=headers)
         await asyncio.sleep(1)
         try:
             if response.status_code == 200:
@@ -203,7 +206,7 @@ class PTP():
         }
         url = 'https://passthepopcorn.me/torrents.php'
         console.print(f"[yellow]Requesting description from {url} with ID {ptp_torrent_id}")
-        response = requests.get(url, params=params, headers=headers)
+        response = await session_get(url, params=params, headers=headers)
         await asyncio.sleep(1)
 
         ptp_desc = response.text
@@ -256,7 +259,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url=url, headers=headers, params=params)
+        response = await session_get(url=url, headers=headers, params=params)
         await asyncio.sleep(1)
         try:
             response = response.json()
@@ -284,7 +287,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = "https://passthepopcorn.me/ajax.php"
-        response = requests.get(url=url, params=params, headers=headers)
+        response = await session_get(url=url, params=params, headers=headers)
         await asyncio.sleep(1)
         tinfo = {}
         try:
@@ -354,7 +357,7 @@ class PTP():
         url = 'https://passthepopcorn.me/torrents.php'
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with shared_session(url) as client:
                 response = await client.get(url, headers=headers, params=params)
                 await asyncio.sleep(1)  # Mimic server-friendly delay
                 if response.status_code == 200:
@@ -389,7 +392,7 @@ class PTP():
         headers = {'referer': 'https://ptpimg.me/index.php'}
         url = "https://ptpimg.me/upload.php"
 
-        response = requests.post(url, headers=headers, data=payload)
+        response = await session_post(url, headers=headers, data=payload)
         try:
             response = response.json()
             ptpimg_code = response[0]['code']
@@ -670,8 +673,9 @@ class PTP():
         return desc
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding="utf-8").read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         multi_screens = int(self.config['DEFAULT'].get('multiScreens', 2))
+        await build_pack_assets(meta, self.config)
 
         # Check for saved pack_image_links.json file
         pack_images_file = os.path.join(meta['base_dir'], "tmp", meta['uuid'], "pack_image_links.json")
@@ -941,7 +945,7 @@ class PTP():
                 file = filelist[0]
                 if meta['type'] == 'WEBDL' and meta.get('service_longname', '') != '' and meta.get('description', None) is None and self.web_source is True:
                     desc.write(f"[quote][align=center]This release is sourced from {meta['service_longname']}[/align][/quote]")
-                mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+                mi_dump = read_artifact(meta, "MEDIAINFO.txt")
                 desc.write(f"[mediainfo]{mi_dump}[/mediainfo]\n")
                 base2ptp = self.convert_bbcode(base)
                 if base2ptp.strip() != "":
@@ -990,14 +994,14 @@ class PTP():
                         if base2ptp.strip() != "":
                             desc.write(base2ptp)
                             desc.write("\n\n")
-                        mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+                        mi_dump = read_artifact(meta, "MEDIAINFO.txt")
                         desc.write(f"[mediainfo]{mi_dump}[/mediainfo]\n")
                         for img_index in range(min(multi_screens, len(meta['image_list']))):
                             raw_url = meta['image_list'][img_index]['raw_url']
                             desc.write(f"[img]{raw_url}[/img]\n")
                         desc.write("\n")
                     else:
-                        mi_dump = MediaInfo.parse(file, output="STRING", full=False)
+                        mi_dump = await pack_mediainfo(file, inform_version=False)
                         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/TEMP_PTP_MEDIAINFO.txt", "w", newline="", encoding="utf-8") as f:
                             f.write(mi_dump.replace(file, os.path.basename(file)))
                         mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/TEMP_PTP_MEDIAINFO.txt", "r", encoding="utf-8").read()
@@ -1119,7 +1123,7 @@ class PTP():
             if os.path.exists(cookiefile):
                 with open(cookiefile, 'rb') as cf:
                     session.cookies.update(pickle.load(cf))
-                uploadresponse = session.get("https://passthepopcorn.me/upload.php")
+                uploadresponse = await asyncio.to_thread(session.get, "https://passthepopcorn.me/upload.php")
                 loggedIn = await self.validate_login(uploadresponse)
             else:
                 console.print("[yellow]PTP Cookies not found. Creating new session.")
@@ -1134,14 +1138,14 @@ class PTP():
                     "keeplogged": "1",
                 }
                 headers = {"User-Agent": self.user_agent}
-                loginresponse = session.post("https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
+                loginresponse = await asyncio.to_thread(session.post, "https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
                 await asyncio.sleep(2)
                 try:
                     resp = loginresponse.json()
                     if resp['Result'] == "TfaRequired":
                         data['TfaType'] = "normal"
                         data['TfaCode'] = cli_ui.ask_string("2FA Required: Please enter 2FA code")
-                        loginresponse = session.post("https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
+                        loginresponse = await asyncio.to_thread(session.post, "https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
                         await asyncio.sleep(2)
                         resp = loginresponse.json()
                     try:
@@ -1389,7 +1393,7 @@ class PTP():
                     cookiefile = f"{meta['base_dir']}/data/cookies/PTP.pickle"
                     with open(cookiefile, 'rb') as cf:
                         session.cookies.update(pickle.load(cf))
-                    response = session.post(url=url, data=data, headers=headers, files=files)
+                    response = await asyncio.to_thread(session.post, url=url, data=data, headers=headers, files=files)
                 console.print(f"[cyan]{response.url}")
                 responsetext = response.text
                 # If the response contains our announce URL, then we are on the upload page and the upload wasn't successful.
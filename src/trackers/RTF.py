@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import base64
 import re
 import datetime
 import httpx
 
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_get, session_post, shared_session
 from src.console import console
+from src.artifacts import read_artifact
 
 
 class RTF():
@@ -36,9 +37,9 @@ class RTF():
         await common.unit3d_edit_desc(meta, self.tracker, self.forum_link)
         if meta['bdinfo'] is not None:
             mi_dump = None
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO.txt")
             bd_dump = None
 
         screenshots = []
@@ -76,7 +77,7 @@ class RTF():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, json=json_data, headers=headers)
+            response = await session_post(url=self.upload_url, json=json_data, headers=headers)
             try:
                 response_json = response.json()
                 meta['tracker_status'][self.tracker]['status_message'] = response.json()
@@ -120,7 +121,7 @@ class RTF():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = response.json()
@@ -148,7 +149,7 @@ class RTF():
             'Authorization': self.config['TRACKERS'][self.tracker]['api_key'].strip(),
         }
 
-        response = requests.get('https://retroflix.club/api/test', headers=headers)
+        response = await session_get('https://retroflix.club/api/test', headers=headers)
 
         if response.status_code != 200:
             console.print('[bold red]Your API key is incorrect SO generating a new one')
@@ -170,7 +171,7 @@ class RTF():
         config_path = f"{base_dir}/data/config.py"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with shared_session('https://retroflix.club/api/login') as client:
                 response = await client.post('https://retroflix.club/api/login', headers=headers, json=json_data)
 
             if response.status_code == 201:
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
-import requests
 import asyncio
 import httpx
 
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post, shared_session
 from src.console import console
+from src.artifacts import read_artifact
 
 
 class SN():
@@ -75,11 +76,11 @@ class SN():
 
         if meta['bdinfo'] is not None:
             mi_dump = None
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO.txt")
             bd_dump = None
-        desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
 
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", 'rb') as f:
             tfile = f.read()
@@ -107,7 +108,7 @@ class SN():
         }
 
         if meta['debug'] is False:
-            response = requests.request("POST", url=self.upload_url, data=data, files=files)
+            response = await session_post(self.upload_url, data=data, files=files)
 
             try:
                 if response.json().get('success'):
@@ -130,7 +131,7 @@ class SN():
             meta['tracker_status'][self.tracker]['status_message'] = "Debug mode enabled, not uploading."
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as desc:
             desc.write(base)
             images = meta['image_list']
@@ -165,7 +166,7 @@ class SN():
                 params['filter'] = meta['resolution']
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -2,15 +2,15 @@
 # import discord
 import asyncio
 from torf import Torrent
-import requests
 from src.console import console
 from pprint import pprint
 import base64
-import shutil
 import os
 import traceback
 import httpx
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_get, session_post, shared_session
+from src.artifacts import read_artifact
 
 
 class SPD():
@@ -56,9 +56,9 @@ class SPD():
 
         if meta['bdinfo'] is not None:
             mi_dump = None
-            bd_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", 'r', encoding='utf-8').read()
+            bd_dump = read_artifact(meta, "BD_SUMMARY_00.txt")
         else:
-            mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read()
+            mi_dump = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt")
             bd_dump = None
         screenshots = []
         if len(meta['image_list']) != 0:
@@ -85,7 +85,7 @@ class SPD():
         headers = {'Authorization': 'Bearer ' + self.config['TRACKERS'][self.tracker]['api_key'].strip()}
 
         if meta['debug'] is False:
-            response = requests.request("POST", url=self.upload_url, json=data, headers=headers)
+            response = await session_post(self.upload_url, json=data, headers=headers)
             try:
                 if response.status_code == 200:
                     # response = {'status': True, 'error': False, 'downloadUrl': '/api/torrent/383435/download', 'torrent': {'id': 383435, 'name': 'name-with-full-stops', 'slug': 'name-with-dashs', 'category_id': 3}}
@@ -94,11 +94,11 @@ class SPD():
                         # torrent may not dl and may not provide error if machine is under load or network connection usage high.
                         if 'downloadUrl' in response.json():
                             meta['tracker_status'][self.tracker]['status_message'] = response.json()['downloadUrl']
-                            with requests.get(url=self.url + response.json()['downloadUrl'], stream=True, headers=headers) as r:
-                                # replacing L4g/torf created torrent so it will be added to the client.
-                                with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent",
-                                          'wb') as f:
-                                    shutil.copyfileobj(r.raw, f)
+                            r = await session_get(self.url + response.json()['downloadUrl'], headers=headers)
+                            # replacing L4g/torf created torrent so it will be added to the client.
+                            with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent",
+                                      'wb') as f:
+                                f.write(r.content)
                             # adding as comment link to torrent
                             if os.path.exists(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"):
                                 new_torrent = Torrent.read(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent")
@@ -148,7 +148,7 @@ class SPD():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(url=self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = response.json()
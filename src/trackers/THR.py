@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import asyncio
-import requests
 import json
 import glob
 import cli_ui
@@ -12,6 +11,8 @@ from bs4 import BeautifulSoup
 from unidecode import unidecode
 from src.console import console
 from src.trackers.COMMON import COMMON
+from src.httpsessions import cookie_headers, session_post, shared_session
+from src.artifacts import read_artifact
 
 
 class THR():
@@ -99,8 +100,8 @@ class THR():
                 if cookies:
                     console.print("[green]Using authenticated session for upload")
 
-                    async with httpx.AsyncClient(cookies=cookies, follow_redirects=True) as session:
-                        response = await session.post(url=url, files=files, data=payload, headers=headers)
+                    async with shared_session(url) as session:
+                        response = await session.post(url=url, files=files, data=payload, headers=cookie_headers(cookies, headers), follow_redirects=True)
 
                         if meta['debug']:
                             console.print(f"[dim]Response status: {response.status_code}")
@@ -191,7 +192,7 @@ class THR():
 
     async def edit_desc(self, meta):
         pronfo = False
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[THR]DESCRIPTION.txt", 'w', encoding='utf-8') as desc:
             if meta['tag'] == "":
                 tag = ""
@@ -217,19 +218,19 @@ class THR():
             desc.write("[/quote]")
             desc.write(base)
             # REHOST IMAGES
-            os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
+            tmp_dir = f"{meta['base_dir']}/tmp/{meta['uuid']}"
             image_patterns = ["*.png", ".[!.]*.png"]
             image_glob = []
             for pattern in image_patterns:
-                image_glob.extend(glob.glob(pattern))
+                image_glob.extend(glob.glob(os.path.join(tmp_dir, pattern)))
 
             unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
             unwanted_files = set()
             for pattern in unwanted_patterns:
-                unwanted_files.update(glob.glob(pattern))
+                unwanted_files.update(glob.glob(os.path.join(tmp_dir, pattern)))
                 if pattern.startswith("FILE") or pattern.startswith("PLAYLIST") or pattern.startswith("POSTER"):
                     hidden_pattern = "." + pattern
-                    unwanted_files.update(glob.glob(hidden_pattern))
+                    unwanted_files.update(glob.glob(os.path.join(tmp_dir, hidden_pattern)))
 
             image_glob = [file for file in image_glob if file not in unwanted_files]
             image_glob = list(set(image_glob))
@@ -241,7 +242,7 @@ class THR():
                     # 'source' : base64.b64encode(open(image, "rb").read()).decode('utf8')
                 }
                 files = {'source': open(image, 'rb')}
-                response = requests.post(url, data=data, files=files)
+                response = await session_post(url, data=data, files=files)
                 try:
                     response = response.json()
                     # med_url = response['image']['medium']['url']
@@ -267,7 +268,7 @@ class THR():
                     'theme': self.config['TRACKERS']['THR'].get('pronfo_theme', 'gray'),
                     'rapi': self.config['TRACKERS']['THR'].get('pronfo_rapi_id')
                 }
-                response = requests.post(pronfo_url, data=data)
+                response = await session_post(pronfo_url, data=data)
                 try:
                     response = response.json()
                     if response.get('error', True) is False:
@@ -303,14 +304,11 @@ class THR():
         try:
             cookies = await self.login()
 
-            client_args = {'timeout': 10.0, 'follow_redirects': True}
-            if cookies:
-                client_args['cookies'] = cookies
-            else:
+            if not cookies:
                 console.print("[red]Failed to log in to THR for search")
                 return dupes
 
-            async with httpx.AsyncClient(**client_args) as client:
+            async with shared_session(base_search_url) as client:
                 # Start with first page (page 0 in THR's system)
                 current_page = 0
                 more_pages = True
@@ -325,7 +323,7 @@ class THR():
                     page_count += 1
                     if meta.get('debug', False):
                         console.print(f"[dim]Searching page {page_count}...")
-                    response = await client.get(page_url)
+                    response = await client.get(page_url, headers=cookie_headers(cookies), timeout=10.0, follow_redirects=True)
 
                     page_dupes, has_next_page, next_page_number = await self._process_search_response(
                         response, meta, all_titles_seen, current_page)
@@ -446,16 +444,16 @@ class THR():
             'Referer': 'https://www.torrenthr.org/login.php'
         }
 
-        async with httpx.AsyncClient(follow_redirects=True) as session:
+        async with shared_session(url) as session:
             try:
-                login_page = await session.get('https://www.torrenthr.org/login.php')
+                login_page = await session.get('https://www.torrenthr.org/login.php', follow_redirects=True)
                 login_soup = BeautifulSoup(login_page.text, 'html.parser')
 
                 for input_tag in login_soup.find_all('input', type='hidden'):
                     if input_tag.get('name') and input_tag.get('value'):
                         payload[input_tag['name']] = input_tag['value']
 
-                resp = await session.post(url, headers=headers, data=payload)
+                resp = await session.post(url, headers=headers, data=payload, follow_redirects=True)
 
                 if "index.php" in str(resp.url) or "logout.php" in resp.text:
                     console.print('[green]Successfully logged in to THR')
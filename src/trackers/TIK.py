@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import os
 import re
 import platform
@@ -11,8 +10,10 @@ import urllib.request
 import click
 import httpx
 from src.trackers.COMMON import COMMON
+from src.httpsessions import session_post, shared_session
 from src.console import console
 from src.uploadscreens import upload_screens
+from src.artifacts import read_artifact
 
 
 class TIK():
@@ -63,16 +64,16 @@ class TIK():
             bd_dump = None
 
         if meta.get('desclink'):
-            desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "r", encoding='utf-8').read()
+            desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
             print(f"Custom Description Link: {desc}")
 
         elif meta.get('descfile'):
-            desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "r", encoding='utf-8').read()
+            desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
             print(f"Custom Description File Path: {desc}")
 
         else:
             await self.edit_desc(meta)
-            desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "r", encoding='utf-8').read()
+            desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
 
         open_torrent = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", 'rb')
         files = {'torrent': open_torrent}
@@ -124,7 +125,7 @@ class TIK():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await session_post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 meta['tracker_status'][self.tracker]['status_message'] = response.json()
                 # adding torrent link to comment of torrent file
@@ -575,7 +576,7 @@ class TIK():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with shared_session(self.search_url) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -585,7 +586,7 @@ class TIK():
                 else:
                     console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
         except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 5 seconds")
+            console.print("[bold red]Request timed out")
         except httpx.RequestError as e:
             console.print(f"[bold red]Unable to search for existing torrents: {e}")
         except Exception as e:
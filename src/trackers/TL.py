@@ -6,6 +6,7 @@ import re
 import platform
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpsessions import cookie_headers, shared_session
 from pymediainfo import MediaInfo
 
 
@@ -38,13 +39,13 @@ class TL():
         self.api_upload_url = f'{self.base_url}/torrents/upload/apiupload'
         self.signature = """<center><a href="https://github.com/Audionut/Upload-Assistant">Created by Audionut's Upload Assistant</a></center>"""
         self.banned_groups = [""]
-        self.session = httpx.AsyncClient(timeout=60.0)
+        self.cookies = {}
         self.api_upload = self.config['TRACKERS'][self.tracker].get('api_upload')
         self.announce_key = self.config['TRACKERS'][self.tracker]['announce_key']
         self.config['TRACKERS'][self.tracker]['announce_url'] = f"https://tracker.torrentleech.org/a/{self.announce_key}/announce"
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': f'Upload Assistant/2.2 ({platform.system()} {platform.release()})'
-        })
+        }
 
     async def login(self, meta):
         if self.api_upload:
@@ -58,10 +59,11 @@ class TL():
             return False
 
         common = COMMON(config=self.config)
-        self.session.cookies.update(await common.parseCookieFile(self.cookies_file))
+        self.cookies = await common.parseCookieFile(self.cookies_file)
 
         try:
-            response = await self.session.get(self.http_upload_url, timeout=10)
+            async with shared_session(self.http_upload_url) as client:
+                response = await client.get(self.http_upload_url, headers=cookie_headers(self.cookies, self.headers), timeout=10)
             if response.status_code == 200 and 'torrents/upload' in str(response.url):
                 return True
 
@@ -235,7 +237,8 @@ class TL():
 
         for url in search_urls:
             try:
-                response = await self.session.get(url, timeout=20)
+                async with shared_session(url) as client:
+                    response = await client.get(url, headers=cookie_headers(self.cookies, self.headers), timeout=20)
                 response.raise_for_status()
 
                 data = response.json()
@@ -277,11 +280,14 @@ class TL():
             }
 
             if meta['debug'] is False:
-                response = await self.session.post(
-                    url=self.api_upload_url,
-                    files=files,
-                    data=data
-                )
+                async with shared_session(self.api_upload_url) as client:
+                    response = await client.post(
+                        url=self.api_upload_url,
+                        files=files,
+                        data=data,
+                        headers=self.headers,
+                        timeout=60.0
+                    )
                 if not response.text.isnumeric():
                     meta['tracker_status'][self.tracker]['status_message'] = response.text
             else:
@@ -332,11 +338,14 @@ class TL():
 
             if meta['debug'] is False:
                 try:
-                    response = await self.session.post(
-                        url=self.http_upload_url,
-                        files=files,
-                        data=data
-                    )
+                    async with shared_session(self.http_upload_url) as client:
+                        response = await client.post(
+                            url=self.http_upload_url,
+                            files=files,
+                            data=data,
+                            headers=cookie_headers(self.cookies, self.headers),
+                            timeout=60.0
+                        )
 
                     if response.status_code == 302 and 'location' in response.headers:
                         torrent_id = response.headers['location'].replace('/successfulupload?torrentID=', '')
@@ -9,8 +9,10 @@ import httpx
 from unidecode import unidecode
 from urllib.parse import urlparse
 from src.trackers.COMMON import COMMON
+from src.httpsessions import cookie_headers, session_get, shared_session
 from src.exceptions import *  # noqa #F405
 from src.console import console
+from src.artifacts import read_artifact
 
 
 class TTG():
@@ -124,7 +126,7 @@ class TTG():
         else:
             mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", 'r', encoding='utf-8')
 
-        ttg_desc = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        ttg_desc = read_artifact(meta, f"[{self.tracker}]DESCRIPTION.txt")
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
         with open(torrent_path, 'rb') as torrentFile:
             if len(meta['filelist']) == 1:
@@ -198,8 +200,8 @@ class TTG():
         search_url = f"https://totheglory.im/browse.php?search_field= {imdb} {res_type}"
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
-                response = await client.get(search_url)
+            async with shared_session(search_url) as client:
+                response = await client.get(search_url, headers=cookie_headers(cookies), timeout=10.0)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     find = soup.find_all('a', href=True)
@@ -292,7 +294,7 @@ class TTG():
         return
 
     async def edit_desc(self, meta):
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf-8').read()
+        base = read_artifact(meta, "DESCRIPTION.txt")
         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as descfile:
             from src.bbcode import BBCODE
             from src.trackers.COMMON import COMMON
@@ -318,7 +320,7 @@ class TTG():
                         descfile.write(f"[quote={os.path.basename(each['vob'])}][{each['vob_mi']}[/quote] [quote={os.path.basename(each['ifo'])}][{each['ifo_mi']}[/quote]\n")
                         descfile.write("\n")
             else:
-                mi = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", 'r', encoding='utf-8').read()
+                mi = read_artifact(meta, "MEDIAINFO_CLEANPATH.txt")
                 descfile.write(f"[quote=MediaInfo]{mi}[/quote]")
                 descfile.write("\n")
             desc = base
@@ -343,7 +345,7 @@ class TTG():
 
     async def download_new_torrent(self, id, torrent_path):
         download_url = f"https://totheglory.im/dl/{id}/{self.passkey}"
-        r = requests.get(url=download_url)
+        r = await session_get(url=download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
@@ -1,67 +1,13 @@
-from src.trackers.ACM import ACM
-from src.trackers.AITHER import AITHER
-from src.trackers.AL import AL
-from src.trackers.ANT import ANT
-from src.trackers.AR import AR
-from src.trackers.ASC import ASC
-from src.trackers.BHD import BHD
-from src.trackers.BHDTV import BHDTV
-from src.trackers.BLU import BLU
-from src.trackers.BT import BT
-from src.trackers.CBR import CBR
-from src.trackers.DC import DC
-from src.trackers.DP import DP
-from src.trackers.FL import FL
-from src.trackers.FNP import FNP
-from src.trackers.FRIKI import FRIKI
-from src.trackers.HDB import HDB
-from src.trackers.HDS import HDS
-from src.trackers.HDT import HDT
-from src.trackers.HHD import HHD
-from src.trackers.HUNO import HUNO
-from src.trackers.ITT import ITT
-from src.trackers.LCD import LCD
-from src.trackers.LDU import LDU
-from src.trackers.LST import LST
-from src.trackers.LT import LT
-from src.trackers.MTV import MTV
-from src.trackers.NBL import NBL
-from src.trackers.NYAA import NYAA
-from src.trackers.OE import OE
-from src.trackers.OTW import OTW
-from src.trackers.PSS import PSS
-from src.trackers.PT import PT
-from src.trackers.PTER import PTER
-from src.trackers.PTP import PTP
-from src.trackers.PTT import PTT
-from src.trackers.R4E import R4E
-from src.trackers.RAS import RAS
-from src.trackers.RF import RF
-from src.trackers.RTF import RTF
-from src.trackers.SAM import SAM
-from src.trackers.SHRI import SHRI
-from src.trackers.SN import SN
-from src.trackers.SP import SP
-from src.trackers.SPD import SPD
-from src.trackers.STC import STC
-from src.trackers.THR import THR
-from src.trackers.TIK import TIK
-from src.trackers.TL import TL
-from src.trackers.TOCA import TOCA
-from src.trackers.TTG import TTG
-from src.trackers.TVC import TVC
-from src.trackers.UHD import UHD
-from src.trackers.ULCX import ULCX
-from src.trackers.UTP import UTP
-from src.trackers.YOINK import YOINK
-from src.trackers.YUS import YUS
 from src.console import console
+from src.httpsessions import shared_session
 import httpx
 import os
 import json
 import cli_ui
 from datetime import datetime, timedelta
 import asyncio
+import importlib
+from collections.abc import Mapping
 
 
 class TRACKER_SETUP:
@@ -120,7 +66,7 @@ class TRACKER_SETUP:
         all_data = []
         next_cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with shared_session(url) as client:
             while True:
                 try:
                     # Add query parameters for pagination
@@ -334,7 +280,7 @@ class TRACKER_SETUP:
         all_data = []
         next_cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with shared_session(url) as client:
             while True:
                 try:
                     # Add query parameters for pagination
@@ -466,13 +412,41 @@ class TRACKER_SETUP:
         return match_found
 
 
-tracker_class_map = {
-    'ACM': ACM, 'AITHER': AITHER, 'AL': AL, 'ANT': ANT, 'AR': AR, 'ASC': ASC, 'BHD': BHD, 'BHDTV': BHDTV, 'BLU': BLU, 'BT': BT, 'CBR': CBR,
-    'DC': DC, 'DP': DP, 'FNP': FNP, 'FL': FL, 'FRIKI': FRIKI, 'HDB': HDB, 'HDS': HDS, 'HDT': HDT, 'HHD': HHD, 'HUNO': HUNO, 'ITT': ITT,
-    'LCD': LCD, 'LDU': LDU, 'LST': LST, 'LT': LT, 'MTV': MTV, 'NBL': NBL, "NYAA": NYAA, 'OE': OE, 'OTW': OTW, 'PSS': PSS, 'PT': PT, 'PTP': PTP, 'PTER': PTER, 'PTT': PTT,
-    'R4E': R4E, 'RAS': RAS, 'RF': RF, 'RTF': RTF, 'SAM': SAM, 'SHRI': SHRI, 'SN': SN, 'SP': SP, 'SPD': SPD, 'STC': STC, 'THR': THR,
-    'TIK': TIK, 'TL': TL, 'TOCA': TOCA, 'TVC': TVC, 'TTG': TTG, 'UHD': UHD, 'ULCX': ULCX, 'UTP': UTP, 'YOINK': YOINK, 'YUS': YUS
-}
+class TrackerRegistry(Mapping):
+    """
+    Tracker name -> tracker class, importing src/trackers/{name}.py the first time the tracker is used,
+    so a run only pays for the trackers it targets. Membership tests and iteration never import.
+    """
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        self.classes = {}
+
+    def __getitem__(self, name):
+        tracker_class = self.classes.get(name)
+        if tracker_class is None:
+            if name not in self.names:
+                raise KeyError(name)
+            tracker_class = self.classes[name] = getattr(importlib.import_module(f"src.trackers.{name}"), name)
+        return tracker_class
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+tracker_class_map = TrackerRegistry([
+    'ACM', 'AITHER', 'AL', 'ANT', 'AR', 'ASC', 'BHD', 'BHDTV', 'BLU', 'BT', 'CBR', 'DC', 'DP', 'FNP',
+    'FL', 'FRIKI', 'HDB', 'HDS', 'HDT', 'HHD', 'HUNO', 'ITT', 'LCD', 'LDU', 'LST', 'LT', 'MTV', 'NBL',
+    'NYAA', 'OE', 'OTW', 'PSS', 'PT', 'PTP', 'PTER', 'PTT', 'R4E', 'RAS', 'RF', 'RTF', 'SAM', 'SHRI',
+    'SN', 'SP', 'SPD', 'STC', 'THR', 'TIK', 'TL', 'TOCA', 'TVC', 'TTG', 'UHD', 'ULCX', 'UTP', 'YOINK',
+    'YUS'
+])
 
 api_trackers = {
     'ACM', 'AITHER', 'AL', 'BHD', 'BLU', 'CBR', 'DP', 'FNP', 'FRIKI', 'HHD', 'HUNO', 'ITT', 'LCD', 'LDU', 'LST', 'LT',
@@ -1,7 +1,7 @@
 import asyncio
 import os
+import time
 from torf import Torrent
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, tracker_class_map, http_trackers
 from src.console import console
 from data.config import config
@@ -10,10 +10,49 @@ from src.uphelper import UploadHelper
 from src.torrentcreate import create_base_from_existing_torrent
 from src.dupe_checking import filter_dupes
 from src.imdb import get_imdb_info_api
+from src.metaview import MetaView
+from src.profiling import span, traced
+from src import cleanup
 import cli_ui
-import copy
 
 
+# Trackers whose credential check or dupe search can stop and ask the user something,
+# these are never searched ahead of time in attended runs
+prompting_trackers = {'BHD', 'FL', 'MTV', 'OTW', 'TTG', 'ULCX'}
+
+# Trackers whose credential check also loads the session their dupe search and upload use,
+# so it has to run for every job
+stateful_credentials = {'AR', 'ASC', 'BT', 'HDS'}
+
+# Tracker: time of its last successful credential check, reused by later daemon/watch jobs
+_validated = {}
+
+
+async def validate_credentials(tracker_name, tracker_class, meta):
+    """
+    tracker_class.validate_credentials(meta), skipped while the daemon or watch mode runs jobs and the
+    tracker's credentials were checked successfully within daemon_credential_minutes.
+    """
+    ttl = float(config['DEFAULT'].get('daemon_credential_minutes', 10) or 0) * 60
+    checked = _validated.get(tracker_name)
+    if cleanup.daemon_active and tracker_name not in stateful_credentials and checked and time.time() - checked < ttl:
+        if meta['debug']:
+            console.print(f"[cyan]{tracker_name} credentials checked {int(time.time() - checked)}s ago, not checking again")
+        return True
+    valid = await tracker_class.validate_credentials(meta)
+    if valid is True:
+        _validated[tracker_name] = time.time()
+    else:
+        forget_credentials(tracker_name)
+    return valid
+
+
+def forget_credentials(tracker_name):
+    """Check the tracker's credentials again for the next job, e.g. after its upload failed."""
+    _validated.pop(tracker_name, None)
+
+
+@traced('tracker_checks')
 async def process_all_trackers(meta):
     tracker_status = {}
     successful_trackers = 0
@@ -27,9 +66,48 @@ async def process_all_trackers(meta):
         if tracker not in meta['tracker_status']:
             meta['tracker_status'][tracker] = {}
 
-    async def process_single_tracker(tracker_name, shared_meta):
+    async def prefetch_tracker(tracker_name, shared_meta):
+        """
+        Run the network bound part of a tracker's checks (credentials, claims, dupe search) ahead of
+        the interactive confirmations. The result is handed to process_single_tracker, which then
+        only has the prompts left to do.
+        """
+        local_meta = MetaView(shared_meta)
+        tracker_class = tracker_class_map[tracker_name](config=config)
+        prefetched = {'meta': local_meta, 'tracker_class': tracker_class}
+        if tracker_name in http_trackers:
+            await validate_credentials(tracker_name, tracker_class, shared_meta)
+            prefetched['validated'] = True
+
+        if local_meta['tracker_status'][tracker_name].get('skip_upload'):
+            return prefetched
+        if tracker_name == "AITHER":
+            prefetched['claimed'] = await tracker_setup.get_torrent_claims(local_meta, tracker_name)
+            if prefetched['claimed']:
+                return prefetched
+
+        disctype = local_meta.get('disctype', None)
+        with span(f"dupe search {tracker_name}", cat='tracker'):
+            if tracker_name == "PTP":
+                ptp = tracker_class_map['PTP'](config=config)
+                prefetched['ptp_groupID'] = await ptp.get_group_by_imdb(local_meta['imdb'])
+                prefetched['dupes'] = await ptp.search_existing(prefetched['ptp_groupID'], local_meta, disctype)
+            else:
+                prefetched['dupes'] = await tracker_class.search_existing(local_meta, disctype)
+        return prefetched
+
+    def can_prefetch(tracker_name):
+        if tracker_name not in tracker_class_map or tracker_name in prompting_trackers:
+            return False
+        # THR and PTP ask for a missing IMDb id before searching
+        if tracker_name in {"THR", "PTP"} and meta.get('imdb_id', 0) == 0:
+            return False
+        return True
+
+    async def process_single_tracker(tracker_name, shared_meta, prefetched=None):
         nonlocal successful_trackers
-        local_meta = copy.deepcopy(shared_meta)  # Ensure each task gets its own copy of meta
+        prefetched = prefetched or {}
+        local_meta = prefetched['meta'] if 'meta' in prefetched else MetaView(shared_meta)  # Each task writes to its own copy-on-write view of meta
         local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False}
         disctype = local_meta.get('disctype', None)
 
@@ -41,9 +119,9 @@ async def process_all_trackers(meta):
             successful_trackers += 1
 
         if tracker_name in tracker_class_map:
-            tracker_class = tracker_class_map[tracker_name](config=config)
-            if tracker_name in http_trackers:
-                await tracker_class.validate_credentials(meta)
+            tracker_class = prefetched.get('tracker_class') or tracker_class_map[tracker_name](config=config)
+            if tracker_name in http_trackers and not prefetched.get('validated'):
+                await validate_credentials(tracker_name, tracker_class, meta)
             if tracker_name in {"THR", "PTP"}:
                 if local_meta.get('imdb_id', 0) == 0:
                     while True:
@@ -82,18 +160,28 @@ async def process_all_trackers(meta):
 
             if not local_tracker_status['banned'] and not local_tracker_status['skipped']:
                 if tracker_name == "AITHER":
-                    if await tracker_setup.get_torrent_claims(local_meta, tracker_name):
+                    if 'claimed' in prefetched:
+                        claimed = prefetched['claimed']
+                    else:
+                        claimed = await tracker_setup.get_torrent_claims(local_meta, tracker_name)
+                    if claimed:
                         local_tracker_status['skipped'] = True
                     else:
                         local_tracker_status['skipped'] = False
 
-                if tracker_name not in {"PTP"} and not local_tracker_status['skipped']:
-                    dupes = await tracker_class.search_existing(local_meta, disctype)
+                if 'dupes' in prefetched and not local_tracker_status['skipped']:
+                    dupes = prefetched['dupes']
+                    if tracker_name == "PTP":
+                        meta['ptp_groupID'] = prefetched['ptp_groupID']
+                elif tracker_name not in {"PTP"} and not local_tracker_status['skipped']:
+                    with span(f"dupe search {tracker_name}", cat='tracker'):
+                        dupes = await tracker_class.search_existing(local_meta, disctype)
                 elif tracker_name == "PTP":
-                    ptp = PTP(config=config)
-                    groupID = await ptp.get_group_by_imdb(local_meta['imdb'])
-                    meta['ptp_groupID'] = groupID
-                    dupes = await ptp.search_existing(groupID, local_meta, disctype)
+                    with span(f"dupe search {tracker_name}", cat='tracker'):
+                        ptp = tracker_class_map['PTP'](config=config)
+                        groupID = await ptp.get_group_by_imdb(local_meta['imdb'])
+                        meta['ptp_groupID'] = groupID
+                        dupes = await ptp.search_existing(groupID, local_meta, disctype)
 
                 if tracker_name == "ASC" and meta.get('anon', 'false'):
                     console.print("PT: [yellow]Aviso: Você solicitou um upload anônimo, mas o ASC não suporta essa opção.[/yellow][red] O envio não será anônimo.[/red]")
@@ -181,11 +269,25 @@ async def process_all_trackers(meta):
         if passed_trackers:
             console.print(f"[bold green]Trackers passed all checks: [bold yellow]{', '.join(passed_trackers)}")
     else:
+        # Fire every dupe search and credential check at once, only the confirmations below run one by one
+        prefetch_names = [name for name in meta['trackers'] if can_prefetch(name)]
+        prefetched = {}
+        if prefetch_names:
+            console.print(f"[yellow]Searching for existing torrents on: {', '.join(prefetch_names)}...")
+            results = await asyncio.gather(*[prefetch_tracker(name, meta) for name in prefetch_names], return_exceptions=True)
+            for tracker_name, result in zip(prefetch_names, results):
+                if isinstance(result, Exception):
+                    # Searched again in the serial pass, which reports the error as before
+                    if meta['debug']:
+                        console.print(f"[yellow]Prefetch for {tracker_name} failed: {result}")
+                    continue
+                prefetched[tracker_name] = result
+
         passed_trackers = []
         for tracker_name in meta['trackers']:
-            if tracker_name in tracker_class_map:
+            if tracker_name in tracker_class_map and tracker_name not in prefetched:
                 console.print(f"[yellow]Searching for existing torrents on {tracker_name}...")
-            tracker_name, status = await process_single_tracker(tracker_name, meta)
+            tracker_name, status = await process_single_tracker(tracker_name, meta, prefetched.get(tracker_name))
             tracker_status[tracker_name] = status
             if not status['banned'] and not status['skipped'] and not status['dupe']:
                 passed_trackers.append(tracker_name)
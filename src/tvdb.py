@@ -1,15 +1,45 @@
 import httpx
 import re
 from src.console import console
+from src.episodeindex import EpisodeIndex, episode_index, index_episode
+from src.metacache import cached_session
+from src.profiling import traced
 from data.config import config
 
 config = config
 
 
+def tvdb_episode_result(episode_data, series_data, season, episode, debug=False):
+    result = {
+        "episode_name": episode_data.get("name", ""),
+        "overview": episode_data.get("overview", ""),
+        "season_number": episode_data.get("seasonNumber", season),
+        "episode_number": episode_data.get("number", episode),
+        "air_date": episode_data.get("aired", ""),
+        "season_name": episode_data.get("seasonName", ""),
+        "series_name": series_data.get("name", ""),
+        "series_overview": series_data.get("overview", ""),
+        'series_year': series_data.get("year", ""),
+    }
+
+    if debug:
+        console.print(f"[green]Found episode: {result['season_name']} - S{result['season_number']}E{result['episode_number']} - {result['episode_name']}[/green] - {result['air_date']}")
+        console.print(f"[yellow]Overview: {result['overview']}")
+        console.print(f"[yellow]Series: {result['series_name']} - {result['series_overview']}[/yellow]")
+    return result
+
+
 async def get_tvdb_episode_data(base_dir, token, tvdb_id, season, episode, api_key=None, retry_attempted=False, debug=False):
     if debug:
         console.print(f"[cyan]Fetching TVDb episode data for S{season}E{episode}...[/cyan]")
 
+    # Every episode file of a series is answered from the one series episode list
+    if not retry_attempted:
+        index = await get_tvdb_episode_index(base_dir, token, tvdb_id, api_key, debug=debug)
+        indexed = index.episode(season, episode) if index else None
+        if indexed:
+            return tvdb_episode_result(indexed['data'], index.series, season, episode, debug)
+
     url = f"https://api4.thetvdb.com/v4/series/{tvdb_id}/episodes/default"
     params = {
         "page": 1,
@@ -22,7 +52,7 @@ async def get_tvdb_episode_data(base_dir, token, tvdb_id, season, episode, api_k
     }
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with cached_session('tvdb') as client:
             response = await client.get(url, params=params, headers=headers, timeout=30.0)
 
             # Handle unauthorized responses
@@ -65,24 +95,7 @@ async def get_tvdb_episode_data(base_dir, token, tvdb_id, season, episode, api_k
             if data.get("status") == "success" and data.get("data") and data["data"].get("episodes"):
                 episode_data = data["data"]["episodes"][0]
                 series_data = data["data"].get("series", {})
-
-                result = {
-                    "episode_name": episode_data.get("name", ""),
-                    "overview": episode_data.get("overview", ""),
-                    "season_number": episode_data.get("seasonNumber", season),
-                    "episode_number": episode_data.get("number", episode),
-                    "air_date": episode_data.get("aired", ""),
-                    "season_name": episode_data.get("seasonName", ""),
-                    "series_name": series_data.get("name", ""),
-                    "series_overview": series_data.get("overview", ""),
-                    'series_year': series_data.get("year", ""),
-                }
-
-                if debug:
-                    console.print(f"[green]Found episode: {result['season_name']} - S{result['season_number']}E{result['episode_number']} - {result['episode_name']}[/green] - {result['air_date']}")
-                    console.print(f"[yellow]Overview: {result['overview']}")
-                    console.print(f"[yellow]Series: {result['series_name']} - {result['series_overview']}[/yellow]")
-                return result
+                return tvdb_episode_result(episode_data, series_data, season, episode, debug)
             else:
                 console.print(f"[yellow]No TVDB episode data found for S{season}E{episode}[/yellow]")
                 return None
@@ -112,7 +125,7 @@ async def get_tvdb_token(api_key, base_dir):
     }
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with cached_session('tvdb') as client:
             response = await client.post(url, json=payload, headers=headers, timeout=30.0)
             response.raise_for_status()
             data = response.json()
@@ -176,7 +189,12 @@ async def get_tvdb_token(api_key, base_dir):
         return None
 
 
-async def get_tvdb_series_episodes(base_dir, token, tvdb_id, season, episode, api_key=None, retry_attempted=False, debug=False):
+async def get_tvdb_episode_index(base_dir, token, tvdb_id, api_key=None, debug=False):
+    """Every episode of a TVDb series, fetched once with the extended series request (see src/episodeindex.py)."""
+    return await episode_index('tvdb', tvdb_id, lambda: fetch_tvdb_episode_index(base_dir, token, tvdb_id, api_key, debug=debug))
+
+
+async def fetch_tvdb_episode_index(base_dir, token, tvdb_id, api_key=None, retry_attempted=False, debug=False):
     if debug:
         console.print(f"[cyan]Fetching episode list for series ID {tvdb_id}...[/cyan]")
 
@@ -186,229 +204,218 @@ async def get_tvdb_series_episodes(base_dir, token, tvdb_id, season, episode, ap
         "Authorization": f"Bearer {token}"
     }
 
-    all_episodes = []
-
     try:
-        async with httpx.AsyncClient() as client:
+        async with cached_session('tvdb') as client:
             response = await client.get(url, headers=headers, timeout=30.0)
 
-            # Handle unauthorized responses
-            if response.status_code == 401:
-                # Only attempt a retry once to prevent infinite loops
-                if api_key and not retry_attempted:
-                    console.print("[yellow]Unauthorized access. Refreshing TVDb token...[/yellow]")
-                    new_token = await get_tvdb_token(api_key, base_dir)
-                    if new_token:
-                        # Retry the request with the new token
-                        return await get_tvdb_series_episodes(
-                            base_dir, new_token, tvdb_id, season, episode, api_key, True
-                        )
-                    else:
-                        console.print("[red]Failed to refresh TVDb token[/red]")
-                        return (season, episode)
-                else:
-                    console.print("[red]Unauthorized access to TVDb API[/red]")
-                    return (season, episode)
-
+        data = {}
+        if response.status_code != 401:
             response.raise_for_status()
             data = response.json()
 
-            # Check for "Unauthorized" message in response body
-            if data.get("message") == "Unauthorized":
-                if api_key and not retry_attempted:
-                    console.print("[yellow]Token invalid or expired. Refreshing TVDb token...[/yellow]")
-                    new_token = await get_tvdb_token(api_key, base_dir)
-                    if new_token:
-                        return await get_tvdb_series_episodes(
-                            base_dir, new_token, tvdb_id, season, episode, api_key, True
-                        )
-                    else:
-                        console.print("[red]Failed to refresh TVDb token[/red]")
-                        return (season, episode)
-                else:
-                    console.print("[red]Unauthorized response from TVDb API[/red]")
-                    return (season, episode)
+        # Handle unauthorized responses, and the "Unauthorized" message in a response body
+        if response.status_code == 401 or data.get("message") == "Unauthorized":
+            # Only attempt a retry once to prevent infinite loops
+            if api_key and not retry_attempted:
+                console.print("[yellow]Unauthorized access. Refreshing TVDb token...[/yellow]")
+                new_token = await get_tvdb_token(api_key, base_dir)
+                if new_token:
+                    return await fetch_tvdb_episode_index(base_dir, new_token, tvdb_id, api_key, True, debug)
+                console.print("[red]Failed to refresh TVDb token[/red]")
+            else:
+                console.print("[red]Unauthorized access to TVDb API[/red]")
+            return None
+
+        if data.get("status") != "success" or not data.get("data"):
+            return None
+        series = data["data"]
+        episodes = [
+            index_episode(ep.get("seasonNumber"), ep.get("number"), ep.get("absoluteNumber"), ep.get("aired"), ep)
+            for ep in series.get("episodes") or []
+        ]
+        return EpisodeIndex(series, episodes)
 
-            if data.get("status") == "success" and data.get("data"):
-                episodes = data["data"].get("episodes", [])
-                all_episodes = episodes
+    except httpx.HTTPStatusError as e:
+        console.print(f"[red]HTTP error occurred: {e.response.status_code} - {e.response.text}[/red]")
+        return None
+    except httpx.RequestError as e:
+        console.print(f"[red]Request error occurred: {e}[/red]")
+        return None
+    except Exception as e:
+        console.print(f"[red]Error fetching TVDb episode list: {str(e)}[/red]")
+        return None
 
-            if not all_episodes:
-                console.print(f"[yellow]No episodes found for TVDB series ID {tvdb_id}[/yellow]")
-                return (season, episode)
 
-            if debug:
-                console.print(f"[cyan]Looking for season {season} episode {episode} in series {tvdb_id}[/cyan]")
-
-            # Process and organize episode data
-            episodes_by_season = {}
-            absolute_mapping = {}  # Map absolute numbers to season/episode
-
-            # Sort by aired date first (if available)
-            def get_aired_date(ep):
-                aired = ep.get("aired")
-                # Return default value if aired is None or not present
-                if aired is None:
-                    return "9999-99-99"
-                return aired
-
-            all_episodes.sort(key=get_aired_date)
-
-            for ep in all_episodes:
-                season_number = ep.get("seasonNumber")
-                episode_number = ep.get("number")
-                absolute_episode_count = ep.get("absoluteNumber")
-
-                # Ensure season_number is valid and convert to int if needed
-                if season_number is not None:
-                    try:
-                        season_number = int(season_number)
-                    except (ValueError, TypeError):
-                        console.print(f"[yellow]Invalid season number: {season_number}, skipping episode[/yellow]")
-                        continue
-                else:
-                    console.print(f"[yellow]Missing season number for episode {ep.get('name', 'Unknown')}, skipping[/yellow]")
+async def get_tvdb_series_episodes(base_dir, token, tvdb_id, season, episode, api_key=None, retry_attempted=False, debug=False):
+    all_episodes = []
+
+    try:
+        index = await get_tvdb_episode_index(base_dir, token, tvdb_id, api_key, debug=debug)
+        if index is not None:
+            all_episodes = [ep['data'] for ep in index.episodes]
+
+        if not all_episodes:
+            console.print(f"[yellow]No episodes found for TVDB series ID {tvdb_id}[/yellow]")
+            return (season, episode)
+
+        if debug:
+            console.print(f"[cyan]Looking for season {season} episode {episode} in series {tvdb_id}[/cyan]")
+
+        # Process and organize episode data
+        episodes_by_season = {}
+
+        # Sort by aired date first (if available)
+        def get_aired_date(ep):
+            aired = ep.get("aired")
+            # Return default value if aired is None or not present
+            if aired is None:
+                return "9999-99-99"
+            return aired
+
+        all_episodes.sort(key=get_aired_date)
+
+        for ep in all_episodes:
+            season_number = ep.get("seasonNumber")
+            episode_number = ep.get("number")
+            absolute_episode_count = ep.get("absoluteNumber")
+
+            # Ensure season_number is valid and convert to int if needed
+            if season_number is not None:
+                try:
+                    season_number = int(season_number)
+                except (ValueError, TypeError):
+                    console.print(f"[yellow]Invalid season number: {season_number}, skipping episode[/yellow]")
                     continue
+            else:
+                console.print(f"[yellow]Missing season number for episode {ep.get('name', 'Unknown')}, skipping[/yellow]")
+                continue
 
-                # Ensure episode_number is valid
-                if episode_number is not None:
-                    try:
-                        episode_number = int(episode_number)
-                    except (ValueError, TypeError):
-                        console.print(f"[yellow]Invalid episode number: {episode_number}, skipping episode[/yellow]")
-                        continue
-
-                # Handle special seasons (e.g., season 0)
-                is_special = season_number == 0
-
-                if not is_special:
-                    # Store mapping of absolute number to season/episode
-                    absolute_mapping[absolute_episode_count] = {
-                        "season": season_number,
-                        "episode": episode_number,
-                        "episode_data": ep
-                    }
-
-                episode_data = {
-                    "id": ep.get("id"),
-                    "name": ep.get("name", ""),
-                    "overview": ep.get("overview", ""),
-                    "seasonNumber": season_number,
-                    "episodeNumber": episode_number,
-                    "absoluteNumber": absolute_episode_count if not is_special else None,
-                    "aired": ep.get("aired"),
-                    "runtime": ep.get("runtime"),
-                    "imageUrl": ep.get("image"),
-                    "thumbUrl": ep.get("thumbnail"),
-                    "isMovie": ep.get("isMovie", False),
-                    "airsAfterSeason": ep.get("airsAfterSeason"),
-                    "airsBeforeSeason": ep.get("airsBeforeSeason"),
-                    "airsBeforeEpisode": ep.get("airsBeforeEpisode"),
-                    "productionCode": ep.get("productionCode", ""),
-                    "finaleType": ep.get("finaleType", ""),
-                    "year": ep.get("year")
-                }
-
-                # Create a season entry if it doesn't exist
-                if season_number not in episodes_by_season:
-                    episodes_by_season[season_number] = []
-
-                # Add the episode to its season
-                episodes_by_season[season_number].append(episode_data)
-
-            # Sort episodes within each season by episode number
-            for s in episodes_by_season:
-                valid_episodes = [ep for ep in episodes_by_season[s] if ep["episodeNumber"] is not None]
-                episodes_by_season[s] = sorted(valid_episodes, key=lambda ep: ep["episodeNumber"])
-
-            # If season and episode were provided, try to find the matching episode
-            if season is not None and episode is not None:
-                found_episode = None
-
-                # Ensure season is an integer
+            # Ensure episode_number is valid
+            if episode_number is not None:
                 try:
-                    season = int(season)
+                    episode_number = int(episode_number)
                 except (ValueError, TypeError):
-                    if debug:
-                        console.print(f"[yellow]Invalid season number provided: {season}, using as-is[/yellow]")
+                    console.print(f"[yellow]Invalid episode number: {episode_number}, skipping episode[/yellow]")
+                    continue
 
+            # Handle special seasons (e.g., season 0)
+            is_special = season_number == 0
+
+            episode_data = {
+                "id": ep.get("id"),
+                "name": ep.get("name", ""),
+                "overview": ep.get("overview", ""),
+                "seasonNumber": season_number,
+                "episodeNumber": episode_number,
+                "absoluteNumber": absolute_episode_count if not is_special else None,
+                "aired": ep.get("aired"),
+                "runtime": ep.get("runtime"),
+                "imageUrl": ep.get("image"),
+                "thumbUrl": ep.get("thumbnail"),
+                "isMovie": ep.get("isMovie", False),
+                "airsAfterSeason": ep.get("airsAfterSeason"),
+                "airsBeforeSeason": ep.get("airsBeforeSeason"),
+                "airsBeforeEpisode": ep.get("airsBeforeEpisode"),
+                "productionCode": ep.get("productionCode", ""),
+                "finaleType": ep.get("finaleType", ""),
+                "year": ep.get("year")
+            }
+
+            # Create a season entry if it doesn't exist
+            if season_number not in episodes_by_season:
+                episodes_by_season[season_number] = []
+
+            # Add the episode to its season
+            episodes_by_season[season_number].append(episode_data)
+
+        # Sort episodes within each season by episode number
+        for s in episodes_by_season:
+            valid_episodes = [ep for ep in episodes_by_season[s] if ep["episodeNumber"] is not None]
+            episodes_by_season[s] = sorted(valid_episodes, key=lambda ep: ep["episodeNumber"])
+
+        # If season and episode were provided, try to find the matching episode
+        if season is not None and episode is not None:
+            found_episode = None
+
+            # Ensure season is an integer
+            try:
+                season = int(season)
+            except (ValueError, TypeError):
                 if debug:
-                    console.print(f"[cyan]Looking for season {season} (type: {type(season)}) in episodes_by_season keys: {sorted(episodes_by_season.keys())} (types: {[type(s) for s in episodes_by_season.keys()]})[/cyan]")
+                    console.print(f"[yellow]Invalid season number provided: {season}, using as-is[/yellow]")
 
-                # First try to find the episode in the specified season
-                if season in episodes_by_season:
-                    if debug:
-                        console.print(f"[green]Found season {season} in episodes_by_season[/green]")
+            if debug:
+                console.print(f"[cyan]Looking for season {season} (type: {type(season)}) in episodes_by_season keys: {sorted(episodes_by_season.keys())} (types: {[type(s) for s in episodes_by_season.keys()]})[/cyan]")
 
-                    # Convert episode to int if not already
-                    try:
-                        episode = int(episode)
-                    except (ValueError, TypeError):
-                        if debug:
-                            console.print(f"[yellow]Invalid episode number provided: {episode}, using as-is[/yellow]")
+            # First try to find the episode in the specified season
+            if season in episodes_by_season:
+                if debug:
+                    console.print(f"[green]Found season {season} in episodes_by_season[/green]")
 
-                    max_episode_in_season = max([ep["episodeNumber"] or 0 for ep in episodes_by_season[season]])
+                # Convert episode to int if not already
+                try:
+                    episode = int(episode)
+                except (ValueError, TypeError):
+                    if debug:
+                        console.print(f"[yellow]Invalid episode number provided: {episode}, using as-is[/yellow]")
 
-                    if episode <= max_episode_in_season:
-                        # Episode exists in this season normally
-                        for ep in episodes_by_season[season]:
-                            if ep["episodeNumber"] == episode:
-                                found_episode = ep
-                                if debug:
-                                    console.print(f"[green]Found episode S{season}E{episode} directly: {ep['name']}[/green]")
-                                # Since we found it directly, return the original season and episode
-                                return (season, episode)
-                    else:
-                        # Episode number is greater than max in this season, so try absolute numbering
-                        if debug:
-                            console.print(f"[yellow]Episode {episode} is greater than max episode ({max_episode_in_season}) in season {season}[/yellow]")
-                            console.print("[yellow]Trying to find by absolute episode number...[/yellow]")
-
-                        # Calculate absolute episode number
-                        absolute_number = episode
-                        for s in range(1, season):
-                            if s in episodes_by_season:
-                                absolute_number += len(episodes_by_season[s])
-
-                        if absolute_number in absolute_mapping:
-                            actual_season = absolute_mapping[absolute_number]["season"]
-                            actual_episode = absolute_mapping[absolute_number]["episode"]
-
-                            # Find the episode in the seasons data
-                            for ep in episodes_by_season[actual_season]:
-                                if ep["episodeNumber"] == actual_episode:
-                                    found_episode = ep
-                                    if debug:
-                                        console.print(f"[green]Found by absolute number {absolute_number}: S{actual_season}E{actual_episode} - {ep['name']}[/green]")
-                                        console.print(f"[bold yellow]Note: S{season}E{episode} maps to S{actual_season}E{actual_episode} using absolute numbering[/bold yellow]")
-                                    # Return the absolute-based season and episode since that's what corresponds to the actual content
-                                    return (actual_season, actual_episode)
-                        else:
+                max_episode_in_season = max([ep["episodeNumber"] or 0 for ep in episodes_by_season[season]])
+
+                if episode <= max_episode_in_season:
+                    # Episode exists in this season normally
+                    for ep in episodes_by_season[season]:
+                        if ep["episodeNumber"] == episode:
+                            found_episode = ep
                             if debug:
-                                console.print(f"[red]Could not find episode with absolute number {absolute_number}[/red]")
-                            # Return original values if absolute mapping failed
+                                console.print(f"[green]Found episode S{season}E{episode} directly: {ep['name']}[/green]")
+                            # Since we found it directly, return the original season and episode
                             return (season, episode)
                 else:
+                    # Episode number is greater than max in this season, so try absolute numbering
                     if debug:
-                        console.print(f"[red]Season {season} not found in series[/red]")
-                    # Return original values if season wasn't found
-                    return (season, episode)
-
-                # If we get here and haven't returned yet, return the original values
-                if not found_episode:
-                    if debug:
-                        console.print(f"[yellow]No matching episode found, keeping original S{season}E{episode}[/yellow]")
-                    return (season, episode)
+                        console.print(f"[yellow]Episode {episode} is greater than max episode ({max_episode_in_season}) in season {season}[/yellow]")
+                        console.print("[yellow]Trying to find by absolute episode number...[/yellow]")
+
+                    # Calculate absolute episode number
+                    absolute_number = episode
+                    for s in range(1, season):
+                        if s in episodes_by_season:
+                            absolute_number += len(episodes_by_season[s])
+
+                    by_absolute = index.absolute(absolute_number)
+                    if by_absolute:
+                        actual_season = by_absolute["season"]
+                        actual_episode = by_absolute["episode"]
+
+                        # Find the episode in the seasons data
+                        for ep in episodes_by_season.get(actual_season, []):
+                            if ep["episodeNumber"] == actual_episode:
+                                found_episode = ep
+                                if debug:
+                                    console.print(f"[green]Found by absolute number {absolute_number}: S{actual_season}E{actual_episode} - {ep['name']}[/green]")
+                                    console.print(f"[bold yellow]Note: S{season}E{episode} maps to S{actual_season}E{actual_episode} using absolute numbering[/bold yellow]")
+                                # Return the absolute-based season and episode since that's what corresponds to the actual content
+                                return (actual_season, actual_episode)
+                    else:
+                        if debug:
+                            console.print(f"[red]Could not find episode with absolute number {absolute_number}[/red]")
+                        # Return original values if absolute mapping failed
+                        return (season, episode)
+            else:
+                if debug:
+                    console.print(f"[red]Season {season} not found in series[/red]")
+                # Return original values if season wasn't found
+                return (season, episode)
 
-            # If we get here, no specific episode was requested or processing, so return the original values
-            return (season, episode)
+            # If we get here and haven't returned yet, return the original values
+            if not found_episode:
+                if debug:
+                    console.print(f"[yellow]No matching episode found, keeping original S{season}E{episode}[/yellow]")
+                return (season, episode)
 
-    except httpx.HTTPStatusError as e:
-        console.print(f"[red]HTTP error occurred: {e.response.status_code} - {e.response.text}[/red]")
-        return (season, episode)
-    except httpx.RequestError as e:
-        console.print(f"[red]Request error occurred: {e}[/red]")
+        # If we get here, no specific episode was requested or processing, so return the original values
         return (season, episode)
+
     except Exception as e:
         console.print(f"[red]Error fetching TVDb episode list: {str(e)}[/red]")
         import traceback
@@ -424,7 +431,7 @@ async def get_tvdb_series_data(base_dir, token, tvdb_id, api_key=None, retry_att
     }
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with cached_session('tvdb') as client:
             response = await client.get(url, headers=headers, timeout=30.0)
 
             if response.status_code == 401:
@@ -481,6 +488,7 @@ async def get_tvdb_series_data(base_dir, token, tvdb_id, api_key=None, retry_att
         return None
 
 
+@traced()
 async def get_tvdb_series(base_dir, title, year, apikey=None, token=None, debug=False):
     if debug:
         console.print(f"[cyan]Searching for TVDb series: {title} ({year})...[/cyan]")
@@ -515,7 +523,7 @@ async def get_tvdb_series(base_dir, title, year, apikey=None, token=None, debug=
         if debug:
             console.print(f"[cyan]{attempt_description}Searching with query: '{search_title}'{f' (year: {search_year})' if search_year else ''}[/cyan]")
 
-        async with httpx.AsyncClient() as client:
+        async with cached_session('tvdb') as client:
             response = await client.get(url, params=params, headers=headers, timeout=30.0)
 
             if response.status_code == 401:
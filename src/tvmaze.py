@@ -1,8 +1,12 @@
 from src.console import console
+from src.episodeindex import EpisodeIndex, episode_index, index_episode
+from src.metacache import cached_session
+from src.profiling import traced
 import httpx
 import json
 
 
+@traced()
 async def search_tvmaze(filename, year, imdbID, tvdbID, manual_date=None, tvmaze_manual=None, debug=False, return_full_tuple=False):
     """Searches TVMaze for a show using TVDB ID, IMDb ID, or a title query.
 
@@ -130,7 +134,7 @@ async def search_tvmaze(filename, year, imdbID, tvdbID, manual_date=None, tvmaze
 async def _make_tvmaze_request(url, params):
     """Sync function to make the request inside ThreadPoolExecutor."""
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
+        async with cached_session('tvmaze', follow_redirects=True) as client:
             resp = await client.get(url, params=params, timeout=10)
             if resp.status_code == 200:
                 return resp.json()
@@ -143,6 +147,56 @@ async def _make_tvmaze_request(url, params):
     return {}
 
 
+async def get_tvmaze_episode_index(tvmaze_id):
+    """Every episode of a TVmaze show, fetched once together with the show (see src/episodeindex.py)."""
+    return await episode_index('tvmaze', tvmaze_id, lambda: fetch_tvmaze_episode_index(tvmaze_id))
+
+
+async def fetch_tvmaze_episode_index(tvmaze_id):
+    url = f"https://api.tvmaze.com/shows/{tvmaze_id}"
+    try:
+        async with cached_session('tvmaze', follow_redirects=True) as client:
+            response = await client.get(url, params={"embed": "episodes"}, timeout=10.0)
+            response.raise_for_status()
+            show_data = response.json()
+    except httpx.HTTPStatusError as e:
+        console.print(f"[red]HTTP error occurred: {e.response.status_code} - {e.response.text}[/red]")
+        return None
+    except httpx.RequestError as e:
+        console.print(f"[red]Request error occurred: {e}[/red]")
+        return None
+    except Exception as e:
+        console.print(f"[red]Error fetching TVMaze episode list: {e}[/red]")
+        return None
+
+    episodes = [
+        index_episode(ep.get("season"), ep.get("number"), None, ep.get("airdate"), ep)
+        for ep in show_data.get("_embedded", {}).get("episodes", [])
+    ]
+    return EpisodeIndex(show_data, episodes)
+
+
+def tvmaze_episode_result(data, show_data, season, episode):
+    # Clean HTML tags from summary
+    summary = data.get("summary", "")
+    if summary:
+        summary = summary.replace("<p>", "").replace("</p>", "").strip()
+
+    # Format the response in a consistent structure
+    return {
+        "episode_name": data.get("name", ""),
+        "overview": summary,
+        "season_number": data.get("season", season),
+        "episode_number": data.get("number", episode),
+        "air_date": data.get("airdate", ""),
+        "runtime": data.get("runtime", 0),
+        "series_name": show_data.get("name", data.get("_links", {}).get("show", {}).get("name", "")),
+        "series_overview": show_data.get("summary", "").replace("<p>", "").replace("</p>", "").strip(),
+        "image": data.get("image", {}).get("original", None) if data.get("image") else None,
+        "series_image": show_data.get("image", {}).get("original", None) if show_data.get("image") else None,
+    }
+
+
 async def get_tvmaze_episode_data(tvmaze_id, season, episode):
     url = f"https://api.tvmaze.com/shows/{tvmaze_id}/episodebynumber"
     params = {
@@ -151,7 +205,13 @@ async def get_tvmaze_episode_data(tvmaze_id, season, episode):
     }
 
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
+        # Every episode file of a show is answered from the one show request
+        index = await get_tvmaze_episode_index(tvmaze_id)
+        indexed = index.episode(season, episode) if index else None
+        if indexed:
+            return tvmaze_episode_result(indexed['data'], index.series, season, episode)
+
+        async with cached_session('tvmaze', follow_redirects=True) as client:
             response = await client.get(url, params=params, timeout=10.0)
             response.raise_for_status()
             data = response.json()
@@ -169,26 +229,7 @@ async def get_tvmaze_episode_data(tvmaze_id, season, episode):
                     else:
                         show_data = {"name": show_name}
 
-                # Clean HTML tags from summary
-                summary = data.get("summary", "")
-                if summary:
-                    summary = summary.replace("<p>", "").replace("</p>", "").strip()
-
-                # Format the response in a consistent structure
-                result = {
-                    "episode_name": data.get("name", ""),
-                    "overview": summary,
-                    "season_number": data.get("season", season),
-                    "episode_number": data.get("number", episode),
-                    "air_date": data.get("airdate", ""),
-                    "runtime": data.get("runtime", 0),
-                    "series_name": show_data.get("name", data.get("_links", {}).get("show", {}).get("name", "")),
-                    "series_overview": show_data.get("summary", "").replace("<p>", "").replace("</p>", "").strip(),
-                    "image": data.get("image", {}).get("original", None) if data.get("image") else None,
-                    "series_image": show_data.get("image", {}).get("original", None) if show_data.get("image") else None,
-                }
-
-                return result
+                return tvmaze_episode_result(data, show_data, season, episode)
             else:
                 console.print(f"[yellow]No episode data found for S{season:02d}E{episode:02d}[/yellow]")
                 return None
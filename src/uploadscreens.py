@@ -1,16 +1,18 @@
 from src.console import console
 import os
-import pyimgbox
 import asyncio
-import requests
+import httpx
 import glob
 import base64
 import time
 import re
 import gc
 import json
-from concurrent.futures import ThreadPoolExecutor
 import traceback
+from urllib.parse import quote_plus, urlencode
+from src.httpsessions import api_timeout, get_named_session, host_key, pooled_transport
+from src.imagecache import lookup_image, remember_image
+from src.profiling import traced
 
 try:
     from data.config import config
@@ -21,7 +23,66 @@ except Exception:
     exit(1)
 
 
-def upload_image_task(args):
+# Upload concurrency per image host, hosts not listed use image_upload_limit
+host_limits = {"onlyimage": 6, "ptscreens": 1, "lensdump": 1, "passtheimage": 6}
+default_host_limit = int(config['DEFAULT'].get('image_upload_limit', 6))
+base64_chunk_size = 3 * 64 * 1024  # multiple of 3 so chunks encode without padding
+_host_semaphores = {}
+
+
+def host_limit(img_host):
+    return host_limits.get(img_host, default_host_limit)
+
+
+def host_semaphore(img_host):
+    """Per image host upload limit, shared by every upload_screens call on the running loop."""
+    loop = asyncio.get_running_loop()
+    entry = _host_semaphores.get(img_host)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(host_limit(img_host)))
+        _host_semaphores[img_host] = entry
+    return entry[1]
+
+
+def image_host_session(img_host, url=None):
+    """Pooled client for an image host, with as many connections as uploads allowed to it."""
+    name = f"imagehost:{img_host}:{host_key(url) if url else ''}"
+    return get_named_session(
+        name,
+        lambda: httpx.AsyncClient(transport=pooled_transport(host_limit(img_host)), timeout=api_timeout, follow_redirects=False)
+    )
+
+
+def base64_form(image, field, fields=None):
+    """
+    Build an urlencoded form body with `image` base64 encoded into `field`, for hosts that only
+    take base64 data. The body is encoded chunk by chunk while it is sent, so the image is never
+    held in memory; a counting pass up front gives the Content-Length.
+    Returns (headers, content) for an httpx request.
+    """
+    prefix = urlencode(fields or {})
+    prefix = f"{prefix}&{field}=" if prefix else f"{field}="
+
+    def encoded_chunks():
+        with open(image, "rb") as img_file:
+            while chunk := img_file.read(base64_chunk_size):
+                yield quote_plus(base64.b64encode(chunk).decode('ascii')).encode('ascii')
+
+    length = len(prefix) + sum(len(chunk) for chunk in encoded_chunks())
+
+    async def content():
+        yield prefix.encode('ascii')
+        for chunk in encoded_chunks():
+            yield chunk
+
+    headers = {
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'Content-Length': str(length),
+    }
+    return headers, content()
+
+
+async def upload_image_task(args):
     image, img_host, config, meta = args
     try:
         timeout = 60  # Default timeout
@@ -29,7 +90,7 @@ def upload_image_task(args):
 
         if img_host == "imgbox":
             try:
-                image_list = asyncio.run(imgbox_upload(os.getcwd(), [image], meta, return_dict={}))
+                image_list = await imgbox_upload([image], meta, return_dict={})
                 if image_list and all(
                     'img_url' in img and 'raw_url' in img and 'web_url' in img for img in image_list
                 ):
@@ -58,7 +119,7 @@ def upload_image_task(args):
                 headers = {'referer': 'https://ptpimg.me/index.php'}
 
                 try:
-                    response = requests.post(
+                    response = await image_host_session(img_host).post(
                         "https://ptpimg.me/upload.php", headers=headers, data=payload, files=files, timeout=timeout
                     )
                     response.raise_for_status()  # Raise an exception for HTTP errors
@@ -73,9 +134,9 @@ def upload_image_task(args):
                     raw_url = img_url
                     web_url = img_url
 
-                except requests.exceptions.Timeout:
+                except httpx.TimeoutException:
                     return {'status': 'failed', 'reason': 'Request timed out'}
-                except requests.exceptions.RequestException as e:
+                except httpx.HTTPError as e:
                     return {'status': 'failed', 'reason': f"Request failed: {str(e)}"}
                 except json.JSONDecodeError:
                     return {'status': 'failed', 'reason': 'Invalid JSON response from ptpimg'}
@@ -83,15 +144,14 @@ def upload_image_task(args):
         elif img_host == "imgbb":
             url = "https://api.imgbb.com/1/upload"
             try:
-                with open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(img_file.read()).decode('utf8')
-
                 data = {
                     'key': config['DEFAULT']['imgbb_api'],
-                    'image': encoded_image,
                 }
 
-                response = requests.post(url, data=data, timeout=timeout)
+                # imgbb takes the image as a binary file, so it's streamed from disk instead of base64 encoded
+                with open(image, "rb") as img_file:
+                    files = {'image': (os.path.basename(image), img_file)}
+                    response = await image_host_session(img_host).post(url, data=data, files=files, timeout=timeout)
                 response_data = response.json()
                 if response.status_code != 200 or not response_data.get('success'):
                     console.print("[yellow]imgbb failed, trying next image host")
@@ -106,7 +166,7 @@ def upload_image_task(args):
 
                 return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url}
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 console.print("[red]Request timed out. The server took too long to respond.")
                 return {'status': 'failed', 'reason': 'Request timed out'}
 
@@ -114,22 +174,15 @@ def upload_image_task(args):
                 console.print(f"[red]Invalid JSON response: {e}")
                 return {'status': 'failed', 'reason': 'Invalid JSON response'}
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 console.print(f"[red]Request failed with error: {e}")
                 return {'status': 'failed', 'reason': str(e)}
 
         elif img_host == "dalexni":
             url = "https://dalexni.com/1/upload"
             try:
-                with open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(img_file.read()).decode('utf8')
-
-                data = {
-                    'key': config['DEFAULT']['dalexni_api'],
-                    'image': encoded_image,
-                }
-
-                response = requests.post(url, data=data, timeout=timeout)
+                headers, content = base64_form(image, 'image', {'key': config['DEFAULT']['dalexni_api']})
+                response = await image_host_session(img_host).post(url, headers=headers, content=content, timeout=timeout)
                 response_data = response.json()
                 if response.status_code != 200 or not response_data.get('success'):
                     console.print("[yellow]DALEXNI failed, trying next image host")
@@ -144,7 +197,7 @@ def upload_image_task(args):
 
                 return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url}
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 console.print("[red]Request timed out. The server took too long to respond.")
                 return {'status': 'failed', 'reason': 'Request timed out'}
 
@@ -152,20 +205,21 @@ def upload_image_task(args):
                 console.print(f"[red]Invalid JSON response: {e}")
                 return {'status': 'failed', 'reason': 'Invalid JSON response'}
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 console.print(f"[red]Request failed with error: {e}")
                 return {'status': 'failed', 'reason': str(e)}
 
         elif img_host == "ptscreens":
             url = "https://ptscreens.com/api/1/upload"
             try:
-                files = {
-                    'source': ('file-upload[0]', open(image, 'rb')),
-                }
                 headers = {
                     'X-API-Key': config['DEFAULT']['ptscreens_api']
                 }
-                response = requests.post(url, headers=headers, files=files, timeout=timeout)
+                with open(image, 'rb') as img_file:
+                    files = {
+                        'source': ('file-upload[0]', img_file),
+                    }
+                    response = await image_host_session(img_host).post(url, headers=headers, files=files, timeout=timeout)
                 response_data = response.json()
                 if response_data.get('status_code') != 200:
                     console.print("[yellow]ptscreens failed, trying next image host")
@@ -177,23 +231,19 @@ def upload_image_task(args):
                 if meta['debug']:
                     console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 console.print("[red]Request timed out. The server took too long to respond.")
                 return {'status': 'failed', 'reason': 'Request timed out'}
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 console.print(f"[red]Request failed with error: {e}")
                 return {'status': 'failed', 'reason': str(e)}
 
         elif img_host == "onlyimage":
             url = "https://onlyimage.org/api/1/upload"
             try:
-                data = {
-                    'image': base64.b64encode(open(image, "rb").read()).decode('utf8')
-                }
-                headers = {
-                    'X-API-Key': config['DEFAULT']['onlyimage_api'],
-                }
-                response = requests.post(url, data=data, headers=headers, timeout=timeout)
+                headers, content = base64_form(image, 'image')
+                headers['X-API-Key'] = config['DEFAULT']['onlyimage_api']
+                response = await image_host_session(img_host).post(url, headers=headers, content=content, timeout=timeout)
                 response_data = response.json()
                 if response.status_code != 200 or not response_data.get('success'):
                     console.print("[yellow]OnlyImage failed, trying next image host")
@@ -205,10 +255,10 @@ def upload_image_task(args):
                 if meta['debug']:
                     console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 console.print("[red]Request timed out. The server took too long to respond.")
                 return {'status': 'failed', 'reason': 'Request timed out'}
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 console.print(f"[red]Request failed with error: {e}")
                 return {'status': 'failed', 'reason': str(e)}
 
@@ -217,12 +267,13 @@ def upload_image_task(args):
             try:
                 data = {
                     'content_type': '0',
-                    'max_th_size': 350
-                }
-                files = {
-                    'img': ('file-upload[0]', open(image, 'rb'))
+                    'max_th_size': '350'
                 }
-                response = requests.post(url, data=data, files=files, timeout=timeout)
+                with open(image, 'rb') as img_file:
+                    files = {
+                        'img': ('file-upload[0]', img_file)
+                    }
+                    response = await image_host_session(img_host).post(url, data=data, files=files, timeout=timeout)
 
                 if response.status_code != 200:
                     console.print(f"[yellow]pixhost failed with status code {response.status_code}, trying next image host")
@@ -245,23 +296,19 @@ def upload_image_task(args):
                     console.print(f"[red]Invalid JSON response from pixhost: {e}")
                     return {'status': 'failed', 'reason': 'Invalid JSON response'}
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 console.print("[red]Request to pixhost timed out. The server took too long to respond.")
                 return {'status': 'failed', 'reason': 'Request timed out'}
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 console.print(f"[red]pixhost request failed with error: {e}")
                 return {'status': 'failed', 'reason': str(e)}
 
         elif img_host == "lensdump":
             url = "https://lensdump.com/api/1/upload"
-            data = {
-                'image': base64.b64encode(open(image, "rb").read()).decode('utf8')
-            }
-            headers = {
-                'X-API-Key': config['DEFAULT']['lensdump_api']
-            }
-            response = requests.post(url, data=data, headers=headers, timeout=timeout)
+            headers, content = base64_form(image, 'image')
+            headers['X-API-Key'] = config['DEFAULT']['lensdump_api']
+            response = await image_host_session(img_host).post(url, headers=headers, content=content, timeout=timeout)
             response_data = response.json()
             if response_data.get('status_code') == 200:
                 img_url = response_data['data']['image']['url']
@@ -283,7 +330,7 @@ def upload_image_task(args):
                         'Authorization': f'{api_key}',
                     }
 
-                    response = requests.post(url, files=files, headers=headers, timeout=timeout)
+                    response = await image_host_session(img_host, url).post(url, files=files, headers=headers, timeout=timeout)
                     if response.status_code == 200:
                         response_data = response.json()
                         if 'files' in response_data:
@@ -301,7 +348,7 @@ def upload_image_task(args):
 
                     else:
                         return {'status': 'failed', 'reason': f"Zipline upload failed: {response.text}"}
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 console.print("[red]Request timed out. The server took too long to respond.")
                 return {'status': 'failed', 'reason': 'Request timed out'}
 
@@ -309,7 +356,7 @@ def upload_image_task(args):
                 console.print(f"[red]Invalid JSON response: {e}")
                 return {'status': 'failed', 'reason': 'Invalid JSON response'}
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 console.print(f"[red]Request failed with error: {e}")
                 return {'status': 'failed', 'reason': str(e)}
 
@@ -327,7 +374,7 @@ def upload_image_task(args):
 
                 with open(image, 'rb') as img_file:
                     files = {'source': (os.path.basename(image), img_file)}
-                    response = requests.post(url, headers=headers, files=files, timeout=timeout)
+                    response = await image_host_session(img_host).post(url, headers=headers, files=files, timeout=timeout)
 
                 if 'application/json' in response.headers.get('Content-Type', ''):
                     response_data = response.json()
@@ -352,10 +399,10 @@ def upload_image_task(args):
 
                 return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url, 'local_file_path': image}
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 console.print("[red]Request to passtheimage timed out after 60 seconds")
                 return {'status': 'failed', 'reason': 'Request timed out'}
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 console.print(f"[red]Request to passtheimage failed with error: {e}")
                 return {'status': 'failed', 'reason': str(e)}
             except Exception as e:
@@ -383,17 +430,15 @@ def upload_image_task(args):
         }
 
 
-# Global Thread Pool Executor for better thread control
-thread_pool = ThreadPoolExecutor(max_workers=10)
-
-
+@traced()
 async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_img_list, return_dict, retry_mode=False, max_retries=3):
     if 'image_list' not in meta:
         meta['image_list'] = []
     if meta['debug']:
         upload_start_time = time.time()
 
-    os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
+    # Absolute paths only, the working directory is shared with releases prepared at the same time
+    tmp_dir = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}")
     initial_img_host = config['DEFAULT'][f'img_host_{img_host_num}']
     img_host = meta['imghost']
     using_custom_img_list = isinstance(custom_img_list, list) and bool(custom_img_list)
@@ -403,22 +448,22 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
 
     # Handle image selection
     if using_custom_img_list:
-        image_glob = custom_img_list
+        image_glob = [os.path.join(tmp_dir, image) for image in custom_img_list]
         existing_images = []
         existing_count = 0
     else:
         image_patterns = ["*.png", ".[!.]*.png"]
         image_glob = []
         for pattern in image_patterns:
-            image_glob.extend(glob.glob(pattern))
+            image_glob.extend(glob.glob(os.path.join(tmp_dir, pattern)))
 
         unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
         unwanted_files = set()
         for pattern in unwanted_patterns:
-            unwanted_files.update(glob.glob(pattern))
+            unwanted_files.update(glob.glob(os.path.join(tmp_dir, pattern)))
             if pattern.startswith("FILE") or pattern.startswith("PLAYLIST") or pattern.startswith("POSTER"):
                 hidden_pattern = "." + pattern
-                unwanted_files.update(glob.glob(hidden_pattern))
+                unwanted_files.update(glob.glob(os.path.join(tmp_dir, hidden_pattern)))
 
         image_glob = [file for file in image_glob if file not in unwanted_files]
         image_glob = list(set(image_glob))
@@ -449,11 +494,7 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
     ]
 
     # Concurrency Control
-    default_pool_size = len(upload_tasks)
-    host_limits = {"onlyimage": 6, "ptscreens": 1, "lensdump": 1, "passtheimage": 6}
-    pool_size = host_limits.get(img_host, default_pool_size)
-    max_workers = min(len(upload_tasks), pool_size)
-    semaphore = asyncio.Semaphore(max_workers)
+    semaphore = host_semaphore(img_host)
 
     # Track running tasks for cancellation
     running_tasks = set()
@@ -463,11 +504,16 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
         index, *task_args = task
         retry_count = 0
 
+        # Identical bytes already uploaded to this host (earlier tracker, retry or re-run) are reused as is
+        cached_result = await lookup_image(task_args[0], task_args[1], meta)
+        if cached_result is not None:
+            return (index, cached_result)
+
         async with semaphore:
             while retry_count <= max_retries:
                 future = None
                 try:
-                    future = asyncio.create_task(asyncio.to_thread(upload_image_task, task_args))
+                    future = asyncio.create_task(upload_image_task(task_args))
                     running_tasks.add(future)
 
                     try:
@@ -475,6 +521,7 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
                         running_tasks.discard(future)
 
                         if result.get('status') == 'success':
+                            await remember_image(task_args[0], task_args[1], result)
                             return (index, result)
                         else:
                             reason = result.get('reason', 'Unknown error')
@@ -581,13 +628,12 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
 
     finally:
         # Cleanup
-        thread_pool.shutdown(wait=True)
         gc.collect()
 
 
-async def imgbox_upload(chdir, image_glob, meta, return_dict):
+async def imgbox_upload(image_glob, meta, return_dict):
+    import pyimgbox  # only needed for imgbox, and slow to import
     try:
-        os.chdir(chdir)
         image_list = []
 
         async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
@@ -1,10 +1,10 @@
 import os
-import json
 import re
 import glob
 import cli_ui
 from src.console import console
 from src.exportmi import mi_resolution
+from src.artifacts import get_store
 
 
 async def get_uhd(type, guess, resolution, path):
@@ -172,53 +172,52 @@ async def get_video(videoloc, mode):
 
 async def get_resolution(guess, folder_id, base_dir):
     hfr = False
-    with open(f'{base_dir}/tmp/{folder_id}/MediaInfo.json', 'r', encoding='utf-8') as f:
-        mi = json.load(f)
-        try:
-            width = mi['media']['track'][1]['Width']
-            height = mi['media']['track'][1]['Height']
-        except Exception:
-            width = 0
-            height = 0
-
-        framerate = mi['media']['track'][1].get('FrameRate')
-        if not framerate or framerate == '0':
-            framerate = mi['media']['track'][1].get('FrameRate_Original')
-        if not framerate or framerate == '0':
-            framerate = mi['media']['track'][1].get('FrameRate_Num')
-        if framerate:
-            try:
-                if int(float(framerate)) > 30:
-                    hfr = True
-            except Exception:
-                hfr = False
-        else:
-            framerate = "24.000"
+    mi = get_store(base_dir, folder_id).read_json("MediaInfo.json")
+    try:
+        width = mi['media']['track'][1]['Width']
+        height = mi['media']['track'][1]['Height']
+    except Exception:
+        width = 0
+        height = 0
 
+    framerate = mi['media']['track'][1].get('FrameRate')
+    if not framerate or framerate == '0':
+        framerate = mi['media']['track'][1].get('FrameRate_Original')
+    if not framerate or framerate == '0':
+        framerate = mi['media']['track'][1].get('FrameRate_Num')
+    if framerate:
         try:
-            scan = mi['media']['track'][1]['ScanType']
+            if int(float(framerate)) > 30:
+                hfr = True
         except Exception:
-            scan = "Progressive"
-        if scan == "Progressive":
-            scan = "p"
-        elif scan == "Interlaced":
-            scan = 'i'
-        elif framerate == "25.000":
-            scan = "p"
+            hfr = False
+    else:
+        framerate = "24.000"
+
+    try:
+        scan = mi['media']['track'][1]['ScanType']
+    except Exception:
+        scan = "Progressive"
+    if scan == "Progressive":
+        scan = "p"
+    elif scan == "Interlaced":
+        scan = 'i'
+    elif framerate == "25.000":
+        scan = "p"
+    else:
+        # Fallback using regex on meta['uuid'] - mainly for HUNO fun and games.
+        match = re.search(r'\b(1080p|720p|2160p|576p|480p)\b', folder_id, re.IGNORECASE)
+        if match:
+            scan = "p"  # Assume progressive based on common resolution markers
         else:
-            # Fallback using regex on meta['uuid'] - mainly for HUNO fun and games.
-            match = re.search(r'\b(1080p|720p|2160p|576p|480p)\b', folder_id, re.IGNORECASE)
-            if match:
-                scan = "p"  # Assume progressive based on common resolution markers
-            else:
-                scan = "i"  # Default to interlaced if no indicators are found
-        width_list = [3840, 2560, 1920, 1280, 1024, 854, 720, 15360, 7680, 0]
-        height_list = [2160, 1440, 1080, 720, 576, 540, 480, 8640, 4320, 0]
-        width = await closest(width_list, int(width))
-        actual_height = int(height)
-        height = await closest(height_list, int(height))
-        res = f"{width}x{height}{scan}"
-        resolution = await mi_resolution(res, guess, width, scan, height, actual_height)
+            scan = "i"  # Default to interlaced if no indicators are found
+    width_list = [3840, 2560, 1920, 1280, 1024, 854, 720, 15360, 7680, 0]
+    height_list = [2160, 1440, 1080, 720, 576, 540, 480, 8640, 4320, 0]
+    width = await closest(width_list, int(width))
+    actual_height = int(height)
+    height = await closest(height_list, int(height))
+    res = f"{width}x{height}{scan}"
+    resolution = await mi_resolution(res, guess, width, scan, height, actual_height)
     return resolution, hfr
 
 
@@ -0,0 +1,181 @@
+import asyncio
+import os
+import time
+
+from src.cleanup import set_daemon_active
+from src.console import console
+from src.queuemanage import get_log_file, load_processed_files, queue_extensions, save_processed_file, should_include_directory
+
+try:
+    from inotify_simple import INotify, flags
+    inotify_available = True
+except ImportError:
+    inotify_available = False
+
+# Files of downloads that are still running
+partial_suffixes = ('.part', '.!qb', '.!ut', '.crdownload', '.tmp')
+
+
+def release_signature(path):
+    """(total size, newest mtime, file count) of a file or release folder, None while it is still downloading."""
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime, 1
+    size = newest = count = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            if name.lower().endswith(partial_suffixes):
+                return None
+            stat = os.stat(os.path.join(root, name))
+            size += stat.st_size
+            newest = max(newest, stat.st_mtime)
+            count += 1
+    return size, newest, count
+
+
+class Watcher:
+    """
+    Picks up new releases from the watch folders: each first-level file or folder, filtered like a queue,
+    is handed to run_job once its size and mtime have stopped changing for watch_stable_seconds.
+    Only the top level of each folder is listed on a scan, releases already processed are never walked again.
+    """
+
+    def __init__(self, config, folders, log_file, processed, run_job, debug=False):
+        self.folders = folders
+        self.log_file = log_file
+        self.processed = processed
+        self.run_job = run_job
+        self.debug = debug
+        self.stable_seconds = float(config['DEFAULT'].get('watch_stable_seconds', 60))
+        self.poll_interval = float(config['DEFAULT'].get('watch_poll_interval', 30))
+        self.backlog = asyncio.Queue(maxsize=max(1, int(config['DEFAULT'].get('watch_backlog', 50))))
+        self.pending = {}  # path: (signature, first seen with that signature)
+        self.queued = set()
+        self.rejected = set()
+        self.wakeup = asyncio.Event()
+
+    async def candidates(self):
+        for folder in self.folders:
+            try:
+                entries = list(os.scandir(folder))
+            except OSError as e:
+                console.print(f"[yellow]Could not scan watch folder {folder}: {e}")
+                continue
+            for entry in entries:
+                path = entry.path
+                if path in self.processed or path in self.queued or path in self.rejected:
+                    continue
+                try:
+                    if entry.is_dir():
+                        # Folders that don't hold video yet may still be filling up
+                        if await should_include_directory(path, queue_extensions):
+                            yield path
+                    elif entry.is_file():
+                        if entry.name.lower().endswith(queue_extensions):
+                            yield path
+                        else:
+                            self.rejected.add(path)
+                except OSError:
+                    continue
+
+    async def scan(self):
+        now = time.time()
+        seen = set()
+        async for path in self.candidates():
+            seen.add(path)
+            try:
+                signature = await asyncio.to_thread(release_signature, path)
+            except OSError:
+                continue
+            previous = self.pending.get(path)
+            if signature is None or previous is None or previous[0] != signature:
+                self.pending[path] = (signature, now)
+                continue
+            if now - previous[1] < self.stable_seconds or now - signature[1] < self.stable_seconds:
+                continue
+            if self.backlog.full():
+                # Stays pending and is queued on a later scan
+                continue
+            del self.pending[path]
+            self.queued.add(path)
+            await self.backlog.put(path)
+            console.print(f"[green]Watch: queued {os.path.basename(path)} ({self.backlog.qsize()} waiting)")
+        for path in set(self.pending) - seen:
+            del self.pending[path]
+
+    async def scanner(self):
+        while True:
+            await self.scan()
+            self.wakeup.clear()
+            # New entries wake the scanner right away, stability is still checked on the next scans
+            interval = min(self.poll_interval, self.stable_seconds) if self.pending else self.poll_interval
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def worker(self):
+        while True:
+            path = await self.backlog.get()
+            try:
+                await self.run_job(path)
+            except SystemExit:
+                pass
+            except Exception as e:
+                console.print(f"[red]Watch: {os.path.basename(path)} failed: {e}")
+            self.queued.discard(path)
+            self.processed.add(path)
+            # Like queues, debug runs aren't written to the processed log, so they run again after a restart
+            if not self.debug:
+                await save_processed_file(self.log_file, path)
+
+    def watch_events(self):
+        """Wake the scanner on inotify events in the watch folders, returns a function that stops watching."""
+        if not inotify_available:
+            return lambda: None
+        inotify = INotify()
+        mask = flags.CREATE | flags.MOVED_TO | flags.CLOSE_WRITE | flags.DELETE | flags.MOVED_FROM
+        for folder in self.folders:
+            try:
+                inotify.add_watch(folder, mask)
+            except OSError as e:
+                console.print(f"[yellow]Could not watch {folder} with inotify, it is still polled: {e}")
+        loop = asyncio.get_running_loop()
+
+        def on_events():
+            inotify.read(timeout=0)
+            self.wakeup.set()
+
+        loop.add_reader(inotify.fileno(), on_events)
+
+        def stop():
+            loop.remove_reader(inotify.fileno())
+            inotify.close()
+        return stop
+
+    async def run(self):
+        stop_events = self.watch_events()
+        mode = "inotify" if inotify_available else f"polling every {self.poll_interval:.0f}s"
+        console.print(f"[green]Watching {', '.join(self.folders)} ({mode}, releases stable for {self.stable_seconds:.0f}s are uploaded)")
+        set_daemon_active(True)
+        try:
+            await asyncio.gather(self.scanner(), self.worker())
+        finally:
+            set_daemon_active(False)
+            stop_events()
+
+
+async def run_watch(config, base_dir, run_job, debug=False):
+    """Watch the folders in watch_folders and run every new release through run_job(path)."""
+    folders = config['DEFAULT'].get('watch_folders', [])
+    if isinstance(folders, str):
+        folders = [folder.strip() for folder in folders.split(',')]
+    folders = [os.path.abspath(folder) for folder in folders if folder]
+    missing = [folder for folder in folders if not os.path.isdir(folder)]
+    if not folders or missing:
+        console.print(f"[red]Set watch_folders in your config to existing folders to use --watch (missing: {', '.join(missing) or 'none set'})")
+        return
+    log_file = await get_log_file(base_dir, "watch")
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    processed = await load_processed_files(log_file)
+    await Watcher(config, folders, log_file, processed, run_job, debug).run()
@@ -0,0 +1,11 @@
+import importlib.util
+import os
+import sys
+
+# Modules read data/config.py at import time, which is the user's own config and isn't part of the repo.
+# Tests run against the example config instead.
+_example = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "example-config.py")
+_spec = importlib.util.spec_from_file_location("data.config", _example)
+_config = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_config)
+sys.modules["data.config"] = _config
@@ -0,0 +1,143 @@
+import asyncio
+import unittest
+
+from src.lookupgraph import Lookup, resolve
+
+
+class ResolveTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_lookups_after_their_needs(self):
+        order = []
+
+        def record(name, delay=0):
+            async def run():
+                await asyncio.sleep(delay)
+                order.append(name)
+            return run
+
+        await resolve([
+            Lookup('c', record('c'), needs=['a', 'b']),
+            Lookup('a', record('a', 0.02)),
+            Lookup('b', record('b')),
+            Lookup('d', record('d'), needs=['c']),
+        ])
+        self.assertEqual(order, ['b', 'a', 'c', 'd'])
+
+    async def test_independent_lookups_run_at_the_same_time(self):
+        running = []
+        overlap = []
+
+        def track(name):
+            async def run():
+                running.append(name)
+                overlap.append(len(running))
+                await asyncio.sleep(0.01)
+                running.remove(name)
+            return run
+
+        await resolve([Lookup('a', track('a')), Lookup('b', track('b'))])
+        self.assertEqual(max(overlap), 2)
+
+    async def test_when_skips_lookup_but_not_its_dependents(self):
+        ran = []
+
+        async def skipped():
+            ran.append('skipped')
+
+        async def after():
+            ran.append('after')
+
+        await resolve([
+            Lookup('skipped', skipped, when=lambda: False),
+            Lookup('after', after, needs=['skipped']),
+        ])
+        self.assertEqual(ran, ['after'])
+
+    async def test_answered_skips_lookup_before_it_starts(self):
+        ran = []
+
+        async def lookup():
+            ran.append('lookup')
+
+        await resolve([Lookup('lookup', lookup, answered=lambda: True)])
+        self.assertEqual(ran, [])
+
+    async def test_answered_cancels_running_lookup(self):
+        meta = {}
+        slow_cancelled = asyncio.Event()
+
+        async def fast():
+            meta['title'] = 'fast'
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+                meta['title'] = 'slow'
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        async def after():
+            meta['after'] = meta['title']
+
+        await resolve([
+            Lookup('slow', slow, answered=lambda: 'title' in meta),
+            Lookup('fast', fast),
+            Lookup('after', after, needs=['slow', 'fast']),
+        ])
+        self.assertTrue(slow_cancelled.is_set())
+        self.assertEqual(meta, {'title': 'fast', 'after': 'fast'})
+
+    async def test_interactive_lookups_never_overlap(self):
+        running = []
+        overlap = []
+
+        def prompt(name):
+            async def run():
+                running.append(name)
+                overlap.append(len(running))
+                await asyncio.sleep(0.01)
+                running.remove(name)
+            return run
+
+        await resolve([Lookup(name, prompt(name), interactive=True) for name in ('a', 'b', 'c')])
+        self.assertEqual(max(overlap), 1)
+
+        overlap.clear()
+        await resolve([Lookup(name, prompt(name), interactive=True) for name in ('a', 'b', 'c')], unattended=True)
+        self.assertEqual(max(overlap), 3)
+
+    async def test_failed_lookup_cancels_the_rest(self):
+        cancelled = asyncio.Event()
+
+        async def fails():
+            raise RuntimeError("lookup failed")
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with self.assertRaises(RuntimeError):
+            await resolve([Lookup('fails', fails), Lookup('slow', slow)])
+        self.assertTrue(cancelled.is_set())
+
+    async def test_unknown_need_raises(self):
+        async def lookup():
+            pass
+
+        with self.assertRaisesRegex(ValueError, "unknown lookups: missing"):
+            await resolve([Lookup('lookup', lookup, needs=['missing'])])
+
+    async def test_unsatisfiable_needs_raise(self):
+        async def lookup():
+            pass
+
+        with self.assertRaisesRegex(ValueError, "can never run: a, b"):
+            await resolve([Lookup('a', lookup, needs=['b']), Lookup('b', lookup, needs=['a'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from torf import Torrent
+
+from src import piececache
+from src.piececache import PieceHashCache, generate_pieces, remember_pieces
+
+piece_size = 32768
+
+
+class GeneratePiecesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.content = os.path.join(self.tmp.name, "Release")
+        os.makedirs(self.content)
+        self.cache = PieceHashCache(os.path.join(self.tmp.name, "cache", "pieces.sqlite"), 10 * 1024 * 1024)
+        self.addCleanup(self.cache.db.close)
+        patcher = mock.patch.object(piececache, 'get_cache', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.random = random.Random(0)
+
+    def write(self, name, size):
+        with open(os.path.join(self.content, name), 'wb') as f:
+            f.write(self.random.randbytes(size))
+
+    def torf_pieces(self):
+        torrent = Torrent(path=self.content, piece_size=piece_size)
+        torrent.generate(threads=2)
+        return torrent.metainfo['info']['pieces']
+
+    def cached_pieces(self):
+        torrent = Torrent(path=self.content, piece_size=piece_size)
+        if not generate_pieces(torrent, threads=2):
+            torrent.generate(threads=2)
+            remember_pieces(torrent)
+        return torrent.metainfo['info']['pieces']
+
+    def test_matches_torf_for_unaligned_files(self):
+        # Only the first file starts on a piece boundary, the rest start partway into pieces
+        for name, size in [("a.mkv", piece_size * 3 + 1000), ("b.mkv", piece_size * 5 + 7), ("c.nfo", 300), ("d.mkv", piece_size * 2 - 5)]:
+            self.write(name, size)
+        expected = self.torf_pieces()
+
+        self.assertEqual(self.cached_pieces(), expected)
+        for filepath, offset, size in piececache.file_layout(Torrent(path=self.content, piece_size=piece_size).filepaths):
+            phase = offset % piece_size
+            if piececache.inner_pieces(size, piece_size, phase):
+                self.assertIsNotNone(self.cache.get(str(filepath), piece_size, phase))
+
+        # Everything inside a file now comes from the cache
+        with mock.patch.object(piececache, 'hash_span', wraps=piececache.hash_span) as hash_span:
+            self.assertEqual(self.cached_pieces(), expected)
+        hashed = sum(stop - start for _, _, start, stop in (call.args for call in hash_span.call_args_list))
+        self.assertLess(hashed, 6)
+
+    def test_changed_file_is_rehashed(self):
+        for name, size in [("a.mkv", piece_size * 4 + 123), ("b.mkv", piece_size * 6 + 99), ("c.mkv", piece_size * 3)]:
+            self.write(name, size)
+        self.cached_pieces()
+
+        self.write("b.mkv", piece_size * 6 + 99)
+        self.assertEqual(self.cached_pieces(), self.torf_pieces())
+
+    def test_file_moved_to_another_phase(self):
+        self.write("b.mkv", piece_size * 4 + 321)
+        self.write("c.mkv", piece_size * 2 + 17)
+        self.cached_pieces()
+
+        # A new first file shifts the cached files to a different position inside their pieces
+        self.write("a.mkv", piece_size + 4000)
+        self.assertEqual(self.cached_pieces(), self.torf_pieces())
+
+
+if __name__ == '__main__':
+    unittest.main()
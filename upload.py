@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 from src.args import Args
-from src.clients import Clients
 from src.uploadscreens import upload_screens
 import json
 from pathlib import Path
@@ -15,21 +14,21 @@ import time
 import gc
 import re
 import requests
-import discord
 from packaging import version
 from src.trackersetup import tracker_class_map, api_trackers, other_api_trackers, http_trackers
 from src.trackerhandle import process_trackers
-from src.queuemanage import handle_queue
+from src.queuemanage import handle_queue, save_processed_file
 from src.console import console
 from src.torrentcreate import create_torrent, create_random_torrents, create_base_from_existing_torrent
 from src.uphelper import UploadHelper
 from src.trackerstatus import process_all_trackers
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
-from src.cleanup import cleanup, reset_terminal
+from src.cleanup import cleanup, reset_terminal, set_pipeline_active
+from src.httpsessions import close_sessions
+from src.profiling import start_job, job_context, finish_job
 from src.add_comparison import add_comparison
 from src.get_name import get_name
 from src.get_desc import gen_desc
-from discordbot import send_discord_notification, send_upload_status_notification
 from cogs.redaction import clean_meta_for_export
 from src.languages import process_desc_language
 from bin.get_mkbrr import ensure_mkbrr_binary
@@ -50,15 +49,23 @@ except Exception:
     else:
         console.print(traceback.print_exc())
 
-from src.prep import Prep  # noqa E402
-client = Clients(config=config)
 parser = Args(config)
+_client = None
 use_discord = False
 discord_config = config.get('DISCORD')
 if discord_config:
     use_discord = discord_config.get('use_discord', False)
 
 
+def get_client():
+    """The torrent client wrapper, created on first use so --help and early exits skip the client libraries."""
+    global _client
+    if _client is None:
+        from src.clients import Clients
+        _client = Clients(config=config)
+    return _client
+
+
 async def merge_meta(meta, saved_meta, path):
     """Merges saved metadata with the current meta, respecting overwrite rules."""
     with open(f"{base_dir}/tmp/{os.path.basename(path)}/meta.json") as f:
@@ -121,9 +128,10 @@ def update_oeimg_to_onlyimage():
         console.print("[yellow]No 'oeimg' or 'oeimg_api' found to update in config.py[/yellow]")
 
 
-async def process_meta(meta, base_dir, bot=None):
+async def process_meta(meta, base_dir, bot=None, finalize=True):
     """Process the metadata for each queued path."""
     if use_discord and bot:
+        from discordbot import send_discord_notification
         await send_discord_notification(config, bot, f"Starting upload process for: {meta['path']}", debug=meta.get('debug', False), meta=meta)
 
     if meta['imghost'] is None:
@@ -147,6 +155,8 @@ async def process_meta(meta, base_dir, bot=None):
             meta['unattended'] = True
             console.print("[yellow]Running in Auto Mode")
     meta['base_dir'] = base_dir
+    start_job(meta)
+    from src.prep import Prep
     prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
     try:
         meta = await prep.gather_prep(meta=meta, mode='cli')
@@ -401,30 +411,36 @@ async def process_meta(meta, base_dir, bot=None):
             except asyncio.CancelledError:
                 pass
 
-        torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
-        if not os.path.exists(torrent_path):
-            reuse_torrent = None
-            if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
-                reuse_torrent = await client.find_existing_torrent(meta)
-                if reuse_torrent is not None:
-                    await create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+        if finalize:
+            await finalize_meta(meta)
+
+
+async def finalize_meta(meta):
+    """Create (or reuse) the BASE torrent and build the description for an item that is going to be uploaded."""
+    torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
+    if not os.path.exists(torrent_path):
+        reuse_torrent = None
+        if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
+            reuse_torrent = await get_client().find_existing_torrent(meta)
+            if reuse_torrent is not None:
+                await create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
 
-            if meta['nohash'] is False and reuse_torrent is None:
-                create_torrent(meta, Path(meta['path']), "BASE")
-            if meta['nohash']:
-                meta['client'] = "none"
+        if meta['nohash'] is False and reuse_torrent is None:
+            await asyncio.to_thread(create_torrent, meta, Path(meta['path']), "BASE")
+        if meta['nohash']:
+            meta['client'] = "none"
 
-        elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
-            create_torrent(meta, Path(meta['path']), "BASE")
+    elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
+        await asyncio.to_thread(create_torrent, meta, Path(meta['path']), "BASE")
 
-        if int(meta.get('randomized', 0)) >= 1:
-            if not meta['mkbrr']:
-                create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+    if int(meta.get('randomized', 0)) >= 1:
+        if not meta['mkbrr']:
+            create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
 
-        meta = await gen_desc(meta)
+    meta = await gen_desc(meta)
 
-        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-            json.dump(meta, f, indent=4)
+    with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
+        json.dump(meta, f, indent=4)
 
 
 async def cleanup_screenshot_temp_files(meta):
@@ -460,26 +476,6 @@ async def load_processed_files(log_file):
     return set()
 
 
-async def save_processed_file(log_file, file_path):
-    """
-    Adds a processed file to the log, deduplicating and always appending to the end.
-    """
-    if os.path.exists(log_file):
-        with open(log_file, "r") as f:
-            try:
-                processed_files = json.load(f)
-            except Exception:
-                processed_files = []
-    else:
-        processed_files = []
-
-    processed_files = [entry for entry in processed_files if entry != file_path]
-    processed_files.append(file_path)
-
-    with open(log_file, "w") as f:
-        json.dump(processed_files, f, indent=4)
-
-
 def get_local_version(version_file):
     """Extracts the local version from the version.py file."""
     try:
@@ -559,29 +555,255 @@ async def update_notification(base_dir):
     return local_version
 
 
-async def do_the_thing(base_dir):
+async def prepare_queue_meta(path, base_meta, base_dir):
+    """Build a fresh meta for one queued path, clearing or merging any cached tmp data."""
+    meta = base_meta.copy()
+    meta['path'] = path
+    meta['uuid'] = None
+
+    if not path:
+        raise ValueError("The 'path' variable is not defined or is empty.")
+
+    tmp_path = os.path.join(base_dir, "tmp", os.path.basename(path))
+
+    if meta.get('delete_tmp', False) and os.path.exists(tmp_path):
+        try:
+            shutil.rmtree(tmp_path)
+            os.makedirs(tmp_path, exist_ok=True)
+            console.print(f"[bold green]Successfully cleaned temp directory for {os.path.basename(path)}")
+        except Exception as e:
+            console.print(f"[bold red]Failed to delete temp directory: {str(e)}")
+
+    meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
+
+    keep_meta = config['DEFAULT'].get('keep_meta', False)
+
+    if not keep_meta or meta.get('delete_meta', False):
+        if os.path.exists(meta_file):
+            try:
+                os.remove(meta_file)
+                if meta['debug']:
+                    console.print(f"[bold yellow]Found and deleted existing metadata file: {meta_file}")
+            except Exception as e:
+                console.print(f"[bold red]Failed to delete metadata file {meta_file}: {str(e)}")
+        else:
+            if meta['debug']:
+                console.print(f"[yellow]No metadata file found at {meta_file}")
+
+    if keep_meta and os.path.exists(meta_file):
+        with open(meta_file, "r") as f:
+            saved_meta = json.load(f)
+            console.print("[yellow]Existing metadata file found, it holds cached values")
+            meta.update(await merge_meta(meta, saved_meta, path))
+
+    return meta
+
+
+async def start_discord_bot():
+    """Log in the discord bot and wait for it to be ready, returns (bot, connect_task)."""
+    import discord
+    bot = None
+    connect_task = None
+    try:
+        console.print("[cyan]Starting Discord bot initialization...")
+        intents = discord.Intents.default()
+        intents.message_content = True
+        bot = discord.Client(intents=intents)
+        token = config['DISCORD']['discord_bot_token']
+        await asyncio.wait_for(bot.login(token), timeout=10)
+        connect_task = asyncio.create_task(bot.connect())
+
+        try:
+            await asyncio.wait_for(bot.wait_until_ready(), timeout=20)
+            console.print("[green]Discord Bot is ready!")
+        except asyncio.TimeoutError:
+            console.print("[bold red]Bot failed to connect within timeout period.")
+            console.print("[yellow]Continuing without Discord integration...")
+            connect_task.cancel()
+            connect_task = None
+    except discord.LoginFailure:
+        console.print("[bold red]Discord bot token is invalid. Please check your configuration.")
+    except discord.ClientException as e:
+        console.print(f"[bold red]Discord client exception: {e}")
+    except Exception as e:
+        console.print(f"[bold red]Unexpected error during Discord bot initialization: {e}")
+    return bot, connect_task
+
+
+async def use_pipeline(meta, queue):
+    """Pipelined queue processing is opt-in and only safe when nothing will prompt."""
+    if not (meta.get('pipeline') or config['DEFAULT'].get('pipeline_queue', False)):
+        return False
+    if len(queue) < 2:
+        return False
+    unattended = meta.get('unattended') or str(config['DEFAULT'].get('auto_mode', False)).lower() == "true"
+    if not unattended or meta.get('unattended-confirm', False):
+        console.print("[yellow]Pipelined queue processing requires unattended mode, processing the queue one item at a time.")
+        return False
+    return True
+
+
+async def process_queue_pipelined(queue, base_meta, log_file, base_dir, bot=None):
+    """
+    Process a queue in overlapping stages so the network bound tracker uploads of one item
+    run while the next items are being prepped (mediainfo, metadata, screenshots) and hashed.
+    """
+    prep_workers = max(1, int(config['DEFAULT'].get('pipeline_prep_workers', 1)))
+    hash_workers = max(1, int(config['DEFAULT'].get('pipeline_hash_workers', 1)))
+    upload_workers = max(1, int(config['DEFAULT'].get('pipeline_upload_workers', 1)))
+    limit_queue = int(base_meta.get('limit_queue') or 0)
+    sanitize_meta = config['DEFAULT'].get('sanitize_meta', True)
+    total_files = len(queue)
+
+    path_queue = asyncio.Queue()
+    for path in queue:
+        path_queue.put_nowait(path)
+    # Bounded so prep can't run arbitrarily far ahead of uploading
+    hash_queue = asyncio.Queue(maxsize=hash_workers)
+    upload_queue = asyncio.Queue(maxsize=upload_workers)
+    limit_reached = asyncio.Event()
+    counts = {'processed': 0, 'skipped': 0}
+
+    async def record_processed(path, skipped):
+        counts['processed'] += 1
+        if skipped:
+            counts['skipped'] += 1
+            console.print(f"[cyan]Processed {counts['processed']}/{total_files} files with {counts['skipped']} skipped uploading.")
+        elif limit_queue > 0:
+            console.print(f"[cyan]Successfully uploaded {counts['processed'] - counts['skipped']} of {limit_queue} in limit with {total_files} files.")
+        else:
+            console.print(f"[cyan]Successfully uploaded {counts['processed'] - counts['skipped']}/{total_files} files.")
+        if log_file and not base_meta.get('debug'):
+            await save_processed_file(log_file, path)
+
+    async def prep_worker():
+        while not limit_reached.is_set():
+            try:
+                path = path_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            meta = None
+            try:
+                meta = await prepare_queue_meta(path, base_meta, base_dir)
+                console.print(f"[green]Gathering info for {os.path.basename(path)}")
+                await process_meta(meta, base_dir, bot=bot, finalize=False)
+            except Exception as e:
+                console.print(f"[red]Exception: '{path}': {e}")
+                console.print(traceback.format_exc())
+                if meta is not None:
+                    finish_job(meta)
+                continue
+            if 'we_are_uploading' not in meta:
+                console.print(f"[yellow]{os.path.basename(path)}: we are not uploading.......")
+                finish_job(meta)
+                await record_processed(path, skipped=True)
+                continue
+            await hash_queue.put((path, meta))
+
+    async def hash_worker():
+        while True:
+            item = await hash_queue.get()
+            if item is None:
+                return
+            path, meta = item
+            try:
+                with job_context(meta):
+                    await finalize_meta(meta)
+            except Exception as e:
+                console.print(f"[red]Exception creating torrent for '{path}': {e}")
+                console.print(traceback.format_exc())
+                finish_job(meta)
+                continue
+            await upload_queue.put(item)
+
+    async def upload_worker():
+        while True:
+            item = await upload_queue.get()
+            if item is None:
+                return
+            path, meta = item
+            if limit_reached.is_set():
+                finish_job(meta)
+                continue
+            console.print(f"[yellow]Processing uploads to trackers for {meta.get('name', os.path.basename(path))}.....")
+            try:
+                with job_context(meta):
+                    await process_trackers(meta, config, get_client(), console, api_trackers, tracker_class_map, http_trackers, other_api_trackers)
+                if use_discord and bot:
+                    from discordbot import send_discord_notification, send_upload_status_notification
+                    await send_upload_status_notification(config, bot, meta)
+                    await send_discord_notification(config, bot, f"Finsished uploading: {meta['path']}", debug=meta.get('debug', False), meta=meta)
+            except Exception as e:
+                console.print(f"[red]Exception uploading '{path}': {e}")
+                console.print(traceback.format_exc())
+                continue
+            finally:
+                finish_job(meta)
+            await record_processed(path, skipped=False)
+            if limit_queue > 0 and (counts['processed'] - counts['skipped']) >= limit_queue:
+                console.print(f"[red]Uploading limit of {limit_queue} files reached. Stopping queue processing. {counts['skipped']} skipped files.")
+                limit_reached.set()
+            if sanitize_meta:
+                try:
+                    await clean_meta_for_export(meta)
+                except Exception as e:
+                    console.print(f"[red]Error cleaning meta for export: {e}")
+
+    # Per item cleanups would cancel tasks and kill subprocesses belonging to the other stages
+    set_pipeline_active(True)
+    try:
+        prep_tasks = [asyncio.create_task(prep_worker()) for _ in range(prep_workers)]
+        hash_tasks = [asyncio.create_task(hash_worker()) for _ in range(hash_workers)]
+        upload_tasks = [asyncio.create_task(upload_worker()) for _ in range(upload_workers)]
+
+        await asyncio.gather(*prep_tasks)
+        for _ in hash_tasks:
+            await hash_queue.put(None)
+        await asyncio.gather(*hash_tasks)
+        for _ in upload_tasks:
+            await upload_queue.put(None)
+        await asyncio.gather(*upload_tasks)
+    finally:
+        set_pipeline_active(False)
+        await cleanup()
+        gc.collect()
+        reset_terminal()
+
+
+async def do_the_thing(base_dir, argv=None):
+    """Run upload.py for one command line, sys.argv unless the daemon passes a job's arguments."""
     await asyncio.sleep(0.1)  # Ensure it's not racing
+    daemon_job = argv is not None
+    if not daemon_job:
+        argv = sys.argv[1:]
+    else:
+        # Lookups answered for an earlier job of the daemon or watcher are asked again
+        from src.metacache import reset_flights
+        reset_flights()
     bot = None
+    connect_task = None
     meta = dict()
     paths = []
-    for each in sys.argv[1:]:
+    for each in argv:
         if os.path.exists(each):
             paths.append(os.path.abspath(each))
         else:
             break
 
-    meta['current_version'] = await update_notification(base_dir)
-
-    cleanup_only = any(arg in ('--cleanup', '-cleanup') for arg in sys.argv) and len(sys.argv) <= 2
+    cleanup_only = any(arg in ('--cleanup', '-cleanup') for arg in argv) and len(argv) <= 1
 
     try:
         # If cleanup is the only operation, use a dummy path to satisfy the parser
         if cleanup_only:
-            args_list = sys.argv[1:] + ['dummy_path']
+            args_list = argv + ['dummy_path']
             meta, help, before_args = parser.parse(tuple(' '.join(args_list).split(' ')), meta)
             meta['path'] = None  # Clear the dummy path after parsing
         else:
-            meta, help, before_args = parser.parse(tuple(' '.join(sys.argv[1:]).split(' ')), meta)
+            meta, help, before_args = parser.parse(tuple(' '.join(argv).split(' ')), meta)
+
+        # After parsing, so --help doesn't wait on the version check. The daemon and watch mode check once at startup.
+        if not daemon_job:
+            meta['current_version'] = await update_notification(base_dir)
 
         if meta.get('cleanup'):
             if os.path.exists(f"{base_dir}/tmp"):
@@ -611,140 +833,90 @@ async def do_the_thing(base_dir):
         processed_files_count = 0
         skipped_files_count = 0
         base_meta = {k: v for k, v in meta.items()}
-        for path in queue:
-            total_files = len(queue)
-            try:
-                meta = base_meta.copy()
-                meta['path'] = path
-                meta['uuid'] = None
-
-                if not path:
-                    raise ValueError("The 'path' variable is not defined or is empty.")
-
-                tmp_path = os.path.join(base_dir, "tmp", os.path.basename(path))
-
-                if meta.get('delete_tmp', False) and os.path.exists(tmp_path):
-                    try:
-                        shutil.rmtree(tmp_path)
-                        os.makedirs(tmp_path, exist_ok=True)
-                        console.print(f"[bold green]Successfully cleaned temp directory for {os.path.basename(path)}")
-                    except Exception as e:
-                        console.print(f"[bold red]Failed to delete temp directory: {str(e)}")
+        if await use_pipeline(meta, queue):
+            if use_discord and config['DISCORD'].get('discord_bot_token') and not meta['debug']:
+                bot, connect_task = await start_discord_bot()
+            await process_queue_pipelined(queue, base_meta, log_file, base_dir, bot=bot)
+        else:
+            for path in queue:
+                total_files = len(queue)
+                try:
+                    meta = await prepare_queue_meta(path, base_meta, base_dir)
+                except Exception as e:
+                    console.print(f"[red]Exception: '{path}': {e}")
+                    reset_terminal()
+                    continue
 
-                meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
+                sanitize_meta = config['DEFAULT'].get('sanitize_meta', True)
+                if use_discord and config['DISCORD'].get('discord_bot_token') and not meta['debug']:
+                    if (config.get('DISCORD', {}).get('only_unattended', False) and meta.get('unattended', False)) or not config.get('DISCORD', {}).get('only_unattended', False):
+                        bot, connect_task = await start_discord_bot()
 
-                keep_meta = config['DEFAULT'].get('keep_meta', False)
+                if meta['debug']:
+                    start_time = time.time()
 
-                if not keep_meta or meta.get('delete_meta', False):
-                    if os.path.exists(meta_file):
-                        try:
-                            os.remove(meta_file)
-                            if meta['debug']:
-                                console.print(f"[bold yellow]Found and deleted existing metadata file: {meta_file}")
-                        except Exception as e:
-                            console.print(f"[bold red]Failed to delete metadata file {meta_file}: {str(e)}")
-                    else:
-                        if meta['debug']:
-                            console.print(f"[yellow]No metadata file found at {meta_file}")
+                console.print(f"[green]Gathering info for {os.path.basename(path)}")
 
-                if keep_meta and os.path.exists(meta_file):
-                    with open(meta_file, "r") as f:
-                        saved_meta = json.load(f)
-                        console.print("[yellow]Existing metadata file found, it holds cached values")
-                        meta.update(await merge_meta(meta, saved_meta, path))
+                await process_meta(meta, base_dir, bot=bot)
 
-            except Exception as e:
-                console.print(f"[red]Exception: '{path}': {e}")
-                reset_terminal()
+                if 'we_are_uploading' not in meta:
+                    console.print("we are not uploading.......")
+                    if 'queue' in meta and meta.get('queue') is not None:
+                        processed_files_count += 1
+                        skipped_files_count += 1
+                        console.print(f"[cyan]Processed {processed_files_count}/{total_files} files with {skipped_files_count} skipped uploading.")
+                        if not meta['debug']:
+                            if log_file:
+                                await save_processed_file(log_file, path)
 
-            sanitize_meta = config['DEFAULT'].get('sanitize_meta', True)
-            if use_discord and config['DISCORD'].get('discord_bot_token') and not meta['debug']:
-                if (config.get('DISCORD', {}).get('only_unattended', False) and meta.get('unattended', False)) or not config.get('DISCORD', {}).get('only_unattended', False):
-                    try:
-                        console.print("[cyan]Starting Discord bot initialization...")
-                        intents = discord.Intents.default()
-                        intents.message_content = True
-                        bot = discord.Client(intents=intents)
-                        token = config['DISCORD']['discord_bot_token']
-                        await asyncio.wait_for(bot.login(token), timeout=10)
-                        connect_task = asyncio.create_task(bot.connect())
-
-                        try:
-                            await asyncio.wait_for(bot.wait_until_ready(), timeout=20)
-                            console.print("[green]Discord Bot is ready!")
-                        except asyncio.TimeoutError:
-                            console.print("[bold red]Bot failed to connect within timeout period.")
-                            console.print("[yellow]Continuing without Discord integration...")
-                            if 'connect_task' in locals():
-                                connect_task.cancel()
-                    except discord.LoginFailure:
-                        console.print("[bold red]Discord bot token is invalid. Please check your configuration.")
-                    except discord.ClientException as e:
-                        console.print(f"[bold red]Discord client exception: {e}")
-                    except Exception as e:
-                        console.print(f"[bold red]Unexpected error during Discord bot initialization: {e}")
-
-            if meta['debug']:
-                start_time = time.time()
+                else:
+                    console.print()
+                    console.print("[yellow]Processing uploads to trackers.....")
+                    await process_trackers(meta, config, get_client(), console, api_trackers, tracker_class_map, http_trackers, other_api_trackers)
+                    if use_discord and bot:
+                        from discordbot import send_upload_status_notification
+                        await send_upload_status_notification(config, bot, meta)
+                    if 'queue' in meta and meta.get('queue') is not None:
+                        processed_files_count += 1
+                        if 'limit_queue' in meta and int(meta['limit_queue']) > 0:
+                            console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count} of {meta['limit_queue']} in limit with {total_files} files.")
+                        else:
+                            console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count}/{total_files} files.")
+                        if not meta['debug']:
+                            if log_file:
+                                await save_processed_file(log_file, path)
+                        await asyncio.sleep(0.1)
+                        if sanitize_meta:
+                            try:
+                                await asyncio.sleep(0.2)  # We can't race the status prints
+                                meta = await clean_meta_for_export(meta)
+                            except Exception as e:
+                                console.print(f"[red]Error cleaning meta for export: {e}")
+                        await cleanup()
+                        gc.collect()
+                        reset_terminal()
 
-            console.print(f"[green]Gathering info for {os.path.basename(path)}")
+                finish_job(meta)
 
-            await process_meta(meta, base_dir, bot=bot)
+                if 'limit_queue' in meta and int(meta['limit_queue']) > 0:
+                    if (processed_files_count - skipped_files_count) >= int(meta['limit_queue']):
+                        console.print(f"[red]Uploading limit of {meta['limit_queue']} files reached. Stopping queue processing. {skipped_files_count} skipped files.")
+                        break
 
-            if 'we_are_uploading' not in meta:
-                console.print("we are not uploading.......")
-                if 'queue' in meta and meta.get('queue') is not None:
-                    processed_files_count += 1
-                    skipped_files_count += 1
-                    console.print(f"[cyan]Processed {processed_files_count}/{total_files} files with {skipped_files_count} skipped uploading.")
-                    if not meta['debug']:
-                        if log_file:
-                            await save_processed_file(log_file, path)
+                if meta['debug']:
+                    finish_time = time.time()
+                    console.print(f"Uploads processed in {finish_time - start_time:.4f} seconds")
 
-            else:
-                console.print()
-                console.print("[yellow]Processing uploads to trackers.....")
-                await process_trackers(meta, config, client, console, api_trackers, tracker_class_map, http_trackers, other_api_trackers)
                 if use_discord and bot:
-                    await send_upload_status_notification(config, bot, meta)
-                if 'queue' in meta and meta.get('queue') is not None:
-                    processed_files_count += 1
-                    if 'limit_queue' in meta and int(meta['limit_queue']) > 0:
-                        console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count} of {meta['limit_queue']} in limit with {total_files} files.")
-                    else:
-                        console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count}/{total_files} files.")
-                    if not meta['debug']:
-                        if log_file:
-                            await save_processed_file(log_file, path)
-                    await asyncio.sleep(0.1)
-                    if sanitize_meta:
-                        try:
-                            await asyncio.sleep(0.2)  # We can't race the status prints
-                            meta = await clean_meta_for_export(meta)
-                        except Exception as e:
-                            console.print(f"[red]Error cleaning meta for export: {e}")
-                    await cleanup()
-                    gc.collect()
-                    reset_terminal()
-
-            if 'limit_queue' in meta and int(meta['limit_queue']) > 0:
-                if (processed_files_count - skipped_files_count) >= int(meta['limit_queue']):
-                    console.print(f"[red]Uploading limit of {meta['limit_queue']} files reached. Stopping queue processing. {skipped_files_count} skipped files.")
-                    break
-
-            if meta['debug']:
-                finish_time = time.time()
-                console.print(f"Uploads processed in {finish_time - start_time:.4f} seconds")
-
-            if use_discord and bot:
-                await send_discord_notification(config, bot, f"Finsished uploading: {meta['path']}", debug=meta.get('debug', False), meta=meta)
+                    from discordbot import send_discord_notification
+                    await send_discord_notification(config, bot, f"Finsished uploading: {meta['path']}", debug=meta.get('debug', False), meta=meta)
 
-            if sanitize_meta:
-                try:
-                    await asyncio.sleep(0.3)  # We can't race the status prints
-                    meta = await clean_meta_for_export(meta)
-                except Exception as e:
-                    console.print(f"[red]Error cleaning meta for export: {e}")
+                if sanitize_meta:
+                    try:
+                        await asyncio.sleep(0.3)  # We can't race the status prints
+                        meta = await clean_meta_for_export(meta)
+                    except Exception as e:
+                        console.print(f"[red]Error cleaning meta for export: {e}")
 
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}")
@@ -756,7 +928,7 @@ async def do_the_thing(base_dir):
     finally:
         if bot is not None:
             await bot.close()
-        if 'connect_task' in locals():
+        if connect_task is not None:
             connect_task.cancel()
             try:
                 await connect_task
@@ -784,7 +956,21 @@ def check_python_version():
 
 async def main():
     try:
-        await do_the_thing(base_dir)
+        if any(arg in ('--daemon', '-daemon') for arg in sys.argv[1:]):
+            from src.daemon import run_daemon
+            await update_notification(base_dir)
+            await run_daemon(config, lambda argv: do_the_thing(base_dir, argv))
+        elif any(arg in ('--watch', '-watch') for arg in sys.argv[1:]):
+            from src.watch import run_watch
+            args = [arg for arg in sys.argv[1:] if arg not in ('--watch', '-watch')]
+            await update_notification(base_dir)
+            await run_watch(config, base_dir, lambda path: do_the_thing(base_dir, [path] + args), debug=any(arg in ('--debug', '-debug') for arg in args))
+        elif any(arg in ('--submit', '-submit') for arg in sys.argv[1:]):
+            from src.daemon import submit_job
+            args = [arg for arg in sys.argv[1:] if arg not in ('--submit', '-submit', '--wait', '-wait')]
+            await asyncio.to_thread(submit_job, config, args, any(arg in ('--wait', '-wait') for arg in sys.argv[1:]))
+        else:
+            await do_the_thing(base_dir)
     except asyncio.CancelledError:
         console.print("[red]Tasks were cancelled. Exiting safely.[/red]")
     except KeyboardInterrupt:
@@ -792,6 +978,7 @@ async def main():
     except Exception as e:
         console.print(f"[bold red]Unexpected error: {e}[/bold red]")
     finally:
+        await close_sessions()
         await cleanup()
         reset_terminal()
 